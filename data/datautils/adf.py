@@ -0,0 +1,165 @@
+#%%
+import numpy as np
+from statsmodels.tsa.stattools import adfuller
+from statsmodels.tsa.adfvalues import mackinnonp, mackinnoncrit
+
+#%%
+# Batched Augmented Dickey-Fuller test, numerically equivalent to statsmodels `adfuller`
+# (autolag "AIC" / "BIC" / None) for many equal-length series at once.
+#
+# For one series adfuller
+#   1. fixes the autolag sample (nobs - 1 - maxlag rows) and fits OLS of dx_t on
+#      [trend, x_{t-1}, dx_{t-1}, ..., dx_{t-L}] for L = 0..maxlag, keeping the L with the best IC;
+#   2. refits at the chosen L on its own (longer) sample; the ADF statistic is the t-value of x_{t-1}.
+#
+# Step 1 is a sequence of NESTED regressions, so one QR of the largest design gives all of them:
+# with z = Q'y, SSR(first k columns) = SSR(all) + sum_{i >= k} z_i^2. The designs of all series
+# are stacked and factorized in one batched `np.linalg.qr` call. Step 2 is batched per chosen lag,
+# with x_{t-1} in the LAST column so its t-value is z_last * sign(R_last,last) / sigma.
+#
+# Series the batch cannot reproduce exactly (constant, non-finite, rank-deficient or saturated design) are
+# handed to `adfuller` itself, so results and exceptions are those of the one-series loop.
+
+_NTREND = {"n": 0, "c": 1, "ct": 2, "ctt": 3}
+
+
+def default_maxlag(nobs, regression="c"):
+    """adfuller's default maxlag (Schwert 1989, capped by the sample size)."""
+    ntrend = _NTREND[regression]
+    maxlag = int(np.ceil(12.0 * np.power(nobs / 100.0, 1 / 4.0)))
+    return min(nobs // 2 - ntrend - 1, maxlag)
+
+
+def _trend(nobs, regression):
+    """add_trend columns [const, t, t^2][:ntrend] with t = 1..nobs."""
+    t = np.arange(1, nobs + 1, dtype=float)
+    return np.column_stack([np.ones(nobs), t, t ** 2][: _NTREND[regression]]) if _NTREND[regression] else np.empty((nobs, 0))
+
+
+def _design(X, dX, lag, n_rows, regression, level_last):
+    """
+    Stacked ADF designs (m, n_rows, ntrend + 1 + lag) on the last `n_rows` observations of dX,
+    plus the targets (m, n_rows).
+    """
+    nobs, m = X.shape
+    start = nobs - 1 - n_rows
+    level = X[start: nobs - 1].T
+    lags = [dX[start - l: nobs - 1 - l].T for l in range(1, lag + 1)]
+    trend = np.broadcast_to(_trend(n_rows, regression).T, (m, _NTREND[regression], n_rows))
+
+    stochastic = lags + [level] if level_last else [level] + lags
+    Z = np.concatenate([trend, np.stack(stochastic, axis=1)], axis=1)
+    return np.ascontiguousarray(Z.transpose(0, 2, 1)), np.ascontiguousarray(dX[start:].T)
+
+
+def _qr(Z, y):
+    """Batched QR: (z = Q'y, diag R, SSR of the full design, full-rank flag) per series."""
+    Q, R = np.linalg.qr(Z)
+    z = np.einsum("mnk,mn->mk", Q, y)
+    resid = y - np.einsum("mnk,mk->mn", Q, z)
+    ssr = np.einsum("mn,mn->m", resid, resid)
+    diag = np.abs(np.diagonal(R, axis1=1, axis2=2))
+    tol = diag.max(axis=1, keepdims=True) * max(Z.shape[1:]) * np.finfo(float).eps
+    full_rank = (diag > tol).all(axis=1)
+    return z, np.diagonal(R, axis1=1, axis2=2), ssr, full_rank
+
+
+def adfuller_batch(X, maxlag=None, regression="c", autolag="AIC", errors="raise"):
+    """
+    ADF test on every column of X (nobs, n_series); columns must be NaN-free and equally long.
+
+    Parameters:
+        X (array-like): Series in columns.
+        maxlag, regression, autolag: As in statsmodels `adfuller` (autolag "AIC", "BIC" or None).
+        errors (str): "raise" re-raises adfuller's error for an invalid series; "coerce" returns None for it.
+
+    Returns:
+        list: One adfuller result tuple per column, in adfuller's layout
+              ((adfstat, pvalue, usedlag, nobs, critvalues, icbest), without icbest when autolag is None).
+    """
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    nobs, m = X.shape
+    if regression not in _NTREND:
+        raise ValueError(f"regression must be one of {sorted(_NTREND)}.")
+    method = autolag.lower() if autolag else None
+    if method not in (None, "aic", "bic"):
+        raise ValueError("adfuller_batch supports autolag 'AIC', 'BIC' or None.")
+    if m == 0:
+        return []
+
+    ntrend = _NTREND[regression]
+    if maxlag is None:
+        maxlag = default_maxlag(nobs, regression)
+        if maxlag < 0:
+            raise ValueError("sample size is too short to use selected regression component")
+    elif maxlag > nobs // 2 - ntrend - 1:
+        raise ValueError(
+            "maxlag must be less than (nobs/2 - 1 - ntrend) where n trend is the number of included deterministic regressors"
+        )
+
+    finite = np.isfinite(X).all(axis=0)
+    batch = finite & (X.max(axis=0, initial=-np.inf) != X.min(axis=0, initial=np.inf))
+    Xf = np.where(finite, X, 0.0)
+    dX = np.diff(Xf, axis=0)
+
+    # ---- 1. lag order: nested regressions on the common autolag sample ----
+    if method is not None:
+        n_rows = nobs - 1 - maxlag
+        Z, y = _design(Xf, dX, maxlag, n_rows, regression, level_last=False)
+        z, _, ssr_full, full_rank = _qr(Z, y)
+        batch &= full_rank
+        if n_rows <= Z.shape[2]:
+            # the largest model fits exactly: adfuller's lag choice is driven by rounding noise
+            batch[:] = False
+
+        n_cols = np.arange(ntrend + 1, ntrend + 2 + maxlag)               # columns of models L = 0..maxlag
+        tail = np.cumsum((z ** 2)[:, ::-1], axis=1)[:, ::-1]               # tail[:, k] = sum_{i >= k} z_i^2
+        tail = np.concatenate([tail, np.zeros((m, 1))], axis=1)
+        ssr = ssr_full[:, None] + tail[:, n_cols]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            llf = -n_rows / 2.0 * (np.log(2 * np.pi) + np.log(ssr / n_rows) + 1.0)
+        penalty = 2.0 if method == "aic" else np.log(n_rows)
+        ic = -2.0 * llf + penalty * n_cols[None, :]
+        usedlag = np.argmin(ic, axis=1)                                    # first minimum == smallest lag on ties
+        icbest = ic[np.arange(m), usedlag]
+    else:
+        usedlag = np.full(m, maxlag)
+        icbest = np.full(m, np.nan)
+
+    # ---- 2. ADF regression at the chosen lag, batched per lag ----
+    adfstat = np.full(m, np.nan)
+    for lag in np.unique(usedlag[batch]):
+        cols = np.flatnonzero(batch & (usedlag == lag))
+        n_rows = nobs - 1 - int(lag)
+        Z, y = _design(Xf[:, cols], dX[:, cols], int(lag), n_rows, regression, level_last=True)
+        z, diag, ssr, full_rank = _qr(Z, y)
+        sigma = np.sqrt(ssr / (n_rows - Z.shape[2]))
+        adfstat[cols] = z[:, -1] * np.sign(diag[:, -1]) / sigma
+        batch[cols[~full_rank]] = False
+
+    results = []
+    crit_cache = {}
+    for j in range(m):
+        if not batch[j]:
+            try:
+                res = adfuller(X[:, j], maxlag=maxlag, regression=regression, autolag=autolag)
+            except Exception:
+                if errors == "raise":
+                    raise
+                res = None
+            results.append(res)
+            continue
+
+        used_nobs = nobs - 1 - int(usedlag[j])
+        if used_nobs not in crit_cache:
+            cv = mackinnoncrit(N=1, regression=regression, nobs=used_nobs)
+            crit_cache[used_nobs] = {"1%": cv[0], "5%": cv[1], "10%": cv[2]}
+        stat = float(adfstat[j])
+        pvalue = mackinnonp(stat, regression=regression, N=1)
+        if method is None:
+            results.append((stat, pvalue, int(usedlag[j]), used_nobs, dict(crit_cache[used_nobs])))
+        else:
+            results.append((stat, pvalue, int(usedlag[j]), used_nobs, dict(crit_cache[used_nobs]), float(icbest[j])))
+    return results
@@ -0,0 +1,155 @@
+#%%
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+#%%
+FREQS = ("QE", "ME", "D")
+TAGS = ("freq", "block", "transformation")
+
+
+class MixedFreqPanel(Mapping):
+    """
+    Mixed-frequency panel on ONE aligned float array.
+
+      values     (n_dates, n_series) float64, rows = sorted union of the dates of every series
+      present    (n_dates, n_series) bool, date belongs to the series' own index (a present value may be NaN)
+      columns    series names
+      tags       {"freq" | "block" | "transformation": (n_series,) object array}
+      attrs      stamped on every DataFrame handed out (e.g. {"transformations": "raw, imputed"})
+
+    The panel is a read-only mapping {freq: DataFrame} over `freqs`, so callers written for the
+    former dicts of DataFrames keep working: panel["ME"] holds the monthly columns on the dates any
+    of them has, exactly what the per-frequency `pd.concat` loops built. Frames are materialized on
+    first access and kept.
+
+    Stages derive new panels with `with_columns`: unchanged buffers are shared between stage views,
+    and the value array is copied once, only if the stage actually changes values (copy-on-write).
+    """
+
+    def __init__(self, values, present, index, columns, tags=None, freqs=FREQS, attrs=None):
+        self.values = values
+        self.present = present
+        self.index = pd.DatetimeIndex(index)
+        self.columns = pd.Index(columns)
+        n = len(self.columns)
+        tags = tags or {}
+        self.tags = {key: np.asarray(tags.get(key, [""] * n), dtype=object) for key in TAGS}
+        self.freqs = tuple(freqs)
+        self.attrs = dict(attrs or {})
+        self._frames = {}
+
+    @classmethod
+    def from_frames(cls, frames, freqs=FREQS, attrs=None):
+        """
+        Assemble a panel from [(DataFrame, tags), ...] in one pass: one union of all dates, then one
+        row lookup and one block write per frame. `tags` maps tag name -> scalar or per-column list.
+        """
+        frames = [(df, tags) for df, tags in frames if df is not None and not df.empty]
+        if frames:
+            first = frames[0][0].index
+            index = first.append([df.index for df, _ in frames[1:]]).unique().sort_values()
+        else:
+            index = pd.DatetimeIndex([])
+
+        n_cols = sum(df.shape[1] for df, _ in frames)
+        values = np.full((len(index), n_cols), np.nan)
+        present = np.zeros((len(index), n_cols), dtype=bool)
+        columns = []
+        col_tags = {key: [] for key in TAGS}
+
+        j = 0
+        for df, tags in frames:
+            rows = index.get_indexer(df.index)
+            k = df.shape[1]
+            values[rows, j: j + k] = df.to_numpy(dtype=float)
+            present[rows, j: j + k] = True
+            columns.extend(df.columns)
+            for key in TAGS:
+                tag = tags.get(key, "")
+                col_tags[key].extend(tag if isinstance(tag, (list, tuple, np.ndarray)) else [tag] * k)
+            j += k
+
+        return cls(values, present, index, columns, tags=col_tags, freqs=freqs, attrs=attrs)
+
+    @classmethod
+    def coerce(cls, datasets, freqs=FREQS):
+        """A panel as is; a dict {freq: DataFrame} assembled into one (attrs taken from its frames)."""
+        if isinstance(datasets, cls):
+            return datasets
+        frames, attrs = [], {}
+        for freq, df in (datasets or {}).items():
+            if df is not None and not df.empty:
+                frames.append((df, {"freq": freq}))
+                attrs = attrs or dict(df.attrs)
+        return cls.from_frames(frames, freqs=freqs, attrs=attrs)
+
+    # ---- Stage views ------------------------------------------------------- #
+    def with_columns(self, updates=None, attrs=None, tags=None):
+        """
+        Next stage view of this panel.
+
+        Parameters:
+            updates (dict, optional): {column: pd.Series} new values on (a subset of) the panel's dates.
+                                      The value array is copied once if there are any; otherwise shared.
+            attrs (dict, optional): attrs of the new view (default: this panel's).
+            tags (dict, optional): {tag: {column: value}} tag changes.
+
+        Returns:
+            MixedFreqPanel: New panel; this one is left untouched.
+        """
+        values = self.values
+        if updates:
+            values = self.values.copy()
+            for column, s in updates.items():
+                values[self.index.get_indexer(s.index), self.columns.get_loc(column)] = s.to_numpy(dtype=float)
+
+        new_tags = self.tags
+        if tags:
+            new_tags = {key: arr.copy() if key in tags else arr for key, arr in self.tags.items()}
+            for key, changes in tags.items():
+                for column, value in changes.items():
+                    new_tags[key][self.columns.get_loc(column)] = value
+
+        return type(self)(
+            values, self.present, self.index, self.columns, tags=new_tags, freqs=self.freqs,
+            attrs=self.attrs if attrs is None else attrs,
+        )
+
+    # ---- DataFrame accessors ------------------------------------------------ #
+    def columns_of(self, freq):
+        return self.columns[self.tags["freq"] == freq]
+
+    def to_frame(self, columns=None):
+        """DataFrame of `columns` (default: all) on the dates any of them has."""
+        cols = np.arange(len(self.columns)) if columns is None else self.columns.get_indexer(pd.Index(columns))
+        if not len(cols):
+            df = pd.DataFrame()
+        else:
+            rows = np.flatnonzero(self.present[:, cols].any(axis=1))
+            df = pd.DataFrame(self.values[np.ix_(rows, cols)], index=self.index[rows], columns=self.columns[cols])
+        df.attrs = dict(self.attrs)
+        return df
+
+    def __getitem__(self, freq):
+        if freq not in self.freqs:
+            raise KeyError(freq)
+        if freq not in self._frames:
+            self._frames[freq] = self.to_frame(self.columns_of(freq))
+        return self._frames[freq]
+
+    def __iter__(self):
+        return iter(self.freqs)
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_frames"] = {}  # materialized frames are rebuilt on access
+        return state
+
+    def __repr__(self):
+        counts = ", ".join(f"{freq}: {int((self.tags['freq'] == freq).sum())}" for freq in self.freqs)
+        return f"MixedFreqPanel({len(self.index)} dates x {len(self.columns)} series; {counts}; attrs={self.attrs})"
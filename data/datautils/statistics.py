@@ -2,6 +2,7 @@
 
 #%%
 import warnings
+import hashlib
 from statsmodels.tsa.stattools import adfuller, kpss
 import pandas as pd
 import numpy as np
@@ -15,6 +16,8 @@ import statsmodels.api as sm
 from statsmodels.stats.diagnostic import het_white
 from statsmodels.tsa.stattools import acf
 
+from data.datautils.adf import adfuller_batch
+
 #%%
 
 def _check_convert_y(y): # [ ]: Put this into utils.checks.py
@@ -25,6 +28,8 @@ def _check_convert_y(y): # [ ]: Put this into utils.checks.py
     assert y.ndim==1
     return y
 
+_ADF_Test = namedtuple("ADF_Test", ["stationary", "results"])
+
 def _check_stationary_adfuller(y, confidence, **kwargs):
 
     y = _check_convert_y(y)
@@ -58,5 +63,103 @@ class Statistics:
         adf_result = Statistics.check_unit_root(s, confidence)
         return adf_result.stationary
 
+    @staticmethod
+    def stationarity_key(series, confidence=None):
+        """
+        Cache key of an ADF verdict: series name, sample window (first/last date, n obs),
+        a digest of the observations and the confidence level.
+        """
+        values = np.asarray(series, dtype=float)
+        observed = ~np.isnan(values)
+        index = series.index[observed]
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(values[observed]).tobytes())
+        index_values = index.asi8 if isinstance(index, pd.DatetimeIndex) else pd.util.hash_pandas_object(index, index=False).to_numpy()
+        digest.update(np.ascontiguousarray(index_values).tobytes())
+        first, last = (index[0], index[-1]) if len(index) else (None, None)
+        return (str(series.name), first, last, len(index), digest.hexdigest(), confidence)
+
+    @staticmethod
+    def check_unit_root_batch(series_list, confidence, adf_params=None, errors="raise"):
+        """
+        `check_unit_root` for many series at once (batched ADF, see data/datautils/adf.py).
+
+        Parameters:
+            series_list (list): pd.Series / 1-d arrays; NaNs are dropped per series.
+            confidence (float): Confidence level for ADF test.
+            adf_params (dict, optional): adfuller arguments (maxlag, autolag); regression is "c".
+            errors (str): "raise" as the one-series test, "coerce" returns None for a series the test rejects.
+
+        Returns:
+            list: ADF_Test(stationary, results) per series, in input order.
+        """
+        adf_params = dict(adf_params or {})
+        adf_params["regression"] = "c"
+
+        values = [np.asarray(y, dtype=float) for y in series_list]
+        values = [v[~np.isnan(v)] for v in values]
+        out = [None] * len(values)
+        by_length = {}
+        for i, v in enumerate(values):
+            by_length.setdefault(len(v), []).append(i)
+
+        # equal-length series share one batched call
+        for length, members in by_length.items():
+            try:
+                results = adfuller_batch(np.column_stack([values[i] for i in members]) if length else np.empty((0, len(members))),
+                                         errors=errors, **adf_params)
+            except Exception:
+                if errors == "raise":
+                    raise
+                continue
+            for i, result in zip(members, results):
+                if result is not None:
+                    out[i] = _ADF_Test(result[1] <= confidence, result)
+        return out
+
+    @staticmethod
+    def check_stationarity_many(series_list, confidence=None, cache=None, errors="raise"):
+        """
+        `check_stationarity_s` for a list of series, in one batched ADF call.
+
+        Parameters:
+            series_list (list): pd.Series; NaNs are dropped per series.
+            confidence (float, optional): Confidence level for ADF test.
+            cache (dict, optional): Verdict cache ({stationarity_key: bool}), read and updated in place.
+                The same series over the same sample window is only tested once.
+            errors (str): "raise" as `check_stationarity_s`, "coerce" gives None for a series the test rejects.
+
+        Returns:
+            list: True / False (None when coerced) per series, in input order.
+        """
+        keys = [Statistics.stationarity_key(s, confidence) for s in series_list] if cache is not None else None
+        verdicts = [cache.get(k) for k in keys] if cache is not None else [None] * len(series_list)
+
+        todo = [i for i, v in enumerate(verdicts) if v is None]
+        results = Statistics.check_unit_root_batch([series_list[i] for i in todo], confidence, errors=errors)
+        for i, result in zip(todo, results):
+            if result is None:
+                continue
+            verdicts[i] = bool(result.stationary)
+            if cache is not None:
+                cache[keys[i]] = verdicts[i]
+        return verdicts
+
+    @staticmethod
+    def check_stationarity_batch(df, confidence=None, cache=None):
+        """
+        Check every column of a DataFrame for stationarity (same test as `check_stationarity_s`).
+
+        Parameters:
+            df (pd.DataFrame): One column per series; NaNs are dropped per column.
+            confidence (float, optional): Confidence level for ADF test.
+            cache (dict, optional): Verdict cache, see `check_stationarity_many`.
+
+        Returns:
+            dict: {column: True if stationary}, in column order.
+        """
+        verdicts = Statistics.check_stationarity_many([df.iloc[:, j] for j in range(df.shape[1])], confidence, cache=cache)
+        return dict(zip(df.columns, verdicts))
+
 
 # %%
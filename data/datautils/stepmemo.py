@@ -0,0 +1,153 @@
+#%%
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from data.datautils.panel import MixedFreqPanel
+
+#%%
+# Bump whenever a step's outputs change for the same inputs, to orphan old entries.
+STEP_MEMO_VERSION = 2
+
+# values a step replaces rather than mutates; compared by identity in `state_delta`
+_BY_IDENTITY = (pd.DataFrame, pd.Series, pd.Index, np.ndarray, MixedFreqPanel)
+
+
+def step_key(step, params, parent_keys=()):
+    """
+    Fingerprint of one pipeline step: its name, its own parameters and the keys of the steps it
+    consumes. A parameter change therefore changes the key of that step and of every step downstream.
+    """
+    h = hashlib.sha256(f"{step}-v{STEP_MEMO_VERSION}".encode("utf-8"))
+    for key in parent_keys:
+        h.update(f"<{key}>".encode("utf-8"))
+    for name in sorted(params):
+        h.update(f"{name}={params[name]!r}|".encode("utf-8"))
+    return h.hexdigest()
+
+
+class _Same:
+    """Fingerprint leaf equal only to a leaf of the very same object (holding it keeps its id unique)."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Same) and other.obj is self.obj
+
+
+def _fingerprint(value, seen):
+    """
+    Structural fingerprint of a value: containers and plain objects (e.g. the meta dataclasses,
+    which steps update in place) are walked; frames, arrays and panels count by identity, since
+    steps build new ones instead of writing into existing ones (see MixedFreqPanel.with_columns).
+    """
+    if isinstance(value, _BY_IDENTITY):
+        return _Same(value)
+    if isinstance(value, (str, bytes, int, float, complex, type(None), pd.Timestamp, pd.Timedelta)):
+        return (type(value).__name__, repr(value))
+    if id(value) in seen:
+        return _Same(value)
+    seen.add(id(value))
+    if isinstance(value, dict):
+        return ("dict", tuple((repr(key), _fingerprint(item, seen)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return (type(value).__name__, tuple(_fingerprint(item, seen) for item in value))
+    if hasattr(value, "__dict__"):
+        return (type(value).__qualname__, _fingerprint(vars(value), seen))
+    return (type(value).__qualname__, repr(value))
+
+
+def state_fingerprints(state):
+    """{name: fingerprint} for a flat {name: value} state (see `_fingerprint`); nothing is pickled."""
+    return {name: _fingerprint(value, set()) for name, value in state.items()}
+
+
+def state_delta(state, fingerprints):
+    """
+    The part of `state` that differs from the state `fingerprints` was taken of, and the
+    fingerprints of `state`. Only this delta is ever pickled.
+
+    Values aliased by a changed entry (same object under another name) travel with it, so one
+    pickle of the delta restores them as one object again.
+    """
+    new = state_fingerprints(state)
+    changed = {name for name in state if new[name] != fingerprints.get(name)}
+    ids = {id(state[name]) for name in changed if state[name] is not None}
+    changed |= {name for name, value in state.items() if value is not None and id(value) in ids}
+    return {name: state[name] for name in state if name in changed}, new
+
+
+class StepMemo:
+    """
+    On-disk memo of pipeline step deltas: {memo_dir}/{step}/{key}.pkl.
+
+    Keys are fingerprints (see `step_key`), so entries never go stale. A hit refreshes the entry's
+    mtime; each step keeps its `max_entries` most recently used entries, and the memo as a whole is
+    trimmed least-recently-used to `max_gb` (None = unbounded).
+    """
+
+    def __init__(self, memo_dir, max_entries=8, max_gb=None):
+        self.memo_dir = Path(memo_dir)
+        self.max_entries = max_entries
+        self.max_gb = max_gb
+
+    def _path(self, step, key):
+        return self.memo_dir / step / f"{key}.pkl"
+
+    def get(self, step, key):
+        path = self._path(step, key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Unreadable step memo entry {step}/{path.stem[:12]} ({e}); recomputing.")
+            return None
+        os.utime(path)
+        return snapshot
+
+    def put(self, step, key, snapshot):
+        path = self._path(step, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._evict(step, keep=path)
+
+    def _evict(self, step, keep=None):
+        if self.max_entries:
+            entries = sorted(self._path(step, "x").parent.glob("*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for path in entries[self.max_entries:]:
+                path.unlink(missing_ok=True)
+        if self.max_gb is None:
+            return
+
+        entries = []
+        for path in self.memo_dir.glob("*/*.pkl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        limit = float(self.max_gb) * 1024 ** 3
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted step memo entry {path.parent.name}/{path.stem[:12]} (LRU, limit {self.max_gb} GB).")
@@ -21,8 +21,90 @@ TRANSFORMATIONS = [
     'cca',  # Continuously compounded annual change: (1/1) * ln(x_t / x_{t-12})
 ]
 
+# Lag of the annual transformations (ch1, pc1, cca) by frequency
+ANNUAL_LAGS = {"QE": 4, "ME": 12}
+
+
+def _shift_rows(x, lag):
+    """x shifted down by `lag` rows (NaN on top), as pd.Series.shift for every column."""
+    shifted = np.full(x.shape, np.nan)
+    if lag < len(x):
+        shifted[lag:] = x[: len(x) - lag]
+    return shifted
+
+
+def _transform_rows(x, transformation, annual_lag, shifted=None):
+    """One transformation of every column of x (dates x series), operation by operation as unit_q / unit_m."""
+    if transformation not in TRANSFORMATIONS:
+        raise ValueError(f"{transformation}: Unknown transformation type.")
+    shifted = shifted if shifted is not None else {}
+    lag = annual_lag if transformation in ("ch1", "pc1", "cca") else 1
+    if transformation not in ("lin", "log") and lag not in shifted:
+        shifted[lag] = _shift_rows(x, lag)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if transformation == 'lin':
+            return x.copy()
+        elif transformation in ('chg', 'ch1'):
+            return x - shifted[lag]
+        elif transformation in ('pch', 'pc1'):
+            return (x / shifted[lag] - 1) * 100
+        elif transformation == 'log':
+            return np.log(x)
+        else:  # 'cch', 'cca'
+            return np.log(x / shifted[lag])
+
+
 class Transform: 
 
+    @staticmethod
+    def unit_panel(panel, transformations, freq="QE"):
+        """
+        `unit_q` / `unit_m` for every column of a panel at once: column j gets transformations[j].
+        Columns are grouped by transformation and each group is transformed by one NumPy operation.
+
+        Parameters:
+            panel (pd.DataFrame or np.ndarray): Series in columns (dates x series).
+            transformations (sequence): Transformation code per column (see TRANSFORMATIONS).
+            freq (str): "QE" (annual lag 4) or "ME" (annual lag 12).
+
+        Returns:
+            Same type as panel: transformed columns on the panel's dates, NaN where the per-series
+            result has no value, i.e. column j with NaNs dropped is unit_q(column j, transformations[j]).
+        """
+        x = np.asarray(panel, dtype=float)
+        codes = np.asarray(transformations, dtype=object)
+        if codes.shape != (x.shape[1],):
+            raise ValueError(f"Expected {x.shape[1]} transformation codes, got {codes.shape}.")
+
+        out = np.empty(x.shape)
+        for transformation in dict.fromkeys(codes):
+            cols = np.flatnonzero(codes == transformation)
+            out[:, cols] = _transform_rows(x[:, cols], transformation, ANNUAL_LAGS[freq])
+
+        if isinstance(panel, pd.DataFrame):
+            return pd.DataFrame(out, index=panel.index, columns=panel.columns)
+        return out
+
+    @staticmethod
+    def unit_candidates(panel, freq="QE", transformations=TRANSFORMATIONS):
+        """
+        Every candidate transformation of every column in one pass, for bulk stationarity testing.
+
+        Parameters:
+            panel (pd.DataFrame or np.ndarray): Series in columns (dates x series).
+            freq (str): "QE" (annual lag 4) or "ME" (annual lag 12).
+            transformations (sequence): Candidates, by default all TRANSFORMATIONS.
+
+        Returns:
+            np.ndarray: (len(transformations), dates, series); slice [i] is
+                        unit_panel(panel, [transformations[i]] * series, freq).
+        """
+        x = np.asarray(panel, dtype=float)
+        shifted = {}  # the lagged panels are shared by all candidates
+        return np.stack([_transform_rows(x, t, ANNUAL_LAGS[freq], shifted) for t in transformations])
+
+
     @staticmethod  
     def unit_q(series, transformation):
         """
@@ -270,6 +352,43 @@ class Transform:
                 "'level_stock', 'level_flow', 'cumulative_stock'. It cannot be 'growth_flow' for daily frequency series."
             )
 
+    @staticmethod
+    def freq_d_to_m_df(df, stock_flows):
+        """
+        Aggregates every column of a daily DataFrame to monthly, one resample per 'stock_flow' group.
+        Column by column identical to `freq_d_to_m`.
+
+        Parameters:
+        - df (pd.DataFrame): Daily series in columns, with a DatetimeIndex.
+        - stock_flows (dict): {column: stock_flow}, see `freq_d_to_m`.
+
+        Returns:
+        - pd.DataFrame: Monthly aggregated series, columns in the order of df.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("Input must be a Pandas DataFrame.")
+
+        aggregations = {"level_stock": "last", "level_flow": "mean", "cumulative_stock": "sum"}
+        groups = {}
+        for column in df.columns:
+            stock_flow = stock_flows[column]
+            if stock_flow not in aggregations:
+                raise ValueError(
+                    f"Invalid 'stock_flow' value: {stock_flow} for '{column}'. Must be one of "
+                    "'level_stock', 'level_flow', 'cumulative_stock'. It cannot be 'growth_flow' for daily frequency series."
+                )
+            groups.setdefault(stock_flow, []).append(column)
+
+        resampler = df.resample("ME")
+        monthly = pd.concat(
+            [getattr(resampler[columns], aggregations[stock_flow])() for stock_flow, columns in groups.items()], axis=1
+        )
+        logger.info(
+            f"Converted {df.shape[1]} daily series to monthly frequency "
+            f"({', '.join(f'{len(c)} {aggregations[sf]}' for sf, c in groups.items())})."
+        )
+        return monthly[df.columns]
+
     @staticmethod
     def freq_q_to_m(series, stock_flow):
 
@@ -337,6 +456,67 @@ class Transform:
 
         else:
             raise ValueError("freq must be 'ME' (monthly) or 'QE' (quarterly)")
+
+    @staticmethod
+    def skip_sampling_df_to_q(df, freq):
+        """
+        `skip_sampling_to_q` for every column of a DataFrame at once; returns the column-wise
+        concatenation of its per-series results.
+
+        Monthly data is laid on a full-quarter month grid (partial quarters at either edge padded with NaN)
+        and reshaped (quarters x 3 x series): block p of series j is grid[:, p, j]. As in the per-series
+        pivot, a quarter is kept if any month in it is observed, and a block column that is never
+        observed is dropped. Frames with several rows in one month fall back to the per-series path.
+
+        Parameters:
+            df (pd.DataFrame): Series in columns, with a DatetimeIndex.
+            freq (str): "ME" for monthly, "QE" for quarterly.
+
+        Returns:
+            pd.DataFrame: Indexed by quarter end ('qdate'); columns {series}_m1.._m3 per monthly series.
+        """
+        if not isinstance(df, pd.DataFrame):
+            raise ValueError("Input must be a Pandas DataFrame.")
+
+        df = df.sort_index()
+
+        if freq == "QE":
+            qdate = pd.PeriodIndex(df.index.to_period('Q'), name='qdate')
+            blocked_df = df.groupby(qdate).first()
+            blocked_df.index = blocked_df.index.to_timestamp(how='end').normalize()
+            logger.info(f"{df.shape[1]} series are already at quarterly frequency. Added to blocked DataFrame as is.")
+            return blocked_df
+
+        if freq != "ME":
+            raise ValueError("freq must be 'ME' (monthly) or 'QE' (quarterly)")
+
+        months = np.asarray((df.index.year - 1970) * 12 + df.index.month - 1, dtype=np.int64)  # monthly period ordinals
+        if df.empty or np.unique(months).size < months.size:
+            blocked = [Transform.skip_sampling_to_q(df[series], freq) for series in df.columns]
+            return pd.concat(blocked, axis=1) if blocked else pd.DataFrame()
+
+        # Month grid from the first month of the first quarter to the last month of the last quarter
+        first_q, last_q = months.min() // 3, months.max() // 3
+        n_q, n_series = last_q - first_q + 1, df.shape[1]
+        grid = np.full((n_q * 3, n_series), np.nan)
+        grid[months - first_q * 3] = df.to_numpy(dtype=float)
+        grid = grid.reshape(n_q, 3, n_series)
+
+        observed = ~np.isnan(grid)
+        rows = np.flatnonzero(observed.any(axis=(1, 2)))
+        keep = observed.any(axis=0)                                        # (3, n_series) block ever observed
+        series_idx, block_idx = np.nonzero(keep.T)                         # series-major, blocks m1..m3
+
+        blocked_df = pd.DataFrame(
+            grid[rows][:, block_idx, series_idx],
+            index=pd.PeriodIndex.from_ordinals(first_q + rows, freq='Q').to_timestamp(how='end').normalize(),
+            columns=[f"{df.columns[j]}_m{p + 1}" for j, p in zip(series_idx, block_idx)],
+        )
+        blocked_df.index.name = 'qdate'
+
+        logger.info(f"Converted {n_series} monthly series to quarterly frequency with monthly blocks ({n_q} quarters).")
+
+        return blocked_df
     
                    
 
@@ -1,6 +1,7 @@
 import pandas as pd
 from loguru import logger
 from data.datautils.transform import Transform
+from data.datautils.panel import MixedFreqPanel
 
 class BlockingMixin:
     def to_mq_freq_dfs(self, datasets=None):
@@ -11,17 +12,13 @@ class BlockingMixin:
         monthly and quarterly series unchanged.
 
         Parameters:
-            datasets (dict, optional): {'QE': df, 'ME': df, 'D': df}.
-                Defaults to: self.im_df_q, self.im_df_m, self.im_df_d.
+            datasets (MixedFreqPanel or dict, optional): Imputed panel, or {'QE': df, 'ME': df, 'D': df}.
 
         Returns:
-            dict: Dictionary with 'QE' and 'ME' keys containing harmonized series.
+            MixedFreqPanel: Panel with 'QE' and 'ME' keys containing harmonized series.
         """
 
-        mq_freq_dfs = {
-            "QE": pd.DataFrame(),
-            "ME": pd.DataFrame()
-        }
+        frames = []
 
         for freq_key, df in datasets.items():
             if df is None or df.empty:
@@ -29,24 +26,16 @@ class BlockingMixin:
                 continue
 
             self._validate_df(df, "raw, imputed", "transformations")
-            prepared_df = {}
 
-            for series in df.columns:
-                s = df[series]
-                if freq_key == "D":
-                    stock_flow = self.meta[series].stock_flow
-                    s = Transform.freq_d_to_m(s, stock_flow)
-                    prepared_df[series] = s
-                elif freq_key == "ME":
-                    prepared_df[series] = s
-                elif freq_key == "QE":
-                    mq_freq_dfs["QE"][series] = s  # assign directly since quarterly is untouched
+            if freq_key == "D":
+                stock_flows = {series: self.meta[series].stock_flow for series in df.columns}
+                frames.append((Transform.freq_d_to_m_df(df, stock_flows), {"freq": "ME"}))
+            elif freq_key in ["ME", "QE"]:
+                frames.append((df, {"freq": freq_key}))  # untouched
 
-            if freq_key in ["D", "ME"]:
-                mq_freq_dfs["ME"] = pd.concat([mq_freq_dfs["ME"], pd.DataFrame(prepared_df)], axis=1)
-
-        for freq, df in mq_freq_dfs.items():
-            df.attrs["transformations"] = "raw, imputed, mq_freq"
+        mq_freq_dfs = MixedFreqPanel.from_frames(
+            frames, freqs=("QE", "ME"), attrs={"transformations": "raw, imputed, mq_freq"}
+        )
 
         self.mq_freq_df_q = mq_freq_dfs["QE"]
         self.mq_freq_df_m = mq_freq_dfs["ME"]
@@ -57,9 +46,12 @@ class BlockingMixin:
     def to_blocked_df(self, datasets=None):
         """
         Convert monthly & quarterly data into a blocked format for mixed-frequency models.
+
+        The blocked panel (tagged by block 'm1'/'m2'/'m3', '' for quarterly series) is kept in
+        self.blocked_panel; its DataFrame is returned.
         """
 
-        blocked_dfs = []
+        frames = []
 
         for freq_key, df in datasets.items():
             if df is None or df.empty:
@@ -68,14 +60,15 @@ class BlockingMixin:
 
             self._validate_df(df, "raw, imputed, mq_freq", "transformations")
 
-            for series in df.columns:
-                s = df[series]
-                blocked = Transform.skip_sampling_to_q(s, freq_key)
-                blocked_dfs.append(blocked)
-
-        blocked_df = pd.concat(blocked_dfs, axis=1) if blocked_dfs else pd.DataFrame()
+            # All series of a frequency in one pass: monthly ones become their _m1/_m2/_m3 blocks
+            blocked = Transform.skip_sampling_df_to_q(df, freq_key)
+            blocks = [str(c)[-2:] for c in blocked.columns] if freq_key == "ME" else ""
+            frames.append((blocked, {"freq": "QE", "block": blocks}))
 
-        blocked_df.attrs["transformations"] = "raw, imputed, mq_freq, blocked"
+        self.blocked_panel = MixedFreqPanel.from_frames(
+            frames, freqs=("QE",), attrs={"transformations": "raw, imputed, mq_freq, blocked"}
+        )
+        blocked_df = self.blocked_panel.to_frame()
 
         self.blocked_df = blocked_df
 
@@ -96,10 +89,7 @@ class BlockingMixin:
 
             self._validate_df(df, "raw, imputed, mq_freq, stationary", "transformations")
 
-            for series in df.columns:
-                s = df[series]
-                blocked = Transform.skip_sampling_to_q(s, freq_key)
-                blocked_dfs.append(blocked)
+            blocked_dfs.append(Transform.skip_sampling_df_to_q(df, freq_key))
 
         blocked_df = pd.concat(blocked_dfs, axis=1) if blocked_dfs else pd.DataFrame()
 
@@ -2,6 +2,7 @@ import pandas as pd
 from loguru import logger
 from utils.checks import *
 from data.datautils.missings import MissingDataHandler
+from data.datautils.panel import MixedFreqPanel
 
 class ImputationMixin:
     def to_imp_dfs(self, datasets=None, impute=True, impute_method='linear'):
@@ -9,39 +10,42 @@ class ImputationMixin:
         Impute missing values for all series in the provided datasets, grouped by frequency.
 
         Parameters:
-            datasets (dict, optional): {'QE': df, 'ME': df, 'D': df}
+            datasets (MixedFreqPanel or dict, optional): Raw panel, or {'QE': df, 'ME': df, 'D': df}.
             impute (bool): Whether to impute missing values.
             impute_method (str): Method used for imputation (default = 'linear').
 
         Returns:
-            dict: Dictionary of imputed DataFrames.
+            MixedFreqPanel: Imputed panel. Shares the raw panel's values unless a series was imputed.
         """
 
-        imp_dfs = {
-            "QE": pd.DataFrame(), 
-            "ME": pd.DataFrame(), 
-            "D": pd.DataFrame()
-        }
+        panel = MixedFreqPanel.coerce(datasets)
+        updates = {}
 
-        for freq_key, df in datasets.items():
+        for freq_key, df in panel.items():
             if df is None or df.empty:
                 logger.warning(f"{self.name}: No dataset with {freq_key} Frequency provided for component {self.name}")
                 continue
 
             self._validate_df(df, "raw", "transformations")
-            imp_df = {}
-
-            for series in df.columns:
-                s = df[series]
-                if impute:
-                    s, imputed = self._impute_inner_missing(s, impute_method)
-                    imp_df[series] = s
-                    self.meta[series].imputed = imputed
-
-            imp_dfs[freq_key] = pd.DataFrame(imp_df)
+            if not impute:
+                continue
 
-        for freq, df in imp_dfs.items():
-            df.attrs["transformations"] = "raw, imputed"
+            # Only series with a gap between their first and last observation need interpolation
+            observed = df.notna().to_numpy()
+            n_obs = observed.sum(axis=0)
+            first = observed.argmax(axis=0)
+            last = len(df) - 1 - observed[::-1].argmax(axis=0)
+            has_gap = (n_obs > 0) & (n_obs < last - first + 1)
+
+            for series, gap in zip(df.columns, has_gap):
+                imputed = False
+                if gap:
+                    s, imputed = self._impute_inner_missing(df[series], impute_method)
+                    if imputed:
+                        updates[series] = s
+                self.meta[series].imputed = imputed
+
+        imp_dfs = panel.with_columns(updates, attrs={"transformations": "raw, imputed"})
 
         self.imp_df_q = imp_dfs["QE"]
         self.imp_df_m = imp_dfs["ME"]
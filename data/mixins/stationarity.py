@@ -1,16 +1,38 @@
+import copy
+import numpy as np
 import pandas as pd
 from loguru import logger
+from joblib import Parallel, delayed, effective_n_jobs
 from data.datautils.statistics import Statistics
 from data.datautils.transform import Transform, TRANSFORMATIONS
 from utils.checks import Checks
 import re
 
+# Fewer series than this are searched serially even with n_jobs != 1: one series takes a few ms,
+# starting the worker pool (and its imports) takes seconds.
+PARALLEL_MIN_SERIES = 250
+
+
+def _stationarize_chunk(items, metas, name, transform_all, confidence, start_date=None, end_date=None):
+    """
+    Worker: transformation search for [(series, s), ...] on private copies of their meta.
+    Module-level so it can be shipped to worker processes. Series sharing a meta entry are in
+    the same chunk and run in column order, so m1 presets propagate as in the serial loop.
+    Returns [(series, transformed, stationary, used_trans, error)]; the parent writes the real meta.
+    """
+    runner = StationarityMixin()
+    runner.name = name
+    runner.meta = metas
+    # a failing meta write is raised again (and reported) when the parent writes the real meta
+    return runner._stationarize_items(items, transform_all, confidence, start_date, end_date, meta_errors="ignore")
+
+
 class StationarityMixin:
     """
     Mixin class for checking and transforming quarterly time series data to ensure stationarity.
     """
 
-    def to_stat_df(self, dataset=None, transform_all=False, confidence=None, start_date=None, end_date=None):
+    def to_stat_df(self, dataset=None, transform_all=False, confidence=None, start_date=None, end_date=None, n_jobs=1):
         """
         Transform quarterly time series data to ensure stationarity.
 
@@ -19,6 +41,9 @@ class StationarityMixin:
                                          Defaults to self.prep_freq_stat_df_q.
             transform_all (bool): Whether to apply a default transformation to all series.
             confidence (float, optional): Confidence level for stationarity test.
+            n_jobs (int): Worker processes for the transformation search (1 = serial, -1 = all cores).
+                          Used from PARALLEL_MIN_SERIES series on; workers return (transformed series,
+                          verdict, transformation) and meta is updated here.
 
         Returns:
             pd.DataFrame: Transformed (stationary) quarterly DataFrame.
@@ -31,6 +56,7 @@ class StationarityMixin:
         self._validate_df(dataset, expected_value="raw, imputed, mq_freq, blocked", attr_key="transformations")
         processed = {}
 
+        items = []
         for series in dataset.columns:
             s = dataset[series]
             series_meta_name = Checks.get_series_meta_name(series)
@@ -42,9 +68,22 @@ class StationarityMixin:
             if s.empty or s.isna().all():
                 logger.warning(f"{self.name}: Series '{series}' is empty or NaN. Skipping.")
                 continue
+            items.append((series, s))
+
+        n_workers = 1 if n_jobs in (None, 0, 1) else effective_n_jobs(n_jobs)
+        parallel = n_workers > 1 and len(items) >= PARALLEL_MIN_SERIES
+        if parallel:
+            # workers search on copies of the meta; the real meta is written below
+            results = self._stationarize_parallel(items, transform_all, confidence, start_date, end_date, n_jobs)
+        else:
+            results = self._stationarize_items(items, transform_all, confidence, start_date, end_date)
 
+        for series, transformed, stationary, used_trans, error in results:
             try:
-                transformed = self._make_series_stationary(s, series, meta, confidence, transform_all, start_date=start_date, end_date=end_date)
+                if error is not None:
+                    raise RuntimeError(error)
+                if parallel:
+                    self._write_stationarity_meta(self.meta.get(Checks.get_series_meta_name(series)), series, stationary, used_trans)
                 processed[series] = transformed
             except Exception as e:
                 logger.error(f"{self.name}: Failed to process '{series}': {e}")
@@ -57,6 +96,34 @@ class StationarityMixin:
 
         return stat_df
 
+    def _stationarize_parallel(self, items, transform_all, confidence, start_date, end_date, n_jobs):
+        """
+        Transformation search over worker processes. Items are grouped by meta entry (the m1 block's
+        result is the preset of m2/m3), groups are packed into one chunk per worker; results come back
+        in item order.
+        """
+        groups = {}
+        for item in items:
+            groups.setdefault(Checks.get_series_meta_name(item[0]), []).append(item)
+
+        n_workers = effective_n_jobs(n_jobs)
+        n_chunks = max(1, min(len(groups), n_workers))
+        chunks = [[] for _ in range(n_chunks)]
+        for i, group in enumerate(groups.values()):
+            chunks[i * n_chunks // len(groups)].extend(group)
+        logger.info(f"{self.name}: Stationarity search for {len(items)} series in {n_chunks} chunks on {n_workers} workers.")
+
+        chunk_results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_stationarize_chunk)(
+                chunk,
+                {name: copy.deepcopy(self.meta[name]) for name in {Checks.get_series_meta_name(series) for series, _ in chunk}},
+                self.name, transform_all, confidence, start_date, end_date,
+            )
+            for chunk in chunks if chunk
+        )
+        by_series = {result[0]: result for chunk_result in chunk_results for result in chunk_result}
+        return [by_series[series] for series, _ in items]
+
     def _make_series_stationary(self, s, series, meta, confidence, transform_all, start_date=None, end_date=None):
         """
         Transform a single series to achieve stationarity.
@@ -64,42 +131,135 @@ class StationarityMixin:
         Returns:
             pd.Series: Transformed series.
         """
-        # decide sample window for testing
-        s_check = s.loc[start_date:end_date] if (start_date is not None or end_date is not None) else s
-        s_stat_df = s  # full series to return transformed
+        transformation = self._series_transformation(meta, series, transform_all)
+        transformed_stat_df, stationary, used_trans = self._stationarize_series(
+            s, series, transformation, confidence, start_date=start_date, end_date=end_date
+        )
+        self._write_stationarity_meta(meta, series, stationary, used_trans)
+        return transformed_stat_df
+
+    def _series_transformation(self, meta, series, transform_all):
+        """`_preset_transformation` for one series, logging when the m1 preset is used."""
+        transformation = self._preset_transformation(meta, transform_all)
+        if transformation and not getattr(meta, "transformation", None) and meta.freq in {"ME", "D"} and getattr(meta, "transformation_m1", None):
+            logger.info(f"{self.name}: Using m1 preset transformation '{transformation}' for monthly/daily series '{series}'.")
+        return transformation
+
+    def _stationarize_items(self, items, transform_all, confidence, start_date=None, end_date=None, meta_errors="raise"):
+        """
+        Transformation search for [(series, s), ...] in column order, writing each verdict to meta as it
+        goes (an m1 result is the preset of m2/m3), then every chosen transformation applied to the full
+        series in one `Transform.unit_panel` pass.
+
+        Parameters:
+            meta_errors (str): "raise" reports a failing meta write as the series' error; "ignore" skips it.
+
+        Returns:
+            list: (series, transformed, stationary, used_trans, error) per item; error is None on success.
+        """
+        # every ADF test the loop below will ask for, in one batched call
+        self._prefill_stationarity(items, transform_all, confidence, start_date=start_date, end_date=end_date)
+
+        searched = []
+        for series, s in items:
+            meta = self.meta.get(Checks.get_series_meta_name(series))
+            try:
+                transformation = self._series_transformation(meta, series, transform_all)
+                stationary, used_trans = self._search_transformation(
+                    self._sample_window(s, start_date, end_date), series, transformation, confidence
+                )
+            except Exception as e:
+                searched.append((series, s, None, None, str(e)))
+                continue
+            try:
+                self._write_stationarity_meta(meta, series, stationary, used_trans)
+            except Exception as e:
+                if meta_errors == "raise":
+                    searched.append((series, s, None, None, str(e)))
+                    continue
+            searched.append((series, s, stationary, used_trans, None))
+        self.__dict__.pop("_stat_candidates", None)
+        self.__dict__.pop("_window_slice", None)
+
+        transformed = self._apply_transformations([(series, s, used) for series, s, _, used, error in searched if error is None])
+        return [(series, transformed.get(series), stationary, used, error) for series, _, stationary, used, error in searched]
+
+    def _stationarize_series(self, s, series, transformation, confidence, start_date=None, end_date=None):
+        """
+        Stationarity test + transformation search for a single series; touches no meta.
+
+        Returns:
+            (pd.Series, bool, str): Transformed full series, is_stationary flag, used transformation.
+        """
+        stationary, used_trans = self._search_transformation(
+            self._sample_window(s, start_date, end_date), series, transformation, confidence
+        )
+        transformed_stat_df = Transform.unit_q(s, used_trans) if used_trans != "none" else s
+        return transformed_stat_df, stationary, used_trans
+
+    def _search_transformation(self, s_check, series, transformation, confidence):
+        """
+        Test `s_check` (the sample window) and pick its transformation: the preset if given, else the first
+        candidate that makes it stationary.
+
+        Returns:
+            (bool, str): is_stationary flag, used transformation ('none' if no candidate worked).
+        """
         logger.debug(f"{self.name}: Testing stationarity for '{series}' on sample window {s_check.index.min()} to {s_check.index.max()}.")
 
-        if Statistics.check_stationarity_s(s_check, confidence):
+        if self._is_stationary(s_check, confidence):
             logger.info(f"{self.name}: '{series}' is already stationary.")
         else:
             logger.warning(f"{self.name}: '{series}' is non-stationary. Attempting transformation.")
 
-        # choose transformation
-        if getattr(meta, "transformation", None):
-            transformation = meta.transformation
-        elif (meta.freq in {"ME", "D"}) and getattr(meta, "transformation_m1", None):
-            # allow using a pre-set m1 transform for monthly/daily
-            transformation = meta.transformation_m1
-            logger.info(f"{self.name}: Using m1 preset transformation '{transformation}' for monthly/daily series '{series}'.")
-        elif isinstance(transform_all, str) and transform_all in TRANSFORMATIONS:
-            transformation = transform_all
-        else:
-            transformation = None
-
         # apply transformation on the (sample) series and evaluate
         if transformation:
             logger.info(f"{self.name}: Applying transformation '{transformation}' to '{series}'.")
-            transformed_check = Transform.unit_q(s_check, transformation)
-            transformed_stat_df = Transform.unit_q(s_stat_df, transformation)
-            used_trans = transformation
-            stationary = Statistics.check_stationarity_s(transformed_check, confidence)
-        else:
-            transformed, stationary, used_trans = self._stat_s_loop(series, s_check, confidence)
-            if used_trans != "none":
-                transformed_stat_df = Transform.unit_q(s_stat_df, used_trans)
-            else:
-                transformed_stat_df = s_stat_df
+            transformed_check = self._transformed_check(series, s_check, transformation)
+            return self._is_stationary(transformed_check, confidence), transformation
+
+        _, stationary, used_trans = self._stat_s_loop(series, s_check, confidence)
+        return stationary, used_trans
+
+    def _sample_window(self, s, start_date=None, end_date=None):
+        """Sample window used for testing: s.loc[start_date:end_date], the slice resolved once per index."""
+        if start_date is None and end_date is None:
+            return s
+        cached = self.__dict__.get("_window_slice")
+        if cached is None or cached[0] is not s.index or cached[1] != (start_date, end_date):
+            cached = self.__dict__["_window_slice"] = (s.index, (start_date, end_date), s.index.slice_indexer(start_date, end_date))
+        return s.iloc[cached[2]]
+
+    @staticmethod
+    def _apply_transformations(items):
+        """
+        Full series of [(series, s, used_trans), ...] transformed as `Transform.unit_q(s, used_trans)`
+        ('none' keeps s), with all equally indexed series in one `Transform.unit_panel` call.
 
+        Returns:
+            dict: {series: transformed pd.Series}.
+        """
+        transformed = {}
+        pending = [item for item in items if item[2] != "none"]
+        while pending:
+            index = pending[0][1].index
+            group = [item for item in pending if item[1].index.equals(index)]
+            pending = [item for item in pending if not item[1].index.equals(index)]
+
+            values = Transform.unit_panel(
+                np.column_stack([s.to_numpy(dtype=float) for _, s, _ in group]), [used for _, _, used in group], "QE"
+            )
+            for j, (series, s, _) in enumerate(group):
+                keep = ~np.isnan(values[:, j])
+                transformed[series] = pd.Series(values[keep, j], index=index[keep], name=s.name)
+
+        for series, s, used in items:
+            if used == "none":
+                transformed[series] = s
+        return transformed
+
+    def _write_stationarity_meta(self, meta, series, stationary, used_trans):
+        """Record the verdict and transformation of `series` in its meta (generic + frequency-specific flags)."""
         # write generic meta
         try:
             meta.transformation_applied = used_trans
@@ -144,8 +304,6 @@ class StationarityMixin:
         else:
             raise ValueError(f"Unexpected frequency '{meta.freq}' for series '{series}'.")
 
-        return transformed_stat_df
-
     def _stat_s_loop(self, series, s, confidence=None):
         """
         Try a set of transformations to achieve stationarity for a quarterly series.
@@ -157,8 +315,8 @@ class StationarityMixin:
 
         for t in TRANSFORMATIONS:
             try:
-                transformed = Transform.unit_q(s, t)
-                if Statistics.check_stationarity_s(transformed, confidence):
+                transformed = self._transformed_check(series, s, t)
+                if self._is_stationary(transformed, confidence):
                     logger.info(f"{self.name}: '{series}' became stationary with transformation '{t}'.")
                     return transformed, True, t
                 last_transformed = transformed
@@ -169,6 +327,84 @@ class StationarityMixin:
 
         return last_transformed, False, "none"
 
+    def _preset_transformation(self, meta, transform_all):
+        """Transformation fixed in advance (meta, m1 preset for monthly/daily, transform_all), else None."""
+        if getattr(meta, "transformation", None):
+            return meta.transformation
+        if (meta.freq in {"ME", "D"}) and getattr(meta, "transformation_m1", None):
+            # allow using a pre-set m1 transform for monthly/daily
+            return meta.transformation_m1
+        if isinstance(transform_all, str) and transform_all in TRANSFORMATIONS:
+            return transform_all
+        return None
+
+    def _is_stationary(self, s, confidence):
+        """`Statistics.check_stationarity_s` behind the verdict cache filled by `_prefill_stationarity`."""
+        cache = self.__dict__.setdefault("_adf_verdicts", {})
+        key = Statistics.stationarity_key(s, confidence)
+        if key not in cache:
+            cache[key] = Statistics.check_stationarity_s(s, confidence)
+        return cache[key]
+
+    def _transformed_check(self, series, s, transformation):
+        """`Transform.unit_q(s, transformation)`, from the candidates `_prefill_stationarity` built in bulk if present."""
+        window = (len(s), s.index[0], s.index[-1]) if len(s) else (0, None, None)
+        cached = self.__dict__.get("_stat_candidates", {}).get((series, transformation) + window)
+        return cached if cached is not None else Transform.unit_q(s, transformation)
+
+    def _prefill_stationarity(self, items, transform_all, confidence, start_date=None, end_date=None):
+        """
+        Run every ADF test `to_stat_df` may ask for on [(series, s), ...] (sample window, preset or
+        candidate transformations) as one batched call and cache the verdicts. The candidates of all
+        equally indexed series come from one `Transform.unit_candidates` pass and are kept for the
+        search loop. Series whose preset can still come from an m1 sibling get all candidates. Series
+        the test rejects are left to the per-series path, which raises / logs exactly as before.
+        """
+        checks = []
+        seen_m1 = set()
+        for series, s in items:
+            series_meta_name = Checks.get_series_meta_name(series)
+            meta = self.meta.get(series_meta_name)
+            s_check = self._sample_window(s, start_date, end_date)
+
+            transformation = self._preset_transformation(meta, transform_all)
+            if series_meta_name in seen_m1 and not getattr(meta, "transformation", None) and meta.freq in {"ME", "D"}:
+                transformation = None
+            if self._get_m_block(series) == "m1":
+                seen_m1.add(series_meta_name)
+
+            checks.append((series, s_check, [transformation] if transformation else TRANSFORMATIONS))
+
+        # all candidates of all equally indexed windows at once
+        store = self.__dict__["_stat_candidates"] = {}
+        pending = checks
+        while pending:
+            index = pending[0][1].index
+            group = [check for check in pending if check[1].index.equals(index)]
+            pending = [check for check in pending if not check[1].index.equals(index)]
+
+            window = (len(index), index[0], index[-1]) if len(index) else (0, None, None)
+            values = Transform.unit_candidates(np.column_stack([s_check.to_numpy(dtype=float) for _, s_check, _ in group]), "QE")
+            for j, (series, s_check, needed) in enumerate(group):
+                for t in needed:
+                    if t not in TRANSFORMATIONS:
+                        continue  # unknown preset: left to unit_q, which raises in the search loop
+                    col = values[TRANSFORMATIONS.index(t), :, j]
+                    keep = ~np.isnan(col)
+                    store[(series, t) + window] = pd.Series(col[keep], index=index[keep], name=s_check.name)
+
+        candidates = []
+        for series, s_check, needed in checks:
+            candidates.append(s_check)
+            for t in needed:
+                try:
+                    candidates.append(self._transformed_check(series, s_check, t))
+                except Exception:
+                    continue
+
+        cache = self.__dict__.setdefault("_adf_verdicts", {})
+        Statistics.check_stationarity_many(candidates, confidence, cache=cache, errors="coerce")
+
     def _get_m_block(self, series: str) -> str:
         """
         Extract the rightmost 'm' block (e.g., 'm1', 'm2') scanning from the end.
@@ -202,10 +438,8 @@ class StationarityMixin:
             return pd.DataFrame()
 
         results = []
-        for series in dataset.columns:
-            s = dataset[series].dropna()
-            adf_result = Statistics.check_unit_root(s, confidence)
-
+        adf_results = Statistics.check_unit_root_batch([dataset[series] for series in dataset.columns], confidence)
+        for series, adf_result in zip(dataset.columns, adf_results):
             results.append({
                 "Series": series,
                 "Stationarity": adf_result.stationary,
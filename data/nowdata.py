@@ -6,6 +6,7 @@ from loguru import logger
 import time
 
 from data.datautils.extract import Extract
+from data.datautils.panel import MixedFreqPanel, FREQS
 from utils.checks import *
 from data.seriesdataclass import Source, Series, GroupSeries
 
@@ -110,38 +111,25 @@ class NOWData(MetaMixin, RaggedEdgeSimulMixin, ImputationMixin, ValidationMixin,
 
     def to_raw_dfs(self):
         """
-        Combine all series DataFrames into separate DataFrames by frequency.
+        Combine all series DataFrames into one mixed-frequency panel.
 
         Returns:
-            dict: Dictionary with keys 'QE', 'ME', 'D', each containing a DataFrame of series at that frequency.
+            MixedFreqPanel: Mapping with keys 'QE', 'ME', 'D', each giving a DataFrame of series at that frequency.
         """
-        # Initialize empty DataFrames for each frequency
-        raw_dfs = {
-            "QE": pd.DataFrame(),
-            "ME": pd.DataFrame(),
-            "D": pd.DataFrame(),
-        }
-
-        # Iterate through the series metadata and collect DataFrames by frequency
+        # Collect the series DataFrames tagged by frequency, then assemble them in one pass
+        frames = []
         for series in self.meta.values():
             series_df = self.series_dataframes.get(series.name)
             if series_df is not None and not series_df.empty:
-                if series.freq == "QE":
-                    raw_dfs["QE"] = pd.concat([raw_dfs["QE"], series_df], axis=1)
-                    logger.info(f"{self.name}: Added {series.name} to quarterly raw DataFrame.")
-                elif series.freq == "ME":
-                    raw_dfs["ME"] = pd.concat([raw_dfs["ME"], series_df], axis=1)
-                    logger.info(f"{self.name}: Added {series.name} to monthly raw DataFrame.")
-                elif series.freq == "D":
-                    raw_dfs["D"] = pd.concat([raw_dfs["D"], series_df], axis=1)
-                    logger.info(f"{self.name}: Added {series.name} to daily raw DataFrame.")
+                if series.freq in FREQS:
+                    frames.append((series_df, {"freq": series.freq}))
+                    logger.info(f"{self.name}: Added {series.name} to {series.freq} raw panel.")
                 else:
                     logger.warning(f"{self.name}: Unknown frequency '{series.freq}' for series '{series.name}'.")
             else:
                 logger.warning(f"{self.name}: The series '{series.name}' is empty or not found in the series_dataframes.")
 
-        for freq, df in raw_dfs.items():
-            df.attrs["transformations"] = "raw"
+        raw_dfs = MixedFreqPanel.from_frames(frames, attrs={"transformations": "raw"})
 
         # Store the DataFrames as attributes for convenience
         self.raw_df_q = raw_dfs["QE"]
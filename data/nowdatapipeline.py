@@ -7,7 +7,22 @@ import os
 import matplotlib.pyplot as plt
 
 from utils.getdata import *
+from utils.utils import file_digest, sources_digest
 from mappings.periods import period_mappings
+from data.datautils.stepmemo import StepMemo, state_delta, state_fingerprints, step_key
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Source files the nowdata steps run; their digests are part of the step keys (see STEP_CODE)
+# and of the nowdata stage cache key (NOWMLUPipeline._nowdata_stage_inputs).
+NOWDATA_SOURCES = ("data/**/*.py", "utils/checks.py", "utils/getdata.py", "utils/utils.py")
+
+# Pipeline attributes a step may set; memoized (with the NOWData attributes) when a step changes them.
+STEP_OUTPUTS = (
+    "raw_dfs", "imp_dfs", "mq_freq_dfs", "blocked_df", "stat_df", "check_stationarity_df", "filtered_df",
+    "series_model_dataframes", "lagged_df", "release_periods_dict", "sample_dfs", "full_sample_df",
+    "in_sample_df", "out_sample_df", "fwr_idx_dict", "release_latest_block_dict", "meta_df", "meta",
+)
 
 # from loguru import logger
 # logger.remove()   
@@ -15,7 +30,47 @@ from mappings.periods import period_mappings
 class NOWDataPipeline:
     """
     Pipeline for processing multiple NOWData mappings and combining the results.
+
+    Steps 1.0-1.9 form a dependency DAG (STEPS). With step_memo=True every step's result is
+    memoized under a fingerprint of its parameters and of the steps it consumes, so a changed
+    parameter recomputes only its step and the steps downstream (e.g. a different no_lags
+    reuses everything up to the filtered DataFrame, including the stationarity step).
+
+    A memo entry holds only what its step changed (NOWData attributes and pipeline outputs), so a
+    memoized step is restored by reloading the mapping object (1.0) and replaying the entries of
+    1.1 up to it. The memo is trimmed least-recently-used to step_memo_max_gb.
+
+    The keys also hash the code each step runs (STEP_CODE), so a code change recomputes the
+    affected steps. step_memo_refresh=True recomputes every step and overwrites its entries.
     """
+
+    # step -> (method, parent steps, parameters the step reads)
+    STEPS = OrderedDict([
+        ("1.0_mapping",    ("_step_mapping",    (),                 ("mapping_name",))),
+        ("1.1_raw",        ("_step_raw",        ("1.0_mapping",),   ("mapping_periods",))),
+        ("1.2_imputed",    ("_step_imputed",    ("1.1_raw",),       ("impute", "impute_method"))),
+        ("1.3_blocked",    ("_step_blocked",    ("1.2_imputed",),   ())),
+        ("1.4_stationary", ("_step_stationary", ("1.3_blocked",),   ("transform_all", "confidence", "start_date", "nowcast_start"))),
+        ("1.5_filtered",   ("_step_filtered",   ("1.4_stationary",), ("start_date", "end_date", "dropvarlist", "umidas_model_lags", "y_var", "y_var_lags"))),
+        ("1.6_lagged",     ("_step_lagged",     ("1.5_filtered",),  ("y_var", "umidas_model_lags", "y_var_lags", "no_lags"))),
+        ("1.7_sample",     ("_step_sample",     ("1.6_lagged",),    ("start_date", "end_date", "nowcast_start"))),
+        ("1.8_rolling",    ("_step_rolling",    ("1.7_sample",),    ("start_date", "nowcast_start", "end_date"))),
+        ("1.9_meta",       ("_step_meta",       ("1.8_rolling",),   ())),
+    ])
+
+    # step -> mixins only that step runs; every other NOWDATA_SOURCES file is hashed into 1.0 and
+    # therefore (through the parent keys) into every step
+    STEP_CODE = {
+        "1.1_raw":        ("data/mixins/raggededgesimul.py",),
+        "1.2_imputed":    ("data/mixins/imputation.py",),
+        "1.3_blocked":    ("data/mixins/blocking.py",),
+        "1.4_stationary": ("data/mixins/stationarity.py",),
+        "1.5_filtered":   ("data/mixins/filtering.py",),
+        "1.6_lagged":     ("data/mixins/lagging.py", "data/mixins/raggededgesimul.py"),
+        "1.7_sample":     ("data/mixins/sample.py",),
+        "1.8_rolling":    ("data/mixins/rolling.py", "data/mixins/raggededgesimul.py"),
+    }
+
     def __init__(self, 
                     file_path = str, 
                     mapping_name = str, 
@@ -31,7 +86,11 @@ class NOWDataPipeline:
                     umidas_model_lags = int, 
                     y_var = str,  
                     y_var_lags = int,
-                    nowcast_start = pd.Timestamp
+                    nowcast_start = pd.Timestamp,
+                    stat_n_jobs = 1,
+                    step_memo = True,
+                    step_memo_max_gb = 5.0,
+                    step_memo_refresh = False
         ):
 
         # ------------------------------------------------------ #
@@ -43,6 +102,7 @@ class NOWDataPipeline:
 
         # ----- Input and output path ---------------------------#
         self.file_path_nowdata_object = f"{file_path}/dataset/obj_nowdata"
+        self.file_path_stepmemo = f"{file_path}/cache/nowdatamemo"
 
         # ----- Input parameters --------------------------------#
         # --------------- Step 1.0 ------------------------------#
@@ -63,6 +123,7 @@ class NOWDataPipeline:
         # --------------- Step 1.4 ------------------------------#
         self.transform_all = transform_all
         self.confidence = confidence
+        self.stat_n_jobs = stat_n_jobs # worker processes for the transformation search (1 = serial, -1 = all cores)
 
         # --------------- Step 1.5 ------------------------------#
         self.start_date = start_date
@@ -89,6 +150,12 @@ class NOWDataPipeline:
 
         # --------------- Step 1.9 ------------------------------#
 
+        # --------------- Step memo -----------------------------#
+        self.step_memo = step_memo # memoize every step's result; recompute only changed steps + downstream
+        self.step_memo_max_gb = step_memo_max_gb # LRU bound of the step memo on disk (None = unbounded)
+        self.step_memo_refresh = step_memo_refresh # recompute every step, overwriting its memo entries
+        self._step_memo = StepMemo(self.file_path_stepmemo, max_gb=step_memo_max_gb) if step_memo else None
+
         # ------------------------------------------------------ #
         # Outputs from NOWDataPipeline ------------------------- #
         # ------------------------------------------------------ #
@@ -139,16 +206,81 @@ class NOWDataPipeline:
         if self.umidas_model_lags < 4:
             logger.error(f"ERROR: UMidas Model length too short to construct the model dataframes. Chose a lag lenght > 4.")
             return
-            
+
+        # longest memoized chain 1.1..k for these inputs -> reload the mapping, replay it and
+        # recompute only what follows (1.0 is the mapping object itself and is never memoized)
+        keys = self._step_keys()
+        steps = list(self.STEPS)
+        first = 0
+        if self.step_memo and not self.step_memo_refresh:
+            deltas = []
+            for step in steps[1:]:
+                delta = self._step_memo.get(step, keys[step])
+                if delta is None:
+                    break
+                deltas.append(delta)
+            if deltas:
+                self._step_mapping()
+                for delta in deltas:
+                    self._restore_step_delta(delta)
+                first = 1 + len(deltas)
+                logger.info(f"Step memo: restored up to '{steps[first - 1]}' ({keys[steps[first - 1]][:12]}); recomputing {steps[first:] or 'nothing'}.")
+        if self.step_memo:
+            fingerprints = state_fingerprints(self._step_state())
+
+        for step in steps[first:]:
+            if getattr(self, self.STEPS[step][0])() is False:
+                return
+            if step == "1.0_mapping":
+                keys = self._step_keys()  # loading may have created the mapping object the keys hash
+            if self.step_memo:
+                delta, fingerprints = state_delta(self._step_state(), fingerprints)
+                if step != "1.0_mapping":
+                    self._step_memo.put(step, keys[step], delta)
+
+    # ---- Step DAG ---------------------------------------------------------- #
+    def _step_keys(self):
+        """Fingerprint of every step: its parameters, its code + the keys of the steps it consumes (see STEPS)."""
+        sources = sources_digest(REPO_ROOT, NOWDATA_SOURCES)
+        own = {path for paths in self.STEP_CODE.values() for path in paths}
+        keys = {}
+        for step, (_, parents, params) in self.STEPS.items():
+            values = {name: getattr(self, name) for name in params}
+            values["code"] = {path: sources.get(path) for path in self.STEP_CODE.get(step, ())}
+            if step == "1.0_mapping":
+                values["code"] = {path: digest for path, digest in sources.items() if path not in own}
+                values["mapping_module"] = file_digest(os.path.join(REPO_ROOT, "mappings", f"{self.mapping_name}.py"))
+                values["mapping_object"] = file_digest(f"{self.file_path_nowdata_object}/{self.mapping_name}.pkl")
+            keys[step] = step_key(step, values, [keys[parent] for parent in parents])
+        return keys
+
+    def _step_state(self):
+        """Everything a step may leave behind, flat: the NOWData attributes and the pipeline outputs."""
+        nowdata = getattr(self, "NOWData", None)
+        state = {f"NOWData.{attr}": value for attr, value in (vars(nowdata) if nowdata is not None else {}).items()}
+        state.update({attr: getattr(self, attr, None) for attr in STEP_OUTPUTS})
+        return state
+
+    def _restore_step_delta(self, delta):
+        for name, value in delta.items():
+            if name.startswith("NOWData."):
+                setattr(self.NOWData, name[len("NOWData."):], value)
+            else:
+                setattr(self, name, value)
+
+    # ---- Steps ------------------------------------------------------------- #
+    def _step_mapping(self):
         # STEP 1.0: Load the Nowdataset from the mapping.
 
         self.NOWData = Getdata.mapping(self.file_path_nowdata_object, self.mapping_name)
 
+    def _step_raw(self):
         # STEP 1.1: Get raw_dfs, release periods and the release calendar plot
 
         self.NOWData.get_release_periods(mapping_periods=self.mapping_periods)
         self.raw_dfs = self.NOWData.to_raw_dfs()
 
+    def _step_imputed(self):
         # STEP 1.2: Impute missing values
 
         self.imp_dfs = self.NOWData.to_imp_dfs(
@@ -156,12 +288,14 @@ class NOWDataPipeline:
             impute=self.impute, 
             impute_method=self.impute_method
         )
-    
+
+    def _step_blocked(self):
         # STEP 1.3: Bring daily series to monthly frequency and construct a blocked DataFrame
 
         self.mq_freq_dfs = self.NOWData.to_mq_freq_dfs(self.imp_dfs)
         self.blocked_df = self.NOWData.to_blocked_df(self.mq_freq_dfs)
 
+    def _step_stationary(self):
         # STEP 1.4: Stationarize the blocked DataFrame
 
         self.stat_df = self.NOWData.to_stat_df(
@@ -169,11 +303,13 @@ class NOWDataPipeline:
             transform_all=self.transform_all, 
             confidence=self.confidence,
             start_date=self.start_date, 
-            end_date=self.nowcast_start # NOTE: Changed this! was end_date=self.end_date before
+            end_date=self.nowcast_start, # NOTE: Changed this! was end_date=self.end_date before
+            n_jobs=self.stat_n_jobs
         )
 
+    def _step_filtered(self):
         # STEP 1.5: Filter the DataFrame based on metadata and other criteria
-                
+
         self.filtered_df = self.NOWData.to_filtered_df(
             self.stat_df,
             start_date=self.start_date,
@@ -212,7 +348,7 @@ class NOWDataPipeline:
         #     logger.info("Exiting as per user request.")
         #     return 
 
-
+    def _step_lagged(self):
         # STEP 1.6: Construct lagged DataFrames
 
         self.series_model_dataframes = self.NOWData.get_model_dfs(
@@ -253,8 +389,9 @@ class NOWDataPipeline:
 
         else:
             logger.error(f"ERROR: no_lags parameter not recognized. Choose from 'nl_nc', 'nl_c', 'l_c'.")
-            return
+            return False
 
+    def _step_sample(self):
         # STEP 1.7: Construct sample DataFrames
 
         self.sample_dfs = self.NOWData.to_sample_dfs(
@@ -268,6 +405,7 @@ class NOWDataPipeline:
         self.in_sample_df = self.sample_dfs["In-Sample"]
         self.out_sample_df = self.sample_dfs["Out-of-Sample"]
 
+    def _step_rolling(self):
         # STEP 1.8: Map the periods and the forward rolling window
 
         self.fwr_idx_dict = self.NOWData.get_fwr_idx_dict(
@@ -279,6 +417,7 @@ class NOWDataPipeline:
 
         self.release_latest_block_dict = self.NOWData.get_release_latest_block_dict() # NOTE: Not used anymore, kept for now
 
+    def _step_meta(self):
         # STEP 1.9: Get the meta data DataFrame
 
         self.meta_df = self.NOWData.meta_df
@@ -3,6 +3,7 @@ from loguru import logger
 import pandas as pd
 from sympy import series  # unused import preserved to match your environment
 from tqdm import tqdm
+from joblib import Parallel, delayed
 import numpy as np
 
 from utils.checks import Checks
@@ -13,12 +14,31 @@ from mlumidas.select.pyen import PYEN
 from mlumidas.select.pyadal import PYADAL
 
 from mlumidas.utils.modelgrid import get_model_grid_dict
-from utils.utils import get_formatted_date
+from mlumidas.utils.cachekeys import get_top_level_key, ModelCacheIndex, canonical_freq, canonical_transformation
+from mlumidas.utils.msehistory import MSEHistoryTable
+from mlumidas.utils.varselectmemo import VarselectMemo, varselect_memo_key
+from mlumidas.utils.raggededge import RaggedEdgePanel
 from mlumidas.models.umidas import UMidas
 from mlumidas.models.benchmarkar4 import BenchmarkAR4
 from mlumidas.models.benchmarkar2 import BenchmarkAR2
 from data.datautils.statistics import Statistics
-from data.datautils.statistics import Statistics
+
+
+def _run_varselect_chunk(tasks, varselect_kwargs, warm_start):
+    """
+    Worker: run [(quarter, period, train_idx), ...] in order.
+    Module-level so it can be shipped to worker processes; returns {(quarter, period): output}.
+    """
+    runner = MLUMidasMixin()
+    prior_states = {}
+    outputs = {}
+    for quarter, period, train_idx in tasks:
+        prior_state = prior_states.get(period) if warm_start else None
+        varselect_model_out, state = runner._run_varselect(train_idx, period, varselect_kwargs, prior_state)
+        if warm_start and state is not None:
+            prior_states[period] = state
+        outputs[(quarter, period)] = varselect_model_out
+    return outputs
 
 
 class MLUMidasMixin:
@@ -66,18 +86,33 @@ class MLUMidasMixin:
 
         mse_history,                
         window_quarters=4,          # rolling window length for MSFE
+        umidas_engine="numpy",
+        rolling_window_quarters=None,  # None = expanding estimation windows
+        varselect_warm_start=False,    # seed each period's selection with the previous quarter's solution
+        varselect_n_jobs=1,            # processes for the (quarter, period) selection tasks (1 = serial)
+        varselect_outputs=None,        # precomputed {(quarter, period): varselect output}
+        varselect_memo_dir=None,       # content-addressed memo of selector outputs (None = off)
+        ragged_edge_dtype=np.float64,  # dtype of the precomputed ragged-edge panel (np.float32 halves memory)
+        varselect_screening=True,      # strong-rule screening in pyentscv / pyen (checked on the full problem)
+        varselect_cv_mode="path",      # pyentscv CV: "path" (warm-started enet paths) or "grid" (GridSearchCV)
     ):
+        """
+        For varselection_method="pyentscv" `alpha` may be a list of l1_ratios: the selection
+        runs once for all ratios and {l1_ratio: results_dict} is returned.
+        """
+        params = {k: v for k, v in locals().items() if k != "self"}
+
         # ---- EARLY HARD CHECK ON mse_history ---- #
-        if not isinstance(mse_history, dict) or len(mse_history) == 0:
+        if not isinstance(mse_history, (dict, MSEHistoryTable, pd.DataFrame)) or len(mse_history) == 0:
             raise ValueError(
-                "mse_history is missing or empty. Provide a dict keyed by "
+                "mse_history is missing or empty. Provide an MSEHistoryTable or a dict keyed by "
                 "(top_level_cache_key, freq, series, period_key, crit, transformation) "
                 "with a pandas Series of squared errors indexed by quarter."
             )
+        # trailing MSFE windows for every (history key, quarter) in one pass
+        mse_history = MSEHistoryTable.from_any(mse_history).precompute(window_quarters)
 
-        formatted_start_date = get_formatted_date(start_date)
-        formatted_end_date = get_formatted_date(end_date)
-        top_level_cache_key = f"{formatted_start_date}_to_{formatted_end_date}_{y_var}_lags_{umidas_model_lags}"
+        top_level_cache_key = get_top_level_key(start_date, y_var, umidas_model_lags, rolling_window_quarters)
 
         # normalize the cache so we can reliably look things up
         cache_dict = self._normalize_model_cache(model_cache)
@@ -86,6 +121,7 @@ class MLUMidasMixin:
 
         period_raw_names_dict = {}
         period_meta_names_dict = {}
+        release_selected_block_dict = {}
         all_full_lst = set()
         all_basenames_lst = set()
 
@@ -129,6 +165,78 @@ class MLUMidasMixin:
         # --- hold AR(4) results across quarters --- #
         quarter_y_var_ar4_results_dict = {}
         lambda_cv_dict = {}
+        cv_surface_dict = {}  # compact CV errors + coefficient paths (pyentscv) for re-selection
+
+        # previous quarter's selection state per period (warm start)
+        varselect_prior_states = {}
+
+        varselect_kwargs = dict(
+            varselection_method=varselection_method,
+            release_periods_dict=release_periods_dict,
+            y_var=y_var,
+            full_sample_df=full_sample_df,
+            alpha=alpha,
+            tcv_splits=tcv_splits,
+            test_size=test_size,
+            gap=gap,
+            max_train_size=max_train_size,
+            alphas=alphas,
+            max_iter=max_iter,
+            random_state=random_state,
+            with_mean=with_mean,
+            with_std=with_std,
+            fit_intercept=fit_intercept,
+            selection_rule=selection_rule,
+            se_factor=se_factor,
+            threshold_divisor=threshold_divisor,
+            coef_tol=coef_tol,
+            k_indicators=k_indicators,
+            lambda_fix=lambda_fix,
+            remove_non_stat_fwr=remove_non_stat_fwr,
+            confidence=confidence,
+            varselect_memo_dir=varselect_memo_dir,
+            varselect_screening=varselect_screening,
+            varselect_cv_mode=varselect_cv_mode,
+            # panel converted once; every (quarter, period) selection input is a gather from it
+            panel=RaggedEdgePanel(full_sample_df, release_periods_dict, y_var, dtype=ragged_edge_dtype),
+        )
+
+        # several l1_ratios: ONE selection pass (shared ragged edge, folds and scaling), then
+        # the usual assembly once per ratio on that ratio's slice of the outputs
+        if varselection_method == "pyentscv" and isinstance(alpha, (list, tuple)):
+            if varselect_n_jobs not in (None, 0, 1):
+                outputs = self._run_varselect_parallel(
+                    quarters, periods_sorted, fwr_idx_dict, varselect_kwargs, varselect_warm_start, varselect_n_jobs
+                )
+            else:
+                tasks = [(q, p, fwr_idx_dict[q]["train_idx"]) for q in quarters for p in periods_sorted]
+                outputs = _run_varselect_chunk(tasks, varselect_kwargs, varselect_warm_start)
+
+            results_by_ratio = {}
+            for ratio in alpha:
+                ratio_outputs = {key: out["by_l1_ratio"][ratio] for key, out in outputs.items()}
+                logger.info(f"Assembling results for l1_ratio={ratio}")
+                results_by_ratio[ratio] = self.get_results_dict(**{**params, "alpha": ratio, "varselect_outputs": ratio_outputs})
+            return results_by_ratio
+
+        # (quarter, period) -> varselect output, precomputed by the caller or up front on a process pool
+        if varselect_outputs is not None:
+            varselect_outputs = dict(varselect_outputs)
+        elif varselect_n_jobs not in (None, 0, 1):
+            varselect_outputs = self._run_varselect_parallel(
+                quarters, periods_sorted, fwr_idx_dict, varselect_kwargs, varselect_warm_start, varselect_n_jobs
+            )
+        else:
+            varselect_outputs = {}
+
+        # recursive engine: one pass over all quarters instead of a refit per (quarter, period)
+        ar4_recursive_dict = {}
+        if umidas_engine == "recursive":
+            ar4_recursive_dict = BenchmarkAR4.predict_recursive(
+                series_model_dataframes[y_var]["full_model_df"],
+                fwr_idx_dict,
+                rolling_window=rolling_window_quarters,
+            )
 
         for quarter in tqdm(quarters, desc="Running ML-U-MIDAS"):
 
@@ -138,7 +246,9 @@ class MLUMidasMixin:
             # RESET per-quarter containers so nothing leaks between quarters
             period_raw_names_dict[quarter] = {}
             period_meta_names_dict[quarter] = {}
+            release_selected_block_dict[quarter] = {}
             lambda_cv_dict[quarter] = {}
+            cv_surface_dict[quarter] = {}
 
             period_series_model_selected_results_dict = {c: {} for c in criteria}
 
@@ -155,84 +265,17 @@ class MLUMidasMixin:
                 for c in criteria:
                     period_series_model_selected_results_dict[c][period] = {}
 
-                X, y = self._to_ragged_edge_df(
-                    train_idx,
-                    period,
-                    release_periods_dict,
-                    y_var,
-                    full_sample_df,
-                    remove_non_stat_fwr=remove_non_stat_fwr,
-                    confidence=confidence,
-                )
-
                 # ---------------------------------------------------#
                 # --- Varselect -------------------------------------#
                 # ---------------------------------------------------#
 
-                varselect_model = None
-                varselect_model_out = None
-
-                if varselection_method == "pyentscv":
-                    varselect_model = PYENTSCV(
-                        l1_ratio=alpha,
-                        tcv_splits=tcv_splits,
-                        test_size=test_size,
-                        gap=gap,
-                        max_train_size=max_train_size,
-                        alphas=alphas,
-                        max_iter=max_iter,
-                        random_state=random_state,
-                        with_mean=with_mean,
-                        with_std=with_std,
-                        fit_intercept=fit_intercept,
-                        selection_rule=selection_rule,
-                        # se_factor=se_factor,
-                        threshold_divisor=threshold_divisor,
-                        coef_tol=coef_tol,
-                        k_indicators=k_indicators,
-                    )
-                elif varselection_method == "pyen":
-                    varselect_model = PYEN(
-                        l1_ratio=alpha,
-                        max_iter=max_iter,
-                        random_state=random_state,
-                        with_mean=with_mean,
-                        with_std=with_std,
-                        fit_intercept=fit_intercept,
-                        selection_rule=selection_rule,
-                        se_factor=se_factor,
-                        threshold_divisor=threshold_divisor,
-                        coef_tol=coef_tol,
-                        lambda_fix=lambda_fix,
-                    )
-
-                elif varselection_method == "pyadal":
-                    varselect_model = PYADAL(
-                        tcv_splits=tcv_splits,
-                        test_size=test_size,
-                        gap=gap,
-                        max_train_size=max_train_size,
-                        alphas=alphas,
-                        max_iter=max_iter,
-                        with_mean=with_mean,
-                        with_std=with_std,
-                        fit_intercept=fit_intercept
-                    )
-
-                elif varselection_method == "pyhardt":
-                    varselect_model = PYHARDT(
-                        y_var=y_var,
-                        significance_level=alpha,
-                        k_indicators=k_indicators,
-                    )
-                elif varselection_method == "no_selection":
-                    varselect_model_out = {"selected_features": X.columns.tolist()}
+                if (quarter, period) in varselect_outputs:
+                    varselect_model_out = varselect_outputs.pop((quarter, period))
                 else:
-                    raise ValueError(f"Unknown method: {varselection_method}")
-
-                if varselect_model is not None:
-                    varselect_model.fit(X, y)
-                    varselect_model_out = varselect_model.get_result()
+                    prior_state = varselect_prior_states.get(period) if varselect_warm_start else None
+                    varselect_model_out, state = self._run_varselect(train_idx, period, varselect_kwargs, prior_state)
+                    if varselect_warm_start and state is not None:
+                        varselect_prior_states[period] = state
 
                 # ------- Get Varselect Output ----------------------#
 
@@ -241,6 +284,7 @@ class MLUMidasMixin:
                 lambda_cv = varselect_model_out.get("best_alpha", pd.Series(dtype=float))
 
                 lambda_cv_dict[quarter][period] = lambda_cv
+                cv_surface_dict[quarter][period] = varselect_model_out.get("cv_surface")
 
                 # Guarantee same order/length as selected_vars
                 coef_values = coef_series_sel.reindex(selected_vars).to_numpy(dtype=float)
@@ -252,7 +296,7 @@ class MLUMidasMixin:
                 bases = self._get_meta_names(selected_vars, y_var)
 
                 period_raw_names_dict[quarter][period] = selected_vars
-                release_selected_block_dict = self._get_release_selected_block_dict(period_raw_names_dict, meta)
+                release_selected_block_dict[quarter][period] = self._get_release_selected_blocks(selected_vars, meta)
                 period_meta_names_dict[quarter][period] = sorted(bases)
 
                 self._update_all_selected_lst(selected_vars, y_var, all_full_lst, all_basenames_lst, bases)
@@ -260,18 +304,22 @@ class MLUMidasMixin:
                 # ---------------------------------------------------#
                 # --- Benchmark Model (per quarter) -----------------#
                 # ---------------------------------------------------#
-                y_var_quarter_df = series_model_dataframes[y_var]["full_model_df"]
-                train_data_ar4 = y_var_quarter_df.loc[train_idx]
-                test_data_ar4  = y_var_quarter_df.loc[test_idx]
-
-                ar4_model_inst = BenchmarkAR4(                 
-                    y_var=y_var,
-                    train_data=train_data_ar4,
-                    test_data=test_data_ar4,
-                )
+                if quarter in ar4_recursive_dict:
+                    y_actual_ar4, y_pred_ar4, mse_ar4 = ar4_recursive_dict[quarter]
+                else:
+                    y_var_quarter_df = series_model_dataframes[y_var]["full_model_df"]
+                    train_idx_ar4 = train_idx[-int(rolling_window_quarters):] if rolling_window_quarters else train_idx
+                    train_data_ar4 = y_var_quarter_df.loc[train_idx_ar4]
+                    test_data_ar4  = y_var_quarter_df.loc[test_idx]
 
-                ar4_model = ar4_model_inst.fit()
-                y_actual_ar4, y_pred_ar4, mse_ar4 = ar4_model_inst.predict(ar4_model)
+                    ar4_model_inst = BenchmarkAR4(
+                        y_var=y_var,
+                        train_data=train_data_ar4,
+                        test_data=test_data_ar4,
+                    )
+
+                    ar4_model = ar4_model_inst.fit()
+                    y_actual_ar4, y_pred_ar4, mse_ar4 = ar4_model_inst.predict(ar4_model)
 
                 quarter_y_var_ar4_results_dict[quarter] = {
                     "y_actual_ar4": y_actual_ar4,
@@ -385,22 +433,12 @@ class MLUMidasMixin:
                             past_mse_window_map = {}
 
                             for ri in row_info:
-                                hkey = (top_level_cache_key, ri["freq"], ri["series"], ri["period_key"], crit, ri["trans"])
-                                s = mse_history.get(hkey)
-                                if s is None or s.empty:
-                                    continue
+                                hkey = (top_level_cache_key, canonical_freq(ri["freq"]), ri["series"], ri["period_key"], crit, canonical_transformation(ri["trans"]))
                                 # only quarters strictly before current quarter
-                                s_past = s[s.index < cq]
-                                if s_past.empty:
+                                msfe = mse_history.msfe(hkey, cq)
+                                if msfe is None:
                                     continue
-                                s_win = s_past.tail(int(window_quarters))
-                                if s_win.empty:
-                                    continue
-                                msfe_mean_map[ri["row"]] = float(pd.to_numeric(s_win, errors="coerce").mean())
-                                past_mse_window_map[ri["row"]] = [
-                                    float(x) if np.isfinite(x) else np.nan
-                                    for x in pd.to_numeric(s_win, errors="coerce").tolist()
-                                ]
+                                msfe_mean_map[ri["row"]], past_mse_window_map[ri["row"]] = msfe
 
                             # Pure inverse-MSFE weights across all rows with MSFE estimates
                             msfe_series = pd.Series(msfe_mean_map, dtype=float).replace([np.inf, -np.inf], np.nan).dropna()
@@ -586,6 +624,7 @@ class MLUMidasMixin:
         results_dict["varselect"]["selected_vars_quarters"] = selected_vars_quarters_df_dict
         results_dict["varselect"]["selected_vars_quarters_periods"] = selected_vars_quarters_periods_df_dict
         results_dict["varselect"]["lambda_cv"] = lambda_cv_dict 
+        results_dict["varselect"]["cv_surfaces"] = cv_surface_dict  # -> mlumidas.select.reselect.reselect_outputs
         results_dict["varselect"]["all_selected"] = {
             "raw": sorted(all_full_lst),
             "meta_names": sorted(all_basenames_lst),
@@ -639,6 +678,139 @@ class MLUMidasMixin:
 
         return value
 
+    # ---- Varselect tasks -------------------------------------------------- #
+    def _run_varselect(self, train_idx, period, varselect_kwargs, prior_state=None):
+        """Ragged-edge slice + variable selection for ONE (quarter, period). Returns (output, state)."""
+        kw = varselect_kwargs
+        varselection_method = kw["varselection_method"]
+
+        X, y = self._to_ragged_edge_df(
+            train_idx,
+            period,
+            kw["release_periods_dict"],
+            kw["y_var"],
+            kw["full_sample_df"],
+            remove_non_stat_fwr=kw["remove_non_stat_fwr"],
+            confidence=kw["confidence"],
+            panel=kw.get("panel"),
+        )
+
+        varselect_model = None
+        varselect_model_out = None
+
+        if varselection_method == "pyentscv":
+            varselect_model = PYENTSCV(
+                l1_ratio=kw["alpha"],
+                tcv_splits=kw["tcv_splits"],
+                test_size=kw["test_size"],
+                gap=kw["gap"],
+                max_train_size=kw["max_train_size"],
+                alphas=kw["alphas"],
+                max_iter=kw["max_iter"],
+                random_state=kw["random_state"],
+                with_mean=kw["with_mean"],
+                with_std=kw["with_std"],
+                fit_intercept=kw["fit_intercept"],
+                selection_rule=kw["selection_rule"],
+                # se_factor=se_factor,
+                threshold_divisor=kw["threshold_divisor"],
+                coef_tol=kw["coef_tol"],
+                k_indicators=kw["k_indicators"],
+                prior_state=prior_state,
+                screening=kw["varselect_screening"],
+                cv_mode=kw["varselect_cv_mode"],
+                n_jobs=kw.get("selector_n_jobs", -1),
+            )
+        elif varselection_method == "pyen":
+            varselect_model = PYEN(
+                l1_ratio=kw["alpha"],
+                max_iter=kw["max_iter"],
+                random_state=kw["random_state"],
+                with_mean=kw["with_mean"],
+                with_std=kw["with_std"],
+                fit_intercept=kw["fit_intercept"],
+                selection_rule=kw["selection_rule"],
+                se_factor=kw["se_factor"],
+                threshold_divisor=kw["threshold_divisor"],
+                coef_tol=kw["coef_tol"],
+                lambda_fix=kw["lambda_fix"],
+                prior_state=prior_state,
+                screening=kw["varselect_screening"],
+            )
+
+        elif varselection_method == "pyadal":
+            varselect_model = PYADAL(
+                tcv_splits=kw["tcv_splits"],
+                test_size=kw["test_size"],
+                gap=kw["gap"],
+                max_train_size=kw["max_train_size"],
+                alphas=kw["alphas"],
+                max_iter=kw["max_iter"],
+                with_mean=kw["with_mean"],
+                with_std=kw["with_std"],
+                fit_intercept=kw["fit_intercept"],
+                prior_state=prior_state,
+                n_jobs=kw.get("selector_n_jobs", -1),
+            )
+
+        elif varselection_method == "pyhardt":
+            varselect_model = PYHARDT(
+                y_var=kw["y_var"],
+                significance_level=kw["alpha"],
+                k_indicators=kw["k_indicators"],
+            )
+        elif varselection_method == "no_selection":
+            varselect_model_out = {"selected_features": X.columns.tolist()}
+        else:
+            raise ValueError(f"Unknown method: {varselection_method}")
+
+        # ---- memo: same slice + same selector (all parameters, same code) + same warm start ----
+        memo, memo_key = None, None
+        if kw.get("varselect_memo_dir") and varselect_model is not None:
+            memo = VarselectMemo(kw["varselect_memo_dir"])
+            memo_key = varselect_memo_key(X, y, varselect_model, prior_state)
+            hit = memo.get(memo_key)
+            if hit is not None:
+                logger.debug(f"Varselect memo hit for period '{period}' ({memo_key[:12]}).")
+                return hit["output"], hit["state"]
+
+        state = None
+        if varselect_model is not None:
+            varselect_model.fit(X, y)
+            varselect_model_out = varselect_model.get_result()
+            if hasattr(varselect_model, "get_state"):
+                state = varselect_model.get_state()
+
+        if memo is not None:
+            memo.put(memo_key, varselect_model_out, state)
+
+        return varselect_model_out, state
+
+    def _run_varselect_parallel(self, quarters, periods_sorted, fwr_idx_dict, varselect_kwargs, warm_start, n_jobs):
+        """
+        Fan the (quarter, period) selection tasks out to a process pool.
+        With warm start each period is one chain (quarters in order, state carried forward);
+        otherwise each quarter is one chunk. Results are merged by key, so the order of
+        completion never matters.
+        """
+        if warm_start:
+            chunks = [[(q, p, fwr_idx_dict[q]["train_idx"]) for q in quarters] for p in periods_sorted]
+        else:
+            chunks = [[(q, p, fwr_idx_dict[q]["train_idx"]) for p in periods_sorted] for q in quarters]
+
+        # one process per task: the selectors' own GridSearchCV pools would oversubscribe the cores
+        varselect_kwargs = {**varselect_kwargs, "selector_n_jobs": 1}
+
+        logger.info(f"Running {len(quarters) * len(periods_sorted)} varselect tasks in {len(chunks)} chunks (n_jobs={n_jobs}).")
+        chunk_results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_run_varselect_chunk)(chunk, varselect_kwargs, warm_start) for chunk in chunks
+        )
+
+        outputs = {}
+        for chunk_result in chunk_results:
+            outputs.update(chunk_result)
+        return outputs
+
     def _to_ragged_edge_df(
         self,
         train_idx,
@@ -647,20 +819,23 @@ class MLUMidasMixin:
         y_var,
         full_sample_df,
         remove_non_stat_fwr=False,
-        confidence=0.05
+        confidence=0.05,
+        panel=None,
     ):
+        # precomputed panel: a row lookup + one gather instead of building frames
+        if panel is not None:
+            logger.debug(f"Period '{period}' has {panel.n_included(period)} included columns (panel).")
+            X, y = panel.slice(train_idx, period)
+            if remove_non_stat_fwr:
+                X = self._drop_non_stationary(X, period, confidence)
+            return X, y
+
         released = set(release_periods_dict.get(period, []))
-        non_stat_removed_series = 0
-        logger.debug(f"Period '{period}' has {len(released)} released series.")
-        non_stat_removed_series = 0
         logger.debug(f"Period '{period}' has {len(released)} released series.")
 
         def is_lag(col: str) -> bool:
             return bool(re.search(r"_lag\d+$", str(col)))
 
-        def get_base(col: str) -> str:
-            return Checks.get_series_meta_name(col)
-
         included = []
         for c in full_sample_df.columns:
             if c == y_var:
@@ -681,31 +856,31 @@ class MLUMidasMixin:
         ragged_edge_df_joined = ragged_edge_df.join(y_series, how="inner")
         ragged_edge_df_clean = ragged_edge_df_joined.dropna(axis=0)
 
-        if remove_non_stat_fwr:
-            for series in ragged_edge_df_clean.columns:
-                if series == y_var:
-                    continue
-                if not Statistics.check_stationarity_s(ragged_edge_df_clean[series], confidence):
-                    logger.warning(f"Series {series} is non-stationary in period {period}. Dropping.")
-                    ragged_edge_df_clean = ragged_edge_df_clean.drop(columns=[series])
-                    non_stat_removed_series += 1
-            logger.debug(f"Period '{period}': Removed {non_stat_removed_series} non-stationary series out of {len(included)} included.")
-
-        if remove_non_stat_fwr:
-            for series in ragged_edge_df_clean.columns:
-                if series == y_var:
-                    continue
-                if not Statistics.check_stationarity_s(ragged_edge_df_clean[series], confidence):
-                    logger.warning(f"Series {series} is non-stationary in period {period}. Dropping.")
-                    ragged_edge_df_clean = ragged_edge_df_clean.drop(columns=[series])
-                    non_stat_removed_series += 1
-            logger.debug(f"Period '{period}': Removed {non_stat_removed_series} non-stationary series out of {len(included)} included.")
-
         X = ragged_edge_df_clean.drop(columns=[y_var])
         y = ragged_edge_df_clean[y_var]
 
+        if remove_non_stat_fwr:
+            X = self._drop_non_stationary(X, period, confidence)
+
         return X, y
 
+    def _drop_non_stationary(self, X, period, confidence):
+        """
+        Drop the non-stationary columns of a ragged-edge slice (one batch ADF call).
+        Verdicts are cached per (series, sample window), so a column whose complete-case
+        window repeats across periods / quarters is only tested once per runner.
+        """
+        cache = getattr(self, "_stationarity_verdicts", None)
+        if cache is None:
+            cache = self._stationarity_verdicts = {}
+
+        verdicts = Statistics.check_stationarity_batch(X, confidence, cache=cache)
+        non_stat = [series for series, stationary in verdicts.items() if not stationary]
+        for series in non_stat:
+            logger.warning(f"Series {series} is non-stationary in period {period}. Dropping.")
+        logger.debug(f"Period '{period}': Removed {len(non_stat)} non-stationary series out of {X.shape[1]} included.")
+        return X.drop(columns=non_stat) if non_stat else X
+
     def _update_all_selected_lst(self, selected_vars, y_var, all_full_lst, all_basenames_lst, bases):
         for v in selected_vars:
             if Checks.get_series_meta_name(v) != y_var:
@@ -789,16 +964,9 @@ class MLUMidasMixin:
         median_df.index.name = "quarter"
         return avg_df, median_df
 
-    def _get_release_selected_block_dict(self, period_raw_names_dict, meta):
-        release_selected_block_dict = {}
-
-        for quarter, periods in period_raw_names_dict.items():
-            release_selected_block_dict[quarter] = {}
-            for period, selected_vars in periods.items():
-                release_selected_block_dict[quarter][period] = {}
-                for var in selected_vars:
-                    release_selected_block_dict[quarter][period][var] = self._map_var_to_period(var, meta)
-        return release_selected_block_dict
+    def _get_release_selected_blocks(self, selected_vars, meta):
+        """{selected var: release block} for ONE (quarter, period); filled in as each period is selected."""
+        return {var: self._map_var_to_period(var, meta) for var in selected_vars}
 
     def _map_var_to_period(self, selected_var, meta):
         meta_name = Checks.get_series_meta_name(selected_var)
@@ -825,6 +993,10 @@ class MLUMidasMixin:
     
     # ---- Cache helpers -------------------------------------------------- #
     def _normalize_model_cache(self, model_cache):
+        # already indexed at load time (load_or_compute_model_cache)
+        if isinstance(model_cache, ModelCacheIndex):
+            return model_cache
+
         if isinstance(model_cache, dict):
             items = model_cache.items()
         else:
@@ -842,70 +1014,11 @@ class MLUMidasMixin:
                 logger.warning(f"Failed to iterate external model_cache: {e}")
                 items = []
 
-        normalized = {}
-        for k, payload in items:
-            # prefer 7-tuple (includes transformation); else fall back to 6
-            base_key = tuple(k[:7]) if len(k) >= 7 else tuple(k[:6])
-            existing = normalized.get(base_key)
-            if existing is None:
-                normalized[base_key] = payload
-            else:
-                has_pred_new = isinstance(payload, dict) and payload.get("y_pred") is not None
-                has_pred_old = isinstance(existing, dict) and existing.get("y_pred") is not None
-                if has_pred_new and not has_pred_old:
-                    normalized[base_key] = payload
-        return normalized
+        return ModelCacheIndex(items)
 
     def _lookup_cache_entry(self, cache_dict, desired_key):
-        if desired_key in cache_dict:
-            return cache_dict[desired_key]
-
-        # tolerant: match on date for quarter element (rare path)
-        if len(desired_key) == 7:
-            tlk, q_desired, freq, series, block, crit, transformation = desired_key
-            q_desired_date = None
-            try:
-                q_desired_date = pd.Timestamp(q_desired).date()
-            except Exception:
-                pass
-            if q_desired_date is None:
-                return None
-
-            for (tlk_k, q_k, f_k, s_k, b_k, c_k, t_k), payload in cache_dict.items():
-                # skip 6-tuples when looking for 7-tuple key
-                if not isinstance((tlk_k, q_k, f_k, s_k, b_k, c_k, t_k), tuple):
-                    continue
-                if tlk_k != tlk or f_k != freq or s_k != series or b_k != block or c_k != crit or t_k != transformation:
-                    continue
-                try:
-                    if pd.Timestamp(q_k).date() == q_desired_date:
-                        return payload
-                except Exception:
-                    continue
-            return None
-
-        # 6-tuple tolerant match
-        tlk, q_desired, freq, series, block, crit = desired_key
-        q_desired_date = None
-        try:
-            q_desired_date = pd.Timestamp(q_desired).date()
-        except Exception:
-            pass
-        if q_desired_date is None:
-            return None
-
-        for key_k, payload in cache_dict.items():
-            if len(key_k) != 6:
-                continue
-            tlk_k, q_k, f_k, s_k, b_k, c_k = key_k
-            if tlk_k != tlk or f_k != freq or s_k != series or b_k != block or c_k != crit:
-                continue
-            try:
-                if pd.Timestamp(q_k).date() == q_desired_date:
-                    return payload
-            except Exception:
-                continue
-        return None
+        # single hash probe on the canonical key (quarter / freq alias / transformation normalized)
+        return cache_dict.lookup(desired_key)
 
     def _get_cached_predictions(self, cache_dict, top_level_cache_key, quarter, freq_key, series, period_key, crit, transformation_key):
         key7 = self._make_cache_key(top_level_cache_key, quarter, freq_key, series, period_key, crit, transformation_key)
@@ -1,15 +1,126 @@
+import os
+import re
 import time
+import hashlib
+from pathlib import Path
 from collections import defaultdict
 from tqdm import tqdm
 from loguru import logger
-from joblib import dump, load
+from joblib import dump, load, Parallel, delayed
 import pandas as pd
 from collections import defaultdict as _dd
 import numpy as np
 
-from utils.utils import get_formatted_date
+from mlumidas.utils.cachekeys import (
+    get_top_level_key, frame_row_hashes, slice_fingerprint, ModelCacheIndex,
+    canonical_freq, canonical_transformation,
+)
 from mlumidas.models.umidas import UMidas
+from mlumidas.models.umidasnp import UMidasNP
+from mlumidas.models.umidasrls import UMidasRLS
 from mlumidas.utils.modelgrid import get_model_grid_dict
+from mlumidas.utils.msehistory import MSEHistoryTable, HISTORY_KEY_LEVELS
+
+
+UMIDAS_ENGINES = {
+    "statsmodels": UMidas,
+    "numpy": UMidasNP,
+    "recursive": UMidasRLS,
+}
+
+
+def _compute_series_models(y_var, period_frames, fwr_idx_dict, combinations, model_grid_dict, umidas_engine, rolling_window=None):
+    """
+    Best-spec search for all missing combinations of ONE series.
+    Module-level so it can be shipped to worker processes; returns [(cache_key, payload), ...].
+    """
+    if umidas_engine == "recursive":
+        return _compute_series_models_recursive(y_var, period_frames, fwr_idx_dict, combinations, model_grid_dict, rolling_window)
+
+    model_cls = UMIDAS_ENGINES[umidas_engine]
+    entries = []
+
+    for top_level_key, quarter, frequency, series, period_type, transformation in combinations:
+        try:
+            model_grid = model_grid_dict["quarterly_grid"] if frequency == "QE" else model_grid_dict["monthly_grid"]
+            period_df = period_frames[period_type]
+            train_idx = fwr_idx_dict[quarter]["train_idx"]
+            test_idx = fwr_idx_dict[quarter]["test_idx"]
+            if rolling_window:
+                train_idx = train_idx[-int(rolling_window):]
+            train_data = period_df.loc[train_idx]
+            test_data = period_df.loc[test_idx]
+
+            best_model = model_cls(
+                y_var=y_var,
+                train_data=train_data,
+                test_data=test_data,
+                model_grid=model_grid
+            )
+            best_model.get_best()
+
+            for crit in best_model.best_models_by_criterion:
+                key = (top_level_key, quarter, frequency, series, period_type, crit, transformation)
+
+                spec = best_model.best_models_by_criterion[crit]["spec"]
+                best_spec_model = best_model.fit(spec)
+                y_actual, y_pred, mse = best_model.predict(best_spec_model, spec)
+
+                entries.append((key, {
+                    "spec": spec,
+                    "variable_names": best_model.best_models_by_criterion[crit]["variable_names"],
+                    "score": best_model.best_models_by_criterion[crit]["score"],
+                    "summary": None,
+                    "y_actual": y_actual,
+                    "y_pred": y_pred,
+                    "mse": mse,
+                }))
+        except Exception as e:
+            logger.warning(f"Spec computation failed for {series} | {period_type} | {quarter}: {e}")
+
+    return entries
+
+
+def _compute_series_models_recursive(y_var, period_frames, fwr_idx_dict, combinations, model_grid_dict, rolling_window=None):
+    """
+    Recursive variant of _compute_series_models: each (period_type, transformation) model
+    frame is walked through its quarters in time order, carrying X'X, X'y, y'y forward.
+    """
+    groups = defaultdict(list)
+    for combination in combinations:
+        top_level_key, quarter, frequency, series, period_type, transformation = combination
+        groups[(top_level_key, frequency, series, period_type, transformation)].append(quarter)
+
+    entries = []
+    for (top_level_key, frequency, series, period_type, transformation), quarters in groups.items():
+        model_grid = model_grid_dict["quarterly_grid"] if frequency == "QE" else model_grid_dict["monthly_grid"]
+        model = UMidasRLS(
+            y_var=y_var,
+            model_df=period_frames[period_type],
+            model_grid=model_grid,
+            rolling_window=rolling_window,
+        )
+
+        for quarter in sorted(quarters):
+            try:
+                best = model.get_best(fwr_idx_dict[quarter]["train_idx"])
+                for crit, best_crit in best.items():
+                    key = (top_level_key, quarter, frequency, series, period_type, crit, transformation)
+                    y_actual, y_pred, mse = model.predict(best_crit["params"], best_crit["spec"], fwr_idx_dict[quarter]["test_idx"])
+
+                    entries.append((key, {
+                        "spec": best_crit["spec"],
+                        "variable_names": best_crit["variable_names"],
+                        "score": best_crit["score"],
+                        "summary": None,
+                        "y_actual": y_actual,
+                        "y_pred": y_pred,
+                        "mse": mse,
+                    }))
+            except Exception as e:
+                logger.warning(f"Spec computation failed for {series} | {period_type} | {quarter}: {e}")
+
+    return entries
 
 
 class MLUMidasCacheMixin:
@@ -26,6 +137,123 @@ class MLUMidasCacheMixin:
     def _load_cache(self, path, filename):
         return load(f"{path}/{filename}")
 
+    # ---- Sharded store: model_cache_{top_level_key}/index.pkl + one shard per series ----
+    #   index.pkl : {"version": 2,
+    #                "keys": {cache_key: shard_filename},            (keys only, no payloads)
+    #                "fingerprints": {combination: slice fingerprint}}
+    #   shard_*.pkl : {cache_key: payload} for ONE series
+    # combination = cache_key without crit; entries without a matching fingerprint are stale.
+
+    CACHE_STORE_VERSION = 2
+
+    @staticmethod
+    def _combination_of(key):
+        top_level_key, quarter, freq, series, period_type, crit, transformation = key[:7]
+        return (top_level_key, quarter, freq, series, period_type, transformation)
+
+    def _store_dir(self, path, top_level_key):
+        return Path(path) / f"model_cache_{top_level_key}"
+
+    @staticmethod
+    def _shard_name(series):
+        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(series))[:60]
+        digest = hashlib.md5(str(series).encode("utf-8")).hexdigest()[:8]
+        return f"shard_{slug}_{digest}.pkl"
+
+    @staticmethod
+    def _atomic_dump(obj, file_path, compress=0):
+        """Write via tmp + os.replace so a crash never leaves a half-written file."""
+        file_path = Path(file_path)
+        tmp = file_path.with_name(file_path.name + ".tmp")
+        dump(obj, tmp, compress=compress)
+        os.replace(tmp, file_path)
+
+    def _save_shard(self, shard, store_dir, shard_name):
+        self._atomic_dump(shard, Path(store_dir) / shard_name, compress=("lz4", 3))
+
+    def _load_shard(self, store_dir, shard_name):
+        try:
+            return load(Path(store_dir) / shard_name)
+        except FileNotFoundError:
+            return {}
+
+    def _save_store_index(self, index, store_dir):
+        self._atomic_dump(index, Path(store_dir) / "index.pkl")
+
+    def _load_store_index(self, store_dir):
+        """Index of the sharded store; rebuilt from the shards if it is missing or unreadable."""
+        store_dir = Path(store_dir)
+        try:
+            index = load(store_dir / "index.pkl")
+            if isinstance(index, dict) and index.get("version") == self.CACHE_STORE_VERSION:
+                return index
+            if isinstance(index, dict) and index.get("version") == 1:
+                # pre-fingerprint layout: keep the keys, every entry counts as stale
+                index = {"version": self.CACHE_STORE_VERSION, "keys": index["keys"], "fingerprints": {}}
+                self._save_store_index(index, store_dir)
+                return index
+            logger.warning(f"Cache index in {store_dir} has an unknown layout; rebuilding from shards.")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to read cache index in {store_dir} ({e}); rebuilding from shards.")
+
+        index = {"version": self.CACHE_STORE_VERSION, "keys": {}, "fingerprints": {}}
+        for shard_path in sorted(store_dir.glob("shard_*.pkl")):
+            try:
+                for key, payload in load(shard_path).items():
+                    index["keys"][key] = shard_path.name
+                    if payload.get("fingerprint") is not None:
+                        index["fingerprints"][self._combination_of(key)] = payload["fingerprint"]
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cache shard {shard_path.name}: {e}")
+        if index["keys"]:
+            self._save_store_index(index, store_dir)
+        return index
+
+    def _write_store_entries(self, entries_by_series, store_dir, index):
+        """Merge new entries into their series shards (only touched shards are rewritten), then the index."""
+        Path(store_dir).mkdir(parents=True, exist_ok=True)
+        for series, entries in entries_by_series.items():
+            if not entries:
+                continue
+            shard_name = self._shard_name(series)
+            shard = self._load_shard(store_dir, shard_name)
+            shard.update(entries)
+            self._save_shard(shard, store_dir, shard_name)
+            for key, payload in entries.items():
+                index["keys"][key] = shard_name
+                index["fingerprints"][self._combination_of(key)] = payload.get("fingerprint")
+        self._save_store_index(index, store_dir)
+        return index
+
+    def _load_store_payloads(self, store_dir, index):
+        model_cache = {}
+        for shard_name in sorted(set(index["keys"].values())):
+            model_cache.update(self._load_shard(store_dir, shard_name))
+        return model_cache
+
+    def _open_model_cache_store(self, path, top_level_key):
+        """Index of the sharded store, migrating a legacy monolithic model_cache_{key}.pkl on first use."""
+        store_dir = self._store_dir(path, top_level_key)
+        if store_dir.is_dir():
+            return store_dir, self._load_store_index(store_dir)
+
+        index = {"version": self.CACHE_STORE_VERSION, "keys": {}, "fingerprints": {}}
+        legacy_file = f"model_cache_{top_level_key}.pkl"
+        try:
+            legacy = self._load_cache(path, legacy_file)
+        except FileNotFoundError:
+            return store_dir, index
+
+        entries_by_series = defaultdict(dict)
+        for key, payload in legacy.items():
+            if isinstance(key, tuple) and len(key) >= 7:
+                entries_by_series[key[3]][key] = payload
+        index = self._write_store_entries(entries_by_series, store_dir, index)
+        logger.info(f"Migrated {legacy_file} ({len(index['keys'])} entries) to sharded store {store_dir}")
+        return store_dir, index
+
     def _save_history(self, hist, path, filename):
         dump(hist, f"{path}/{filename}", compress=("lz4", 3))
 
@@ -42,12 +270,20 @@ class MLUMidasCacheMixin:
         fwr_idx_dict,
         series_model_dataframes,
         meta,
+        umidas_engine="numpy",
+        n_jobs=1,
+        rolling_window_quarters=None,
+        load_payloads=True,
+        checkpoint_every=None,
+        checkpoint_seconds=300,
     ):
         model_grid_dict = get_model_grid_dict()
 
-        formatted_start_date = get_formatted_date(start_date)
-        formatted_end_date = get_formatted_date(end_date)
-        top_level_key = f"{formatted_start_date}_to_{formatted_end_date}_{y_var}_lags_{umidas_model_lags}"
+        if umidas_engine not in UMIDAS_ENGINES:
+            raise ValueError(f"Unknown umidas_engine '{umidas_engine}'. Valid: {sorted(UMIDAS_ENGINES)}")
+
+        # end_date is not part of the key: entries are validated per quarter by fingerprint
+        top_level_key = get_top_level_key(start_date, y_var, umidas_model_lags, rolling_window_quarters)
 
         logger.info(f"Top-level key for this run: {top_level_key}")
 
@@ -56,43 +292,68 @@ class MLUMidasCacheMixin:
         self.fwr_idx_dict = fwr_idx_dict
         self.series_model_dataframes = series_model_dataframes
         self.meta = meta
-
-        try:
-            model_cache = self._load_cache(file_path_modelcache, f"model_cache_{top_level_key}.pkl")
-            logger.info(f"Loaded existing model cache from: {file_path_modelcache}")
-        except FileNotFoundError:
-            logger.warning(f"No existing model cache found at {file_path_modelcache}. Initializing empty cache.")
-            model_cache = {}
+        self.umidas_engine = umidas_engine
+        self.cache_n_jobs = n_jobs  # worker processes for the cache build (1 = serial, -1 = all cores)
+        self.rolling_window_quarters = rolling_window_quarters  # None = expanding windows
+        self.checkpoint_every = checkpoint_every        # persist after N finished combinations (None = off)
+        self.checkpoint_seconds = checkpoint_seconds    # ... and/or after T seconds (None = off)
+
+        store_dir, index = self._open_model_cache_store(file_path_modelcache, top_level_key)
+        cached_keys = index["keys"]
+        if cached_keys:
+            logger.info(f"Loaded model cache index ({len(cached_keys)} entries) from: {store_dir}")
+        else:
+            logger.warning(f"No existing model cache found at {store_dir}. Initializing empty cache.")
 
         missing_combinations = []
+        n_stale = 0
+        self.combination_fingerprints = {}
+        cached_fingerprints = index["fingerprints"]
 
         all_series = list(series_model_dataframes.keys())
 
         for series in all_series:
-            for qtr in fwr_idx_dict:
-                for period_type in series_model_dataframes[series].keys():
-                    if period_type == "full_model_df":
-                        continue
-                    meta_obj = meta.get(series)
-                    if meta_obj is None:
-                        logger.warning(f"Skipping series '{series}' — no metadata found.")
-                        continue
-                    freq = meta_obj.freq
-                    if freq == "D":
-                        freq = "ME"
-
-                    # Determine transformation safely (default to None if not available or freq unexpected)
-                    transformation = None
-                    if freq == "ME":
-                        transformation = getattr(meta_obj, "transformation_m1", None)
-                    elif freq == "QE":
-                        transformation = getattr(meta_obj, "transformation_applied_q", None)
-
-                    for crit in ["bic", "aic", "adj_r2"]:
-                        key = self._make_cache_key_cache(top_level_key, qtr, freq, series, period_type, crit, transformation)
-                        if key not in model_cache:
-                            missing_combinations.append((top_level_key, qtr, freq, series, period_type, transformation))
-                            
+            meta_obj = meta.get(series)
+            if meta_obj is None:
+                logger.warning(f"Skipping series '{series}' — no metadata found.")
+                continue
+            freq = meta_obj.freq
+            if freq == "D":
+                freq = "ME"
+
+            # Determine transformation safely (default to None if not available or freq unexpected)
+            transformation = None
+            if freq == "ME":
+                transformation = getattr(meta_obj, "transformation_m1", None)
+            elif freq == "QE":
+                transformation = getattr(meta_obj, "transformation_applied_q", None)
+
+            for period_type, period_df in series_model_dataframes[series].items():
+                if period_type == "full_model_df":
+                    continue
+                row_hashes, columns_digest = frame_row_hashes(period_df)
+
+                for qtr in fwr_idx_dict:
+                    combination = (top_level_key, qtr, freq, series, period_type, transformation)
+                    fingerprint = slice_fingerprint(
+                        period_df, row_hashes, columns_digest,
+                        fwr_idx_dict[qtr]["train_idx"], fwr_idx_dict[qtr]["test_idx"],
+                        rolling_window_quarters,
+                    )
+                    self.combination_fingerprints[combination] = fingerprint
+
+                    keys = [
+                        self._make_cache_key_cache(top_level_key, qtr, freq, series, period_type, crit, transformation)
+                        for crit in ["bic", "aic", "adj_r2"]
+                    ]
+                    if any(key not in cached_keys for key in keys):
+                        missing_combinations.append(combination)
+                    elif fingerprint is None or cached_fingerprints.get(combination) != fingerprint:
+                        missing_combinations.append(combination)
+                        n_stale += 1
+
+        if n_stale:
+            logger.warning(f"{n_stale} cached combinations no longer match their training data; recomputing.")
         missing_combinations = list(set(missing_combinations))
 
         if missing_combinations:
@@ -101,64 +362,85 @@ class MLUMidasCacheMixin:
             est_minutes = self._estimate_compute_time(missing_combinations, model_grid_dict)
             logger.warning(f"Estimated time to compute missing combinations: {est_minutes:.2f} minutes")
 
-            model_cache = self._compute_and_cache_models(
-                est_minutes, missing_combinations, model_grid_dict, model_cache
+            index = self._compute_and_cache_models(
+                est_minutes, missing_combinations, model_grid_dict, store_dir, index
             )
         else:
             logger.info("No missing best-spec combinations found. Nothing to compute.")
 
-        try:
-            self._save_cache(model_cache, file_path_modelcache, f"model_cache_{top_level_key}.pkl")
-            logger.success(f"Model cache (specs + predictions) saved to: {file_path_modelcache}")
-        except Exception as e:
-            logger.warning(f"Failed to save updated model cache: {e}")
+        # predictions are only deserialized when the caller needs them
+        model_cache = ModelCacheIndex(self._load_store_payloads(store_dir, index)) if load_payloads else {}
+        self.model_cache = model_cache
 
         return model_cache, top_level_key
 
-    def _compute_and_cache_models(self, est_minutes, missing_combinations, model_grid_dict, model_cache):
-        for top_level_key, quarter, frequency, series, period_type, transformation in missing_combinations:
-            try:
-                model_grid = model_grid_dict["quarterly_grid"] if frequency == "QE" else model_grid_dict["monthly_grid"]
-                period_df = self.series_model_dataframes[series][period_type]
-                train_idx = self.fwr_idx_dict[quarter]["train_idx"]
-                test_idx = self.fwr_idx_dict[quarter]["test_idx"]
-                train_data = period_df.loc[train_idx]
-                test_data = period_df.loc[test_idx]
-
-                best_model = UMidas(
-                    y_var=self.y_var,
-                    train_data=train_data,
-                    test_data=test_data,
-                    model_grid=model_grid
-                )
-                best_model.get_best()
-
-                for crit in best_model.best_models_by_criterion:
-                    key = self._make_cache_key_cache(top_level_key, quarter, frequency, series, period_type, crit, transformation)
-                    
-                    spec = best_model.best_models_by_criterion[crit]["spec"]
-                    best_spec_model = best_model.fit(spec)
-                    y_actual, y_pred, mse = best_model.predict(best_spec_model, spec)
-
-                    model_cache[key] = {
-                        "spec": spec,
-                        "variable_names": best_model.best_models_by_criterion[crit]["variable_names"],
-                        "score": best_model.best_models_by_criterion[crit]["score"],
-                        "summary": None,
-                        "y_actual": y_actual,
-                        "y_pred": y_pred,
-                        "mse": mse,
-                    }
-            except Exception as e:
-                logger.warning(f"Spec computation failed for {series} | {period_type} | {quarter}: {e}")
+    def _compute_and_cache_models(self, est_minutes, missing_combinations, model_grid_dict, store_dir, index):
+        umidas_engine = getattr(self, "umidas_engine", "numpy")
+        n_jobs = getattr(self, "cache_n_jobs", 1)
+        checkpoint_every = getattr(self, "checkpoint_every", None)
+        checkpoint_seconds = getattr(self, "checkpoint_seconds", 300)
+        fingerprints = getattr(self, "combination_fingerprints", {})
+
+        # one chunk per (series, period): a worker receives that period frame once,
+        # and finished chunks can be checkpointed while the rest is still running
+        chunks = defaultdict(list)
+        for combination in missing_combinations:
+            chunks[(combination[3], combination[4])].append(combination)
+        chunk_keys = sorted(chunks, key=lambda k: (str(k[0]), str(k[1])))
+        for chunk_key in chunk_keys:
+            chunks[chunk_key].sort(key=lambda c: (str(c[1]), str(c[0])))
+
+        def chunk_args(chunk_key):
+            series, period_type = chunk_key
+            frames = {period_type: self.series_model_dataframes[series][period_type]}
+            return (self.y_var, frames, self.fwr_idx_dict, chunks[chunk_key], model_grid_dict, umidas_engine,
+                    getattr(self, "rolling_window_quarters", None))
+
+        if n_jobs in (None, 0, 1) or len(chunk_keys) <= 1:
+            chunk_results = (_compute_series_models(*chunk_args(chunk_key)) for chunk_key in chunk_keys)
+        else:
+            logger.info(f"Computing {len(missing_combinations)} combinations in {len(chunk_keys)} chunks (n_jobs={n_jobs}).")
+            # results come back in submission order -> deterministic merge
+            chunk_results = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+                delayed(_compute_series_models)(*chunk_args(chunk_key)) for chunk_key in chunk_keys
+            )
 
-        unique_top_keys = {tpl[0] for tpl in missing_combinations}
-        save_top_key = next(iter(unique_top_keys)) if unique_top_keys else "unknown"
-        self.model_cache = model_cache
-        self._save_cache(self.model_cache, self.file_path_modelcache, f"model_cache_{save_top_key}.pkl")
-        logger.success(f"Updated model cache saved to: {self.file_path_modelcache}")
+        # ---- merge + periodic checkpoints (every N combinations and/or every T seconds) ----
+        pending = defaultdict(dict)
+        pending_combinations = 0
+        n_checkpoints = 0
+        touched_series = set()
+        last_checkpoint = time.monotonic()
+
+        def flush():
+            nonlocal index, pending, pending_combinations, last_checkpoint, n_checkpoints
+            if pending:
+                index = self._write_store_entries(pending, store_dir, index)
+                touched_series.update(pending)
+                n_checkpoints += 1
+            pending = defaultdict(dict)
+            pending_combinations = 0
+            last_checkpoint = time.monotonic()
 
-        return model_cache
+        try:
+            for chunk_key, entries in tqdm(zip(chunk_keys, chunk_results), total=len(chunk_keys), desc="Computing model cache"):
+                for key, payload in entries:
+                    payload["fingerprint"] = fingerprints.get(self._combination_of(key))
+                    pending[key[3]][key] = payload
+                pending_combinations += len(chunks[chunk_key])
+
+                due_count = checkpoint_every is not None and pending_combinations >= checkpoint_every
+                due_time = checkpoint_seconds is not None and time.monotonic() - last_checkpoint >= checkpoint_seconds
+                if due_count or due_time:
+                    flush()
+                    logger.debug(f"Checkpoint {n_checkpoints}: {len(index['keys'])} entries in {store_dir}")
+        finally:
+            # also runs on KeyboardInterrupt / worker errors: keep every finished chunk
+            flush()
+
+        logger.success(f"Updated {len(touched_series)} model cache shards in {n_checkpoints} checkpoint(s): {store_dir}")
+
+        return index
 
     def _estimate_compute_time(self, missing_combinations, model_grid_dict):
         time_per_model = 0.000004845
@@ -194,40 +476,55 @@ class MLUMidasCacheMixin:
        
         hist_fname = f"mse_history_{top_level_key}.pkl"
 
+        # the history is tied to the cache state it was built from (the key no longer pins end_date)
+        store_dir, index = self._open_model_cache_store(file_path_modelcache, top_level_key)
+        cache_digest = self._store_digest(index)
+
         try:
-            mse_history = self._load_history(file_path_modelcache, hist_fname)
-            logger.info(f"Loaded existing MSE history from: {file_path_modelcache}/{hist_fname}")
-            return mse_history
+            stored = self._load_history(file_path_modelcache, hist_fname)
+            if isinstance(stored, dict) and stored.get("cache_digest") == cache_digest and "mse_history" in stored:
+                logger.info(f"Loaded existing MSE history from: {file_path_modelcache}/{hist_fname}")
+                return MSEHistoryTable.from_any(stored["mse_history"])
+            logger.info("MSE history on disk is out of date with the model cache. Recomputing...")
         except FileNotFoundError:
             logger.info("No existing MSE history found on disk. Will compute from model cache...")
 
-        # if model_cache not provided, try to load the model cache by top-level key
+        # if model_cache not provided, load it from the sharded store
         if model_cache is None:
-            try:
-                model_cache = self._load_cache(file_path_modelcache, f"model_cache_{top_level_key}.pkl")
-                logger.info(f"Loaded model cache for building MSE history: {file_path_modelcache}")
-            except FileNotFoundError:
+            if not index["keys"]:
                 logger.error(
-                    f"Cannot build MSE history: model cache file 'model_cache_{top_level_key}.pkl' not found "
-                    f"in {file_path_modelcache}. Provide `model_cache` or compute it first."
+                    f"Cannot build MSE history: model cache store '{store_dir}' is empty or missing. "
+                    f"Provide `model_cache` or compute it first."
                 )
                 return {}
+            model_cache = self._load_store_payloads(store_dir, index)
+            logger.info(f"Loaded model cache for building MSE history: {store_dir}")
 
         # Build history from cache
         mse_history = self._compute_mse_history_from_model_cache(model_cache, top_level_key)
 
         # Save to disk
         try:
-            self._save_history(mse_history, file_path_modelcache, hist_fname)
+            self._save_history({"cache_digest": cache_digest, "mse_history": mse_history.frame}, file_path_modelcache, hist_fname)
             logger.success(f"MSE history saved to: {file_path_modelcache}/{hist_fname}")
         except Exception as e:
             logger.warning(f"Failed to save MSE history: {e}")
 
         return mse_history
 
-    def _compute_mse_history_from_model_cache(self, model_cache: dict, top_level_key: str) -> dict:
+    @staticmethod
+    def _store_digest(index):
+        """Digest of the cache contents (keys + fingerprints) used to validate derived files."""
+        h = hashlib.md5()
+        for item in sorted(map(repr, index["keys"])):
+            h.update(item.encode("utf-8"))
+        for item in sorted(map(repr, index["fingerprints"].items())):
+            h.update(item.encode("utf-8"))
+        return h.hexdigest()
 
-        buckets: dict = {}
+    def _compute_mse_history_from_model_cache(self, model_cache: dict, top_level_key: str) -> MSEHistoryTable:
+
+        rows = []
 
         for key, payload in model_cache.items():
             # key expected: (top, quarter, freq, series, period_type, crit, transformation, ...)
@@ -260,20 +557,15 @@ class MLUMidasCacheMixin:
                 # if quarter unparsable, skip
                 continue
 
-            hist_key = self._make_history_key(top_level_key, freq, series, period_type, crit, transformation)
-            if hist_key not in buckets:
-                buckets[hist_key] = {}
-            # last write wins if duplicates; we assume unique per (key, quarter)
-            buckets[hist_key][q] = se_val
-
-        # Convert to sorted Series
-        for hk in list(buckets.keys()):
-            s = pd.Series(buckets[hk], dtype=float)
-            s = s.sort_index()
-            # Optionally drop NaN/infs
-            s = s.replace([np.inf, -np.inf], np.nan).dropna()
-            buckets[hk] = s
+            hist_key = self._make_history_key(
+                top_level_key, canonical_freq(freq), series, period_type, crit, canonical_transformation(transformation)
+            )
+            rows.append(hist_key + (q, se_val))
 
-        logger.info(f"Built MSE history: {len(buckets)} series across specs/criteria.")
-        return buckets
+        # One long table sorted by (history key, quarter); last write wins on duplicates
+        frame = pd.DataFrame(rows, columns=HISTORY_KEY_LEVELS + ["quarter", "se"])
+        frame = frame.drop_duplicates(subset=HISTORY_KEY_LEVELS + ["quarter"], keep="last")
+        mse_history = MSEHistoryTable(frame)
 
+        logger.info(f"Built MSE history: {len(mse_history)} series across specs/criteria.")
+        return mse_history
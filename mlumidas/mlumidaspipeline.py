@@ -61,7 +61,18 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
         group_type=str,
         quarter_plots: Optional[List[pd.Timestamp]] = None,
 
-        run_cache_only=bool
+        run_cache_only=bool,
+        umidas_engine="numpy",
+        cache_n_jobs=1,
+        rolling_window_quarters=None,
+        cache_checkpoint_every=None,
+        cache_checkpoint_seconds=300,
+        varselect_warm_start=False,
+        varselect_n_jobs=1,
+        spec_names=None,
+        varselect_memo=True,
+        varselect_screening=True,
+        varselect_cv_mode="path",
     ):
 
         # ------------------------------------------------------ #
@@ -70,10 +81,21 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
         # ----- Cache orchestration -----------------------------#
 
         self.run_cache_only = run_cache_only
+        self.umidas_engine = umidas_engine
+        self.cache_n_jobs = cache_n_jobs
+        self.rolling_window_quarters = rolling_window_quarters
+        self.cache_checkpoint_every = cache_checkpoint_every
+        self.cache_checkpoint_seconds = cache_checkpoint_seconds
+        self.varselect_warm_start = varselect_warm_start
+        self.varselect_n_jobs = varselect_n_jobs
+        self.varselect_memo = varselect_memo
+        self.varselect_screening = varselect_screening
+        self.varselect_cv_mode = varselect_cv_mode
 
         # ----- Input paths -------------------------------------#
         self.file_path = file_path
         self.file_path_modelcache = f"{self.file_path}/cache/mlumidascache/"
+        self.file_path_varselectmemo = f"{self.file_path}/cache/varselectmemo/"
 
         # --------------- Step 2.1 ------------------------------#
         self.meta = meta
@@ -124,6 +146,7 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
 
         # --------------- Step 2.3 ------------------------------#
         self.spec_name = spec_name
+        self.spec_names = spec_names  # {l1_ratio: spec_name} when alpha is a list of l1_ratios
         self.save_q_plots = save_q_plots
         self.group_type = group_type
         self.quarter_plots = quarter_plots or []
@@ -158,7 +181,13 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
                 y_var=self.y_var,
                 fwr_idx_dict=self.fwr_idx_dict,
                 series_model_dataframes=self.series_model_dataframes,
-                meta=self.meta
+                meta=self.meta,
+                umidas_engine=self.umidas_engine,
+                n_jobs=self.cache_n_jobs,
+                rolling_window_quarters=self.rolling_window_quarters,
+                checkpoint_every=self.cache_checkpoint_every,
+                checkpoint_seconds=self.cache_checkpoint_seconds,
+                load_payloads=False,  # cache-only run: no need to read predictions back
             )
         else:
             # STEP 2.1 Compute model cache
@@ -170,7 +199,12 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
                 y_var=self.y_var,
                 fwr_idx_dict=self.fwr_idx_dict,
                 series_model_dataframes=self.series_model_dataframes,
-                meta=self.meta
+                meta=self.meta,
+                umidas_engine=self.umidas_engine,
+                n_jobs=self.cache_n_jobs,
+                rolling_window_quarters=self.rolling_window_quarters,
+                checkpoint_every=self.cache_checkpoint_every,
+                checkpoint_seconds=self.cache_checkpoint_seconds,
             )
 
             self.mse_history = self.load_or_compute_mse_history(
@@ -219,36 +253,75 @@ class MLUMidasPipeline(MLUMidasMixin, MLUMidasCacheMixin, MLUMidasOutputMixin, M
 
                 mse_history=self.mse_history,
                 window_quarters=self.window_quarters,
+                umidas_engine=self.umidas_engine,
+                rolling_window_quarters=self.rolling_window_quarters,
+                varselect_warm_start=self.varselect_warm_start,
+                varselect_n_jobs=self.varselect_n_jobs,
+                varselect_memo_dir=self.file_path_varselectmemo if self.varselect_memo else None,
+                varselect_screening=self.varselect_screening,
+                varselect_cv_mode=self.varselect_cv_mode,
             )
 
-            # STEP 2.3. Generate output
-            self.oof_plots = self.get_oof_plots(
-                results_dict=self.results_dict,
-                title=self.spec_name
-            )
-
-            self.oof_all_periods_plots = self.get_oof_all_periods_plots(
-                results_dict=self.results_dict,
-                title=self.spec_name
-            )
-
-            self.oof_single_quarter_plots = self.get_oof_single_quarter_plots(
-                self.results_dict, group_by=self.group_type, 
-                title=self.spec_name, 
-                quarter_plots=self.quarter_plots
-            )
-
-            self.selected_vars_quarters_df_dict = self.results_dict["varselect"]["selected_vars_quarters"]
-            self.selected_vars_quarters_periods_df_dict = self.results_dict["varselect"]["selected_vars_quarters_periods"]
-
-            # STEP 2.3. Save output
-            self.save_plots(self.oof_plots, self.file_path_output_plots)
-            self.save_plots(self.oof_all_periods_plots, self.file_path_output_plots)
-            if self.save_q_plots:
-                self.save_plots(self.oof_single_quarter_plots, self.file_path_output_plots)
-
-            self.save_selected_tables(self.selected_vars_quarters_df_dict, self.file_path_output_tables, self.spec_name)
-            self.save_selected_tables(self.selected_vars_quarters_periods_df_dict, self.file_path_output_tables, self.spec_name)
+            # STEP 2.3. Generate and save output (once per l1_ratio for a list of ratios)
+            if isinstance(self.alpha, (list, tuple)):
+                spec_names = self.spec_names or {ratio: f"{self.spec_name}_a{ratio}" for ratio in self.alpha}
+                outputs = {
+                    ratio: self._generate_outputs(results_dict, spec_names[ratio])
+                    for ratio, results_dict in self.results_dict.items()
+                }
+                self.oof_plots = {ratio: out["oof_plots"] for ratio, out in outputs.items()}
+                self.oof_all_periods_plots = {ratio: out["oof_all_periods_plots"] for ratio, out in outputs.items()}
+                self.oof_single_quarter_plots = {ratio: out["oof_single_quarter_plots"] for ratio, out in outputs.items()}
+                self.selected_vars_quarters_df_dict = {ratio: out["selected_vars_quarters_df_dict"] for ratio, out in outputs.items()}
+                self.selected_vars_quarters_periods_df_dict = {ratio: out["selected_vars_quarters_periods_df_dict"] for ratio, out in outputs.items()}
+            else:
+                outputs = self._generate_outputs(self.results_dict, self.spec_name)
+                self.oof_plots = outputs["oof_plots"]
+                self.oof_all_periods_plots = outputs["oof_all_periods_plots"]
+                self.oof_single_quarter_plots = outputs["oof_single_quarter_plots"]
+                self.selected_vars_quarters_df_dict = outputs["selected_vars_quarters_df_dict"]
+                self.selected_vars_quarters_periods_df_dict = outputs["selected_vars_quarters_periods_df_dict"]
+
+    def _generate_outputs(self, results_dict, spec_name):
+        file_path_output_plots = f"{self.file_path}/output/mlumidas/{spec_name}/plots"
+        file_path_output_tables = f"{self.file_path}/output/mlumidas/{spec_name}/selected_tables"
+
+        # STEP 2.3. Generate output
+        oof_plots = self.get_oof_plots(
+            results_dict=results_dict,
+            title=spec_name
+        )
+
+        oof_all_periods_plots = self.get_oof_all_periods_plots(
+            results_dict=results_dict,
+            title=spec_name
+        )
+
+        oof_single_quarter_plots = self.get_oof_single_quarter_plots(
+            results_dict, group_by=self.group_type, 
+            title=spec_name, 
+            quarter_plots=self.quarter_plots
+        )
+
+        selected_vars_quarters_df_dict = results_dict["varselect"]["selected_vars_quarters"]
+        selected_vars_quarters_periods_df_dict = results_dict["varselect"]["selected_vars_quarters_periods"]
+
+        # STEP 2.3. Save output
+        self.save_plots(oof_plots, file_path_output_plots)
+        self.save_plots(oof_all_periods_plots, file_path_output_plots)
+        if self.save_q_plots:
+            self.save_plots(oof_single_quarter_plots, file_path_output_plots)
+
+        self.save_selected_tables(selected_vars_quarters_df_dict, file_path_output_tables, spec_name)
+        self.save_selected_tables(selected_vars_quarters_periods_df_dict, file_path_output_tables, spec_name)
+
+        return {
+            "oof_plots": oof_plots,
+            "oof_all_periods_plots": oof_all_periods_plots,
+            "oof_single_quarter_plots": oof_single_quarter_plots,
+            "selected_vars_quarters_df_dict": selected_vars_quarters_df_dict,
+            "selected_vars_quarters_periods_df_dict": selected_vars_quarters_periods_df_dict,
+        }
 
     def run(self):
         self.process_mapping()
@@ -3,6 +3,8 @@
 import statsmodels.api as sm
 from sklearn.metrics import mean_squared_error
 
+from mlumidas.models.umidasrls import recursive_predictions
+
 class BenchmarkAR2:
     def __init__(self, y_var, train_data, test_data):
         self.y_var = y_var
@@ -31,4 +33,13 @@ class BenchmarkAR2:
         y_pred = summary['mean'].iloc[0]
         mse = mean_squared_error([y_actual], [y_pred])
 
-        return y_actual, y_pred, mse
\ No newline at end of file
+        return y_actual, y_pred, mse
+
+    @staticmethod
+    def predict_recursive(model_df, fwr_idx_dict, rolling_window=None):
+        """
+        Same fit/predict for every quarter of fwr_idx_dict, but with the sufficient
+        statistics carried across the windows instead of refitting from scratch.
+        Returns {quarter: (y_actual, y_pred, mse)}.
+        """
+        return recursive_predictions(model_df, fwr_idx_dict, n_features=2, rolling_window=rolling_window)
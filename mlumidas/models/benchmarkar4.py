@@ -1,6 +1,8 @@
 import statsmodels.api as sm
 from sklearn.metrics import mean_squared_error
 
+from mlumidas.models.umidasrls import recursive_predictions
+
 class BenchmarkAR4:
     def __init__(self, y_var, train_data, test_data):
         self.y_var = y_var
@@ -30,4 +32,12 @@ class BenchmarkAR4:
         mse = mean_squared_error([y_actual], [y_pred])
 
         return y_actual, y_pred, mse
-     
\ No newline at end of file
+
+    @staticmethod
+    def predict_recursive(model_df, fwr_idx_dict, rolling_window=None):
+        """
+        Same fit/predict for every quarter of fwr_idx_dict, but with the sufficient
+        statistics carried across the windows instead of refitting from scratch.
+        Returns {quarter: (y_actual, y_pred, mse)}.
+        """
+        return recursive_predictions(model_df, fwr_idx_dict, n_features=None, rolling_window=rolling_window)
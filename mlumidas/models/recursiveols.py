@@ -0,0 +1,86 @@
+import numpy as np
+
+
+class RecursiveOLS:
+    """
+    OLS sufficient statistics that are carried across training windows.
+
+    Keeps the Gram matrix of the augmented design A = [const, X, y], i.e.
+    X'X, X'y and y'y in one (k+2)x(k+2) array. Rows are added with rank-one
+    updates and removed with rank-one downdates, so moving a window by one
+    quarter costs O(k^2) regardless of the sample length.
+
+    Any column subset can be estimated from the statistics alone; for a chain
+    of nested column prefixes one Cholesky factorisation gives the RSS of
+    every prefix.
+    """
+
+    rank_tol = 1e-10
+
+    def __init__(self, n_features):
+        self.n_features = n_features
+        self.gram = np.zeros((n_features + 2, n_features + 2))
+        self.nobs = 0
+
+    # ---------- Updating ----------
+
+    def _augment(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        return np.column_stack([np.ones(len(y)), X, y])
+
+    def add(self, X, y):
+        """Rank-one update(s): add the rows of (X, y)."""
+        A = self._augment(X, y)
+        self.gram += A.T @ A
+        self.nobs += A.shape[0]
+
+    def remove(self, X, y):
+        """Rank-one downdate(s): drop the rows of (X, y) again."""
+        A = self._augment(X, y)
+        self.gram -= A.T @ A
+        self.nobs -= A.shape[0]
+
+    # ---------- Estimation ----------
+
+    @property
+    def y_idx(self):
+        return self.n_features + 1
+
+    def tss(self):
+        """Centered total sum of squares of y."""
+        sum_y = self.gram[0, self.y_idx]
+        return float(self.gram[self.y_idx, self.y_idx] - sum_y ** 2 / self.nobs)
+
+    def chain_factors(self, base):
+        """
+        Cholesky factor of the sub-Gram for [const, base] and w = L^-1 (X'y).
+        rss of the first p design columns is y'y - sum(w[:p]**2).
+        Returns None if the sub-design is not of full column rank.
+        """
+        cols = [0] + [j + 1 for j in base]
+        G = self.gram[np.ix_(cols, cols)]
+        try:
+            L = np.linalg.cholesky(G)
+        except np.linalg.LinAlgError:
+            return None
+        diag = np.abs(np.diag(L))
+        if diag.min() <= np.sqrt(self.rank_tol) * diag.max():
+            return None
+        w = np.linalg.solve(L, self.gram[cols, self.y_idx])
+        rss_all = self.gram[self.y_idx, self.y_idx] - np.cumsum(w ** 2)
+        return L, w, rss_all
+
+    @staticmethod
+    def params_from_factors(L, w, p):
+        """Coefficients (const first) of the first p design columns."""
+        return np.linalg.solve(L[:p, :p].T, w[:p])
+
+    def solve(self, cols):
+        """(params, rss) for the design [const, X[:, cols]]; None if rank deficient."""
+        factors = self.chain_factors(list(cols))
+        if factors is None:
+            return None
+        L, w, rss_all = factors
+        p = len(cols) + 1
+        return self.params_from_factors(L, w, p), float(rss_all[p - 1])
@@ -0,0 +1,167 @@
+import numpy as np
+from sklearn.metrics import mean_squared_error
+from loguru import logger
+
+from mlumidas.models.umidas import UMidas
+
+
+class UMidasNP(UMidas):
+    """
+    Closed-form NumPy engine for the U-MIDAS spec search.
+
+    The model grids from `get_model_grid_dict` are nested prefix blocks: for a
+    fixed y-block every x-block is a prefix of the longest one. Each chain of
+    nested specs is therefore scored from ONE QR factorisation of
+    [const, longest spec]; the RSS of every prefix falls out of Q'y.
+
+    Same interface as `UMidas`, but only compact coefficient vectors are kept:
+      - fit(spec)              -> np.ndarray of params (const first)
+      - predict(params, spec)  -> (y_actual, y_pred, mse)
+
+    Rank-deficient chains fall back to the statsmodels path of `UMidas`.
+    """
+
+    rank_tol = 1e-10
+
+    def __init__(self, y_var, train_data, test_data, model_grid):
+        super().__init__(y_var, train_data, test_data, model_grid)
+        self._params = {}
+
+    # ---------- Helpers ----------
+
+    @staticmethod
+    def _get_chains(specs):
+        """Group specs into chains whose members are prefixes of the chain base."""
+        chains = []
+        for spec in sorted(specs, key=len, reverse=True):
+            for chain in chains:
+                if chain["base"][:len(spec)] == spec:
+                    chain["specs"].append(spec)
+                    break
+            else:
+                chains.append({"base": spec, "specs": [spec]})
+        return chains
+
+    @staticmethod
+    def _scores(rss, n, p, tss):
+        """Information criteria exactly as statsmodels OLS reports them (const included in p)."""
+        llf = -n / 2.0 * (np.log(2.0 * np.pi) + np.log(rss / n) + 1.0)
+        return {
+            "bic": -2.0 * llf + np.log(n) * p,
+            "aic": -2.0 * llf + 2.0 * p,
+            "adj_r2": 1.0 - (n - 1.0) / (n - p) * rss / tss,
+        }
+
+    def _score_chain(self, y, X_all, chain):
+        base = list(chain["base"])
+        D = np.column_stack([np.ones(len(y)), X_all[:, base]])
+        Q, R = np.linalg.qr(D)
+
+        diag = np.abs(np.diag(R))
+        if diag.size == 0 or diag.min() <= self.rank_tol * diag.max():
+            return None
+
+        z = Q.T @ y
+        rss_all = float(y @ y) - np.cumsum(z ** 2)
+        return R, z, rss_all
+
+    def _score_chain_sm(self, y, X_all, chain):
+        """Legacy statsmodels scoring for chains that are not of full column rank."""
+        out = {}
+        for spec in chain["specs"]:
+            model = super().fit(spec)
+            out[spec] = (
+                {c: self._extract_score(model, c) for c in self.criteria},
+                np.asarray(model.params, dtype=float),
+            )
+        return out
+
+    # ---------- Core API ----------
+
+    def get_best(self):
+        y, X_all = self.to_yX_np(self.train_data)
+        y = np.asarray(y, dtype=float)
+        X_all = np.asarray(X_all, dtype=float)
+        X_columns = self.train_data.columns[1:]
+        n = len(y)
+        tss = float(((y - y.mean()) ** 2).sum())
+
+        valid_specs = []
+        for spec in self.model_grid:
+            if max(spec) >= X_all.shape[1]:
+                logger.warning(f"Skipping spec {spec} — index {max(spec)} exceeds available columns ({X_all.shape[1]})")
+                continue
+            valid_specs.append(tuple(spec))
+
+        # ---- score every spec, chain by chain ----
+        spec_scores = {}
+        spec_factors = {}
+        for chain in self._get_chains(valid_specs):
+            try:
+                factors = self._score_chain(y, X_all, chain)
+                if factors is None:
+                    logger.debug(f"Chain {chain['base']} is rank deficient; using statsmodels fallback.")
+                    for spec, (scores, params) in self._score_chain_sm(y, X_all, chain).items():
+                        spec_scores[spec] = scores
+                        self._params[spec] = params
+                    continue
+
+                R, z, rss_all = factors
+                for spec in chain["specs"]:
+                    p = len(spec) + 1
+                    spec_scores[spec] = self._scores(rss_all[p - 1], n, p, tss)
+                    spec_factors[spec] = (R, z, p)
+            except Exception as e:
+                logger.warning(f"Failed to fit chain with base spec {chain['base']}: {e}")
+                continue
+
+        # ---- pick winners in grid order (strict improvement, as in UMidas) ----
+        for spec in valid_specs:
+            if spec not in spec_scores:
+                continue
+            for crit in self.criteria:
+                score = spec_scores[spec][crit]
+                is_better = (
+                    score < self.best_models_by_criterion[crit]["score"]
+                    if crit in {"bic", "aic"}
+                    else score > self.best_models_by_criterion[crit]["score"]
+                )
+                if is_better:
+                    self.best_models_by_criterion[crit] = {
+                        "score": float(score),
+                        "spec": spec,
+                        "variable_names": [X_columns[i] for i in spec],
+                        "summary": None,
+                        "model": None,
+                    }
+
+        # ---- back out coefficients for the winners only ----
+        for crit in self.criteria:
+            spec = self.best_models_by_criterion[crit]["spec"]
+            if spec is None or spec in self._params:
+                continue
+            R, z, p = spec_factors[spec]
+            self._params[spec] = np.linalg.solve(R[:p, :p], z[:p])
+
+        return self.best_models_by_criterion
+
+    def fit(self, spec):
+        spec = tuple(spec)
+        if spec not in self._params:
+            y, X_all = self.to_yX_np(self.train_data)
+            X_spec = np.column_stack([np.ones(len(y)), np.asarray(X_all, dtype=float)[:, list(spec)]])
+            self._params[spec] = np.linalg.lstsq(X_spec, np.asarray(y, dtype=float), rcond=None)[0]
+        return self._params[spec]
+
+    def predict(self, params, spec):
+        X_test_full = self.test_data.iloc[:, 1:].values
+        x_spec = np.concatenate([[1.0], np.asarray(X_test_full[0, list(spec)], dtype=float)])
+
+        if x_spec.shape[0] != len(params):
+            raise ValueError(f"Mismatch: test has {x_spec.shape[0]} cols, model expects {len(params)}.")
+
+        y_actual = self.test_data.iloc[0, 0]
+        y_pred = float(x_spec @ params)
+        mse = mean_squared_error([y_actual], [y_pred])
+
+        return y_actual, y_pred, mse
@@ -0,0 +1,179 @@
+import numpy as np
+from sklearn.metrics import mean_squared_error
+from loguru import logger
+
+from mlumidas.models.umidasnp import UMidasNP
+from mlumidas.models.recursiveols import RecursiveOLS
+
+
+class UMidasRLS:
+    """
+    Recursive U-MIDAS spec search over a sequence of training windows.
+
+    One instance follows one (series, period) model frame through the nowcast
+    quarters. The sufficient statistics (X'X, X'y, y'y) are carried forward
+    and only the rows that enter (or, with `rolling_window`, leave) the window
+    are applied as rank-one updates/downdates. Information criteria, the
+    winning coefficients and the one-step prediction all come from the
+    updated statistics.
+
+    Selection mirrors `UMidas.get_best` (grid order, strict improvement).
+    Windows where a spec chain is rank deficient fall back to `UMidasNP`.
+    Rows with a missing (non-finite) value never enter the statistics: a single
+    NaN would otherwise stay in X'X for every later window.
+    """
+
+    criteria = ["bic", "aic", "adj_r2"]
+
+    def __init__(self, y_var, model_df, model_grid, rolling_window=None):
+        self.y_var = y_var
+        self.model_df = model_df
+        self.model_grid = model_grid
+        self.rolling_window = rolling_window
+
+        self._y = model_df.iloc[:, 0].to_numpy(dtype=float)
+        self._X = model_df.iloc[:, 1:].to_numpy(dtype=float)
+        self.X_columns = model_df.columns[1:]
+        self._finite = np.isfinite(self._y) & np.isfinite(self._X).all(axis=1)
+
+        self.valid_specs = []
+        for spec in model_grid:
+            if max(spec) >= self._X.shape[1]:
+                logger.warning(f"Skipping spec {spec} — index {max(spec)} exceeds available columns ({self._X.shape[1]})")
+                continue
+            self.valid_specs.append(tuple(spec))
+        self.chains = UMidasNP._get_chains(self.valid_specs)
+
+        self.stats = RecursiveOLS(self._X.shape[1])
+        self._included = set()
+
+    # ---------- Window bookkeeping ----------
+
+    def _window_positions(self, train_idx):
+        pos = self.model_df.index.get_indexer(train_idx)
+        if (pos < 0).any():
+            missing = [train_idx[i] for i in np.flatnonzero(pos < 0)]
+            raise KeyError(f"{len(missing)} training dates not in model frame, e.g. {missing[:3]}")
+        if self.rolling_window:
+            pos = pos[-int(self.rolling_window):]
+        return pos
+
+    def update(self, train_idx):
+        """Move the statistics to the window given by train_idx (rank-one updates/downdates)."""
+        pos = self._window_positions(train_idx)
+        finite = self._finite[pos]
+        if not finite.all():
+            logger.debug(f"Skipping {int((~finite).sum())} training rows with missing values.")
+        window = set(pos[finite].tolist())
+        to_add = sorted(window - self._included)
+        to_remove = sorted(self._included - window)
+        if to_add:
+            self.stats.add(self._X[to_add], self._y[to_add])
+        if to_remove:
+            self.stats.remove(self._X[to_remove], self._y[to_remove])
+        self._included = window
+        return sorted(window)
+
+    # ---------- Core API ----------
+
+    def get_best(self, train_idx):
+        positions = self.update(train_idx)
+        n = self.stats.nobs
+        tss = self.stats.tss()
+
+        best = {
+            c: {
+                "score": np.inf if c != "adj_r2" else -np.inf,
+                "spec": None,
+                "variable_names": None,
+                "params": None,
+            } for c in self.criteria
+        }
+
+        spec_scores = {}
+        spec_factors = {}
+        for chain in self.chains:
+            factors = self.stats.chain_factors(chain["base"])
+            if factors is None:
+                logger.debug(f"Chain {chain['base']} is rank deficient; refitting window with UMidasNP.")
+                return self._get_best_np(positions)
+            L, w, rss_all = factors
+            for spec in chain["specs"]:
+                p = len(spec) + 1
+                spec_scores[spec] = UMidasNP._scores(rss_all[p - 1], n, p, tss)
+                spec_factors[spec] = (L, w, p)
+
+        for spec in self.valid_specs:
+            for crit in self.criteria:
+                score = spec_scores[spec][crit]
+                is_better = (
+                    score < best[crit]["score"]
+                    if crit in {"bic", "aic"}
+                    else score > best[crit]["score"]
+                )
+                if is_better:
+                    best[crit] = {
+                        "score": float(score),
+                        "spec": spec,
+                        "variable_names": [self.X_columns[i] for i in spec],
+                        "params": None,
+                    }
+
+        for crit in self.criteria:
+            spec = best[crit]["spec"]
+            if spec is not None:
+                best[crit]["params"] = RecursiveOLS.params_from_factors(*spec_factors[spec])
+
+        self.best_models_by_criterion = best
+        return best
+
+    def _get_best_np(self, positions):
+        train_data = self.model_df.iloc[positions]
+        model = UMidasNP(self.y_var, train_data, self.model_df.iloc[:0], self.model_grid)
+        best = model.get_best()
+        for crit in self.criteria:
+            spec = best[crit]["spec"]
+            best[crit]["params"] = model.fit(spec) if spec is not None else None
+        self.best_models_by_criterion = best
+        return best
+
+    def pinv_params(self, positions, cols):
+        """Minimum-norm OLS coefficients (const first) over the given rows, via pinv as statsmodels OLS."""
+        A = np.column_stack([np.ones(len(positions)), self._X[np.ix_(positions, cols)]])
+        return np.linalg.pinv(A, rcond=1e-15) @ self._y[positions]
+
+    def predict(self, params, spec, test_idx):
+        test_data = self.model_df.loc[test_idx]
+        x_spec = np.concatenate([[1.0], test_data.iloc[0, 1:].to_numpy(dtype=float)[list(spec)]])
+
+        y_actual = test_data.iloc[0, 0]
+        y_pred = float(x_spec @ params)
+        mse = mean_squared_error([y_actual], [y_pred])
+
+        return y_actual, y_pred, mse
+
+
+def recursive_predictions(model_df, fwr_idx_dict, n_features=None, rolling_window=None):
+    """
+    One-step predictions of the full OLS on [const, model_df.iloc[:, 1:1+n_features]]
+    for every quarter in fwr_idx_dict, carrying the sufficient statistics forward.
+    A quarter whose design is rank deficient is solved from its window's rows
+    with the pseudo-inverse instead (as statsmodels OLS does).
+
+    Returns {quarter: (y_actual, y_pred, mse)}.
+    """
+    df = model_df if n_features is None else model_df.iloc[:, :1 + n_features]
+    model = UMidasRLS(y_var=df.columns[0], model_df=df, model_grid=[], rolling_window=rolling_window)
+    cols = list(range(df.shape[1] - 1))
+
+    out = {}
+    for quarter in sorted(fwr_idx_dict):
+        positions = model.update(fwr_idx_dict[quarter]["train_idx"])
+        solved = model.stats.solve(cols)
+        if solved is None:
+            logger.debug(f"Design is rank deficient for quarter {quarter}; solving the window with pinv.")
+            params = model.pinv_params(positions, cols)
+        else:
+            params, _ = solved
+        out[quarter] = model.predict(params, cols, fwr_idx_dict[quarter]["test_idx"])
+    return out
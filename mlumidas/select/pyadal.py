@@ -11,6 +11,8 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from asgl import Regressor
 
+from mlumidas.select.warmstart import narrow_alpha_grid, hit_window_edge, make_state
+
 SelectionRule = Literal["pt", "cv_min", "cv_se", "cv_1se", "k_ic"]  # kept for API-compat only
 
 
@@ -32,6 +34,10 @@ class PYADAL:
         Kept for parity; not passed to asgl (its solver handles iterations internally).
     with_mean, with_std : bool
     fit_intercept : bool
+    prior_state : Optional[dict]
+        From `get_state()` of the previous fit; narrows the lambda1 grid to
+        `prior_alpha_span` decades around the previous lambda1* (full grid again
+        if lambda1* lands on the window edge). asgl has no coefficient warm start.
     """
 
     # ---- EN/CV-like hyperparams (kept for API compatibility) ----
@@ -52,6 +58,12 @@ class PYADAL:
     coef_tol: float = 0.0
     k_indicators: Optional[int] = None
 
+    # warm start from the previous (quarter, period) fit
+    prior_state: Optional[dict] = None
+    prior_alpha_span: float = 0.5
+
+    n_jobs: int = -1                                 # GridSearchCV processes
+
     # ---- Fitted attributes ----
     pipeline_cv_: Optional[GridSearchCV] = None
     pipeline_: Optional[Pipeline] = None
@@ -136,18 +148,24 @@ class PYADAL:
 
         # >>> EXACTLY the asgl example grid (namespaced via pipeline step):
         # param_grid = {'lambda1': 10 ** np.arange(-2, 1.51, 0.1)}
-        param_grid = {
-            "alasso__lambda1": 10 ** np.arange(-2, 1.51, 0.1)
-        }
+        full_grid = 10 ** np.arange(-2, 1.51, 0.1)
+        lambda_grid = narrow_alpha_grid(full_grid, self.prior_state, self.prior_alpha_span)
+
+        def _grid_search(grid_values):
+            gs = GridSearchCV(
+                estimator=pipe,
+                param_grid={"alasso__lambda1": grid_values},
+                scoring="neg_mean_squared_error",
+                cv=tscv,
+                n_jobs=self.n_jobs,
+            )
+            gs.fit(X.values, y.values)
+            return gs
 
-        gs = GridSearchCV(
-            estimator=pipe,
-            param_grid=param_grid,
-            scoring="neg_mean_squared_error",
-            cv=tscv,
-            n_jobs=-1,
-        )
-        gs.fit(X.values, y.values)
+        gs = _grid_search(lambda_grid)
+        if hit_window_edge(gs.best_params_["alasso__lambda1"], lambda_grid, full_grid):
+            logger.debug("lambda1* on the edge of the warm-start window; searching the full grid.")
+            gs = _grid_search(full_grid)
 
         # Store CV / best pipeline
         self.pipeline_cv_ = gs
@@ -185,6 +203,10 @@ class PYADAL:
         X_new = X_new[self.feature_names_]
         return self.pipeline_.predict(X_new.values)
 
+    def get_state(self) -> dict:
+        """Prior state for the next fit (coef, active set, lambda1*)."""
+        return make_state(self.coef_series_, self.best_alpha_)
+
     def get_result(self) -> dict:
         # Keys mirror PYENTSCV so downstream code can consume it unchanged
         return {
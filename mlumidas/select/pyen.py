@@ -10,6 +10,9 @@ from sklearn.linear_model import ElasticNet
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 
+from mlumidas.select.warmstart import align_prior_coef, make_state
+from mlumidas.select.screening import GAP_TOL, center_for_enet, screened_enet_fit
+
 SelectionRule = Literal["pt", "cv_min", "cv_se", "cv_1se"]  # kept for backward-compat
 
 
@@ -18,6 +21,16 @@ class PYEN:
     """
     Elastic Net (or Lasso when l1_ratio=1.0) WITHOUT cross-validation.
     Uses a user-provided `lambda_fix` (alpha) directly.
+
+    prior_state (from `get_state()` of the previous fit) seeds coordinate descent
+    with the previous coefficients.
+
+    screening=True solves on the features kept by sequential strong rules to a relative
+    duality gap of GAP_TOL, accepts the solution only if the gap of the FULL problem passes
+    too (see `mlumidas.select.screening`) and seeds the ElasticNet fit with it, i.e. the fit
+    is the optimum an unscreened solve at GAP_TOL reaches. If the check fails within
+    max_iter, the fit is the plain unscreened one. `n_screened_` reports how many features
+    were left out.
     """
 
     # Core hyperparameters
@@ -32,6 +45,8 @@ class PYEN:
     threshold_divisor: float
     coef_tol: float
     lambda_fix: float  # fixed alpha; must be > 0
+    prior_state: Optional[dict] = None  # warm start from the previous (quarter, period) fit
+    screening: bool = True              # strong-rule screening, checked on the full problem
 
     # Fitted attributes (kept for API compatibility)
     pipeline_cv_: Optional[any] = None         # always None here
@@ -42,6 +57,7 @@ class PYEN:
     coef_series_selected_: Optional[pd.Series] = None
     selected_features_: Optional[list[str]] = None
     best_alpha_: Optional[float] = None
+    n_screened_: Optional[int] = None
 
     # ---------- Helpers (same selection behavior as before) ----------
 
@@ -89,15 +105,32 @@ class PYEN:
         if not np.isfinite(self.best_alpha_) or self.best_alpha_ <= 0:
             raise ValueError("lambda_fix must be a positive finite float (> 0).")
 
+        en = ElasticNet(
+            alpha=self.best_alpha_,
+            l1_ratio=self.l1_ratio,
+            fit_intercept=self.fit_intercept,
+            max_iter=self.max_iter,
+            random_state=self.random_state,
+        )
+        coef_init = align_prior_coef(self.prior_state, X.columns)
+        self.n_screened_ = 0
+        if self.screening:
+            Xs = StandardScaler(with_mean=self.with_mean, with_std=self.with_std).fit_transform(X.to_numpy(dtype=float))
+            Xc, yc, _, _ = center_for_enet(Xs, y.to_numpy(dtype=float), self.fit_intercept)
+            coef, n_screened, converged = screened_enet_fit(
+                Xc, yc, self.best_alpha_, self.l1_ratio, max_iter=self.max_iter, tol=GAP_TOL, coef_init=coef_init,
+            )
+            if converged:
+                coef_init, self.n_screened_ = coef, n_screened
+            else:
+                logger.warning(f"Screened solve did not reach GAP_TOL within max_iter={self.max_iter}; fitting unscreened.")
+        if coef_init is not None:
+            en.set_params(warm_start=True)
+            en.coef_ = coef_init
+
         final_pipe = make_pipeline(
             StandardScaler(with_mean=self.with_mean, with_std=self.with_std),
-            ElasticNet(
-                alpha=self.best_alpha_,
-                l1_ratio=self.l1_ratio,
-                fit_intercept=self.fit_intercept,
-                max_iter=self.max_iter,
-                random_state=self.random_state,
-            ),
+            en,
         ).fit(X, y)
 
         en: ElasticNet = final_pipe.named_steps["elasticnet"]
@@ -116,17 +149,23 @@ class PYEN:
 
         logger.info(
             "EN fit completed (no-CV) | l1_ratio={:.3f} | alpha={:.6g} | rule={} | "
-            "threshold_divisor={} | coef_tol={} | selected={}".format(
+            "threshold_divisor={} | coef_tol={} | selected={} | screened={}/{}".format(
                 self.l1_ratio,
                 self.best_alpha_,
                 self.selection_rule,
                 self.threshold_divisor,
                 self.coef_tol,
                 len(selected),
+                self.n_screened_,
+                X.shape[1],
             )
         )
         return self
 
+    def get_state(self) -> dict:
+        """Prior state for warm-starting the next fit (coef, active set, alpha)."""
+        return make_state(self.coef_series_, self.best_alpha_, self.coef_tol)
+
     def get_result(self) -> dict:
         # Keep payload shape/keys identical to PYENCV for easy swapping
         return {
@@ -143,4 +182,6 @@ class PYEN:
             "se_factor": self.se_factor,
             "threshold_divisor": self.threshold_divisor,
             "coef_tol": self.coef_tol,
+            "screening": self.screening,
+            "n_screened": self.n_screened_,
         }
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, Literal, Optional, Union
+from dataclasses import dataclass, replace
+from typing import Iterable, Literal, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 from loguru import logger
 
-from sklearn.linear_model import ElasticNet
+from sklearn.linear_model import ElasticNet, enet_path
 from sklearn.model_selection import TimeSeriesSplit, GridSearchCV
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 
+from mlumidas.select.warmstart import narrow_alpha_grid, hit_window_edge, align_prior_coef, make_state
+from mlumidas.select.screening import GAP_TOL, center_for_enet, gram_for, screened_enet_path
+from mlumidas.select.reselect import make_surface, select_from_coefs
+
 SelectionRule = Literal["pt", "cv_min", "k_ic"]
+CVMode = Literal["path", "grid"]
 
 
 @dataclass
@@ -22,11 +27,50 @@ class PYENTSCV:
     feature selection rules. Uses a *single* leakage-safe pipeline:
 
         StandardScaler -> ElasticNet
-        (pipeline is cross-validated with GridSearchCV)
+
+    cv_mode:
+      - "path" (default): per fold, the same StandardScaler is fit once and the whole
+                alpha grid is solved as one warm-started regularization path (enet_path),
+                scored by test MSE with the same fold splits and best-alpha rule as
+                GridSearchCV. Other `scoring` values or refit=False fall back to "grid".
+      - "grid": the pipeline is cross-validated with GridSearchCV (one cold ElasticNet
+                fit per alpha and fold).
+    Both refit the final pipeline at alpha* on the full sample, as GridSearchCV(refit=True).
+
+    Every fold fit, path and refit is solved to the same `tol` (default GAP_TOL, a tight
+    relative duality gap). A warm path and a cold fit stopped at ElasticNet's default tol
+    sit at different points short of the optimum, which with more features than samples
+    can move alpha*; solved to GAP_TOL both modes score the same solutions and pick the
+    same alpha*. screening=True drops features before each path solve with sequential
+    strong rules, re-checks the KKT conditions of every dropped feature and the duality
+    gap of the full problem afterwards, and re-solves unscreened if that fails (see
+    `mlumidas.select.screening`): the paths are the same as without screening.
+    `cv_n_screened_` reports how many features were left out; the final refit is never
+    screened (`n_screened_` = 0).
+
+    l1_ratio may be a list: the data are cleaned once and every ratio is fit on them.
+    With cv_mode="path" they are also standardized and split into folds once (plus
+    per-fold Gram matrices when n_samples > n_features) and every ratio is
+    cross-validated on that shared fold data; with cv_mode="grid" each ratio runs its
+    own GridSearchCV, which scales every fold itself, so only the cleaning is shared.
+    Per-ratio fits are in `fits_`, `get_result()` returns {"by_l1_ratio": {ratio: result}},
+    and `prior_state` / `get_state()` are keyed by ratio as well.
+
+    store_cv_surface=True keeps the fold-by-alpha test MSE and the full-sample coefficient
+    path over the same grid (`cv_surface_`, also in `get_result()["cv_surface"]`), so
+    other selection rules, including 1-SE rules, can be applied later without refitting
+    (see `mlumidas.select.reselect`).
+
+    prior_state (from `get_state()` of the previous quarter's fit) narrows the alpha
+    grid to `prior_alpha_span` decades around the previous alpha*. If alpha* lands on
+    the edge of the narrowed window, the full grid is searched again. With
+    cv_mode="path" the previous coefficients also seed every fold path and the refit.
+    GridSearchCV clones its estimator (dropping any coef_), so with cv_mode="grid" the
+    prior only narrows the alpha grid.
     """
 
     # ---- EN/CV hyperparams ----
-    l1_ratio: float
+    l1_ratio: Union[float, Sequence[float]]
     tcv_splits: int
     test_size: Optional[int]
     gap: int
@@ -52,6 +96,14 @@ class PYENTSCV:
     n_jobs: int = -1
     refit: bool = True
     verbose: int = 0
+    cv_mode: CVMode = "path"
+    tol: float = GAP_TOL                             # coordinate-descent tolerance of every fold fit, path and refit
+    screening: bool = True                           # strong-rule screening of the path solves (same paths)
+    store_cv_surface: bool = True                    # keep CV errors + coefficient path for re-selection
+
+    # warm start from the previous (quarter, period) fit
+    prior_state: Optional[dict] = None
+    prior_alpha_span: float = 0.5                    # decades either side of the previous alpha*
 
     # Fitted attributes
     pipeline_: Optional[any] = None                  # best estimator (pipeline)
@@ -60,7 +112,13 @@ class PYENTSCV:
     coef_series_selected_: Optional[pd.Series] = None
     selected_features_: Optional[list[str]] = None
     best_alpha_: Optional[float] = None
-    grid_: Optional[GridSearchCV] = None             # the fitted GridSearchCV
+    grid_: Optional[GridSearchCV] = None             # the fitted GridSearchCV (cv_mode="grid")
+    cv_alphas_: Optional[np.ndarray] = None          # alpha grid (ascending)
+    cv_mse_path_: Optional[np.ndarray] = None        # test MSE, shape (n_alphas, n_folds)
+    cv_n_screened_: Optional[np.ndarray] = None      # features screened out, shape (n_alphas, n_folds) ("path")
+    n_screened_: Optional[int] = None                # features screened out of the final refit
+    fits_: Optional[dict] = None                     # {l1_ratio: fitted PYENTSCV} when l1_ratio is a list
+    cv_surface_: Optional[dict] = None               # compact CV errors + coefficient path (see reselect.make_surface)
 
     # Back-compat aliases (same single pipeline/model)
     pipeline_cv_: Optional[any] = None
@@ -85,39 +143,168 @@ class PYENTSCV:
             raise ValueError("All alphas must be finite and > 0.")
         return np.unique(grid)
 
-    def _apply_pt(self, coefs: pd.Series) -> list[str]:
-        """Paper-style soft-threshold: keep |beta_j| >= max|beta| / threshold_divisor."""
-        if self.threshold_divisor <= 0:
-            raise ValueError("threshold_divisor must be > 0 when using 'pt'.")
-        if coefs.size == 0:
-            return []
-        max_abs = float(np.nanmax(np.abs(coefs.values)))
-        if not np.isfinite(max_abs) or max_abs == 0.0:
-            return []
-        threshold = max_abs / self.threshold_divisor
-        mask = np.abs(coefs.values) >= threshold
-        return list(coefs.index[mask])
-
     def _select_features(self, coefs: pd.Series) -> list[str]:
         """Apply configured selection rule to the coefficient vector."""
-        rule = self.selection_rule
-        if rule == "pt":
-            return self._apply_pt(coefs)
-        elif rule == "k_ic":
-            base = coefs[np.abs(coefs.values) > self.coef_tol]
-            if base.empty:
-                return []
-            k = 0 if self.k_indicators is None else int(self.k_indicators)
-            if k <= 0:
-                return []
-            topk_idx = np.argsort(-np.abs(base.values))[:k]
-            return list(base.index[topk_idx])
-        else:  # 'cv_min'
-            mask = np.abs(coefs.values) > self.coef_tol
-            return list(coefs.index[mask])
+        return select_from_coefs(coefs, self.selection_rule, self.threshold_divisor, self.coef_tol, self.k_indicators)
+
+    def _make_pipeline(self, alpha: Optional[float] = None, coef_init: Optional[np.ndarray] = None):
+        en = ElasticNet(
+            l1_ratio=self.l1_ratio,
+            max_iter=self.max_iter,
+            tol=self.tol,
+            fit_intercept=self.fit_intercept,
+            random_state=self.random_state,
+        )
+        if alpha is not None:
+            en.set_params(alpha=alpha)
+        if coef_init is not None:
+            en.set_params(warm_start=True)
+            en.coef_ = coef_init.copy()
+        return make_pipeline(StandardScaler(with_mean=self.with_mean, with_std=self.with_std), en)
+
+    def _standardized(self, X_tr: np.ndarray, y_tr: np.ndarray, X_te: Optional[np.ndarray] = None) -> dict:
+        """Scaled + centered training data (and scaled test data); independent of l1_ratio and alpha."""
+        scaler = StandardScaler(with_mean=self.with_mean, with_std=self.with_std).fit(X_tr)
+        Xc, yc, X_off, y_off = center_for_enet(scaler.transform(X_tr), y_tr, self.fit_intercept)
+        return {
+            "Xc": Xc, "yc": yc, "X_off": X_off, "y_off": y_off,
+            "Xs_te": None if X_te is None else scaler.transform(X_te),
+            "gram": gram_for(Xc, yc),
+        }
+
+    def _prepare_data(self, X_num: pd.DataFrame, y: pd.Series, tscv: TimeSeriesSplit) -> dict:
+        """Fold splits, per-fold standardized data and the full-sample standardized data, computed once."""
+        X_arr = X_num.to_numpy(dtype=float)
+        y_arr = np.asarray(y, dtype=float)
+        folds = []
+        for tr, te in tscv.split(X_arr):
+            fold = self._standardized(X_arr[tr], y_arr[tr], X_arr[te])
+            fold.update(tr=tr, te=te, y_te=y_arr[te])
+            folds.append(fold)
+        return {"X_arr": X_arr, "y_arr": y_arr, "folds": folds, "full": self._standardized(X_arr, y_arr)}
+
+    def _fold_path_mse(self, fold: dict, alpha_grid: np.ndarray, coef_init: Optional[np.ndarray] = None):
+        """
+        Test MSE for every alpha of one fold, from a single warm-started path (descending alphas).
+        Returns (mse, n_screened), both in grid order.
+        """
+        Xc, yc, X_off, y_off = fold["Xc"], fold["yc"], fold["X_off"], fold["y_off"]
+        gram = fold["gram"]
+
+        alphas_desc = alpha_grid[::-1]
+        if self.screening:
+            _, coefs, n_screened, _ = screened_enet_path(
+                Xc, yc, self.l1_ratio,
+                alphas=alphas_desc,
+                max_iter=self.max_iter,
+                tol=self.tol,
+                coef_init=coef_init,
+                gram=gram,
+            )
+        else:
+            _, coefs, _ = enet_path(
+                Xc, yc,
+                l1_ratio=self.l1_ratio,
+                alphas=alphas_desc,
+                precompute=False if gram is None else gram[0],
+                Xy=None if gram is None else gram[1],
+                max_iter=self.max_iter,
+                tol=self.tol,
+                coef_init=None if coef_init is None else np.array(coef_init, dtype=float),  # cd updates it in place
+                check_input=False,
+            )
+            n_screened = np.zeros(len(alphas_desc), dtype=int)
+        # coefs: (n_features, n_alphas) in descending-alpha order -> back to grid order
+        coefs = coefs[:, ::-1]
+        intercepts = y_off - X_off @ coefs
+        preds = fold["Xs_te"] @ coefs + intercepts
+        return ((fold["y_te"][:, None] - preds) ** 2).mean(axis=0), n_screened[::-1]
+
+    def _full_coef_path(self, X_num: pd.DataFrame, y: pd.Series, alpha_grid: np.ndarray,
+                        data: Optional[dict] = None) -> np.ndarray:
+        """Full-sample coefficients (scaled space) for every alpha of the grid, (n_features, n_alphas)."""
+        full = data["full"] if data is not None else self._standardized(X_num.to_numpy(dtype=float), np.asarray(y, dtype=float))
+        if self.screening:
+            _, coefs, _, _ = screened_enet_path(
+                full["Xc"], full["yc"], self.l1_ratio,
+                alphas=alpha_grid, max_iter=self.max_iter, tol=self.tol, gram=full["gram"],
+            )
+        else:
+            _, coefs, _ = enet_path(
+                full["Xc"], full["yc"], l1_ratio=self.l1_ratio, alphas=alpha_grid[::-1],
+                max_iter=self.max_iter, tol=self.tol, check_input=False,
+            )
+        return coefs[:, ::-1]  # descending -> grid order
+
+    def _path_cv(self, data: dict, alpha_grid: np.ndarray, coef_init: Optional[np.ndarray] = None) -> float:
+        fold_results = [self._fold_path_mse(fold, alpha_grid, coef_init) for fold in data["folds"]]
+        mse_path = np.column_stack([mse for mse, _ in fold_results])
+        self.cv_n_screened_ = np.column_stack([n_screened for _, n_screened in fold_results])
+
+        # GridSearchCV rule: highest mean score (-MSE); ties -> first alpha in grid order
+        mean_score = -mse_path.mean(axis=1)
+        mean_score = np.where(np.isfinite(mean_score), mean_score, -np.inf)
+        best_idx = int(np.flatnonzero(mean_score == mean_score.max())[0])
+
+        self.cv_alphas_ = alpha_grid
+        self.cv_mse_path_ = mse_path
+        return float(alpha_grid[best_idx])
+
+    def _cv(self, X_num: pd.DataFrame, y: pd.Series, tscv: TimeSeriesSplit, alpha_grid: np.ndarray,
+            coef_init: Optional[np.ndarray] = None, data: Optional[dict] = None):
+        """alpha*, refit best pipeline and (grid mode) the fitted GridSearchCV."""
+        cv_mode = self.cv_mode
+        if cv_mode == "path" and (self.scoring != "neg_mean_squared_error" or not self.refit):
+            logger.warning(f"cv_mode='path' scores by MSE and always refits; using 'grid' for scoring={self.scoring!r}, refit={self.refit}.")
+            cv_mode = "grid"
+
+        if cv_mode == "path":
+            if data is None:
+                data = self._prepare_data(X_num, y, tscv)
+            best_alpha = self._path_cv(data, alpha_grid, coef_init)
+            # refit exactly as GridSearchCV(refit=True) would
+            self.n_screened_ = 0
+            best_pipe = self._make_pipeline(best_alpha, coef_init).fit(X_num, y)
+            return best_alpha, best_pipe, None
+
+        if cv_mode == "grid":
+            # ---- Pipeline: Standardize X -> ElasticNet (no internal CV) ----
+            # (unseeded: GridSearchCV clones it, so coef_init would be dropped anyway)
+            pipe = self._make_pipeline()
+
+            # ---- Param grid (alphas) ----
+            param_grid = {"elasticnet__alpha": alpha_grid}
+
+            # ---- GridSearchCV over the *pipeline* ----
+            grid = GridSearchCV(
+                estimator=pipe,
+                param_grid=param_grid,
+                scoring=self.scoring,
+                cv=tscv,
+                n_jobs=self.n_jobs,
+                refit=self.refit,
+                verbose=self.verbose,
+            )
+
+            grid.fit(X_num, y)
+
+            self.cv_n_screened_ = None
+            self.n_screened_ = 0
+            self.cv_alphas_ = alpha_grid
+            self.cv_mse_path_ = -np.column_stack([
+                grid.cv_results_[f"split{i}_test_score"] for i in range(self.tcv_splits)
+            ])
+            return float(grid.best_params_["elasticnet__alpha"]), grid.best_estimator_, grid
+
+        raise ValueError(f"Unknown cv_mode '{self.cv_mode}'. Use 'path' or 'grid'.")
 
     # ---------- Core API ----------
 
+    def _l1_ratio_list(self) -> Optional[list]:
+        if isinstance(self.l1_ratio, (list, tuple, np.ndarray)):
+            return list(self.l1_ratio)
+        return None
+
     def fit(self, X: pd.DataFrame, y: pd.Series | pd.DataFrame):
         # ---- Validate types ----
         if not isinstance(X, pd.DataFrame):
@@ -130,22 +317,27 @@ class PYENTSCV:
             y = y.iloc[:, 0]
 
         # ---- Coerce to numeric & drop pathological columns ----
-        X_num = X.apply(pd.to_numeric, errors="coerce")
-        # columns with any inf or values exceeding float64 range
-        max_float64 = np.finfo(np.float64).max
-        bad_inf = np.isinf(X_num).any(axis=0)
-        bad_big = X_num.abs().gt(max_float64).any(axis=0)
-        bad_allnan = X_num.isna().all(axis=0)
-        bad_cols_mask = bad_inf | bad_big | bad_allnan
+        # (already-float frames, e.g. RaggedEdgePanel slices, skip the per-column coercion)
+        if all(pd.api.types.is_float_dtype(dt) for dt in X.dtypes):
+            X_num = X
+        else:
+            X_num = X.apply(pd.to_numeric, errors="coerce")
+        values = X_num.to_numpy(dtype=float)
+        # columns with any inf (values beyond the float64 range are inf after the cast)
+        bad_inf = np.isinf(values).any(axis=0)
+        is_nan = np.isnan(values)
+        bad_allnan = is_nan.all(axis=0)
+        bad_cols_mask = bad_inf | bad_allnan
         if bad_cols_mask.any():
-            bad_cols = list(X.columns[bad_cols_mask.values])
+            bad_cols = list(X.columns[bad_cols_mask])
             for col in bad_cols:
                 logger.warning(f"Removing feature '{col}' (inf/too-large/all-NaN).")
             X_num = X_num.drop(columns=bad_cols)
+            is_nan = is_nan[:, ~bad_cols_mask]
 
         # any remaining NaNs? (You can swap this for an imputer if desired.)
-        if X_num.isna().any().any():
-            n_bad = int(X_num.isna().sum().sum())
+        if is_nan.any():
+            n_bad = int(is_nan.sum())
             raise ValueError(f"Found {n_bad} NaNs in X after cleaning. "
                              "Impute or drop rows/columns before fitting.")
 
@@ -165,40 +357,33 @@ class PYENTSCV:
             gap=self.gap,
         )
 
-        # ---- Pipeline: Standardize X -> ElasticNet (no internal CV) ----
-        pipe = make_pipeline(
-            StandardScaler(with_mean=self.with_mean, with_std=self.with_std),
-            ElasticNet(
-                l1_ratio=self.l1_ratio,
-                max_iter=self.max_iter,
-                fit_intercept=self.fit_intercept,
-                random_state=self.random_state,
-            ),
-        )
+        l1_ratios = self._l1_ratio_list()
+        if l1_ratios is not None:
+            return self._fit_ratios(X_num, y, tscv, l1_ratios)
+        return self._fit_prepared(X_num, y, tscv)
 
-        # ---- Param grid (alphas) ----
-        alpha_grid = self._normalize_alpha_grid()
-        param_grid = {"elasticnet__alpha": alpha_grid}
-
-        # ---- GridSearchCV over the *pipeline* ----
-        grid = GridSearchCV(
-            estimator=pipe,
-            param_grid=param_grid,
-            scoring=self.scoring,
-            cv=tscv,
-            n_jobs=self.n_jobs,
-            refit=self.refit,
-            verbose=self.verbose,
-        )
+    def _fit_ratios(self, X_num: pd.DataFrame, y: pd.Series, tscv: TimeSeriesSplit, l1_ratios: list):
+        """One fit per l1_ratio on the cleaned data; folds / standardized data are shared in "path" mode only."""
+        data = self._prepare_data(X_num, y, tscv) if self.cv_mode == "path" else None
+        prior_states = self.prior_state or {}
 
-        grid.fit(X_num, y)
+        self.fits_ = {}
+        for ratio in l1_ratios:
+            sub = replace(self, l1_ratio=float(ratio), prior_state=prior_states.get(ratio), fits_=None)
+            self.fits_[ratio] = sub._fit_prepared(X_num, y, tscv, data)
+        return self
 
-        # best pipeline & model
-        best_pipe = grid.best_estimator_
-        en_best: ElasticNet = best_pipe.named_steps["elasticnet"]
+    def _fit_prepared(self, X_num: pd.DataFrame, y: pd.Series, tscv: TimeSeriesSplit, data: Optional[dict] = None):
+        full_grid = self._normalize_alpha_grid()
+        alpha_grid = narrow_alpha_grid(full_grid, self.prior_state, self.prior_alpha_span)
+        coef_init = align_prior_coef(self.prior_state, X_num.columns)
 
-        # store alpha*
-        best_alpha = float(grid.best_params_["elasticnet__alpha"])
+        best_alpha, best_pipe, grid = self._cv(X_num, y, tscv, alpha_grid, coef_init, data)
+        if hit_window_edge(best_alpha, alpha_grid, full_grid):
+            logger.debug(f"alpha*={best_alpha:.6g} on the edge of the warm-start window; searching the full grid.")
+            best_alpha, best_pipe, grid = self._cv(X_num, y, tscv, full_grid, coef_init, data)
+
+        en_best: ElasticNet = best_pipe.named_steps["elasticnet"]
 
         # coefficients aligned to surviving columns
         coefs = pd.Series(en_best.coef_, index=X_num.columns, dtype=float)
@@ -215,6 +400,16 @@ class PYENTSCV:
         self.selected_features_ = selected
         self.best_alpha_ = best_alpha
         self.grid_ = grid
+        self.cv_surface_ = None
+        if self.store_cv_surface:
+            self.cv_surface_ = make_surface(
+                self.cv_alphas_,
+                self.cv_mse_path_,
+                self._full_coef_path(X_num, y, self.cv_alphas_, data),
+                X_num.columns,
+                best_alpha,
+                coefs.to_numpy(),
+            )
 
         # Back-compat aliases
         self.pipeline_cv_ = best_pipe
@@ -222,18 +417,28 @@ class PYENTSCV:
 
         logger.info(
             "EN (TSCV) fit completed | l1_ratio={:.3f} | alpha*={:.6g} | rule={} | "
-            "threshold_divisor={} | coef_tol={} | selected={}".format(
+            "threshold_divisor={} | coef_tol={} | selected={} | screened={}/{}".format(
                 self.l1_ratio,
                 self.best_alpha_,
                 self.selection_rule,
                 self.threshold_divisor,
                 self.coef_tol,
                 len(selected),
+                self.n_screened_,
+                X_num.shape[1],
             )
         )
         return self
 
+    def get_state(self) -> dict:
+        """Prior state for warm-starting the next fit (coef, active set, alpha*); keyed by ratio for a list."""
+        if self.fits_ is not None:
+            return {ratio: fit.get_state() for ratio, fit in self.fits_.items()}
+        return make_state(self.coef_series_, self.best_alpha_, self.coef_tol)
+
     def get_result(self) -> dict:
+        if self.fits_ is not None:
+            return {"by_l1_ratio": {ratio: fit.get_result() for ratio, fit in self.fits_.items()}}
         return {
             "selected_features": self.selected_features_,
             "coef_series": self.coef_series_,
@@ -257,8 +462,14 @@ class PYENTSCV:
             "with_std": self.with_std,
             "random_state": self.random_state,
             "max_iter": self.max_iter,
+            "tol": self.tol,
             "alphas": self._normalize_alpha_grid(),
             "scoring": self.scoring,
             "n_jobs": self.n_jobs,
             "refit": self.refit,
+            "cv_mode": self.cv_mode,
+            "screening": self.screening,
+            "n_screened": self.n_screened_,
+            "cv_n_screened": self.cv_n_screened_,
+            "cv_surface": self.cv_surface_,
         }
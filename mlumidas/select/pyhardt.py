@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 from loguru import logger
 import statsmodels.api as sm
+from scipy import stats
 
 
 @dataclass
@@ -23,6 +24,13 @@ class PYHARDT:
       - If k_indicators > 0: choose the top-k by |t|.
       - Else: choose all with p <= 1 - significance_level.
 
+    Engines:
+      - "fwl" (default): Frisch–Waugh–Lovell. y and every candidate are residualized on
+        [const, y-lags] once; all slopes, t- and p-values then come from column-wise dot
+        products. Identical to the per-candidate OLS whenever candidates share y's sample.
+        Candidates with missing values on that sample fall back to the per-candidate OLS.
+      - "ols": one statsmodels OLS per candidate (original implementation).
+
     Parameters
     ----------
     y_var : str
@@ -34,6 +42,8 @@ class PYHARDT:
         Examples: α=0.95 → p<=0.05 ; α=0.99 → p<=0.01.
     k_indicators : int | None
         If >0, pick top-k by |t| (ignores α).
+    engine : {"fwl", "ols"}
+        How the per-candidate t-stats are computed (see above).
 
     Attributes after fit()
     ----------------------
@@ -50,6 +60,7 @@ class PYHARDT:
     y_var: str
     significance_level: float = 0.99
     k_indicators: Optional[int] = None
+    engine: str = "fwl"
 
     # Fitted artifacts
     selected_features_: Optional[List[str]] = None
@@ -71,6 +82,89 @@ class PYHARDT:
         j = Xmat.shape[1] - 1  # candidate is last column
         return float(res.tvalues[j]), float(res.pvalues[j])
 
+    def _ols_candidates(self, y: pd.Series, X: pd.DataFrame, y_lags: List[str], candidates: List[str]):
+        """Per-candidate OLS on its own complete-case sample. Returns ({col: t}, {col: p})."""
+        t_dict: Dict[str, float] = {}
+        p_dict: Dict[str, float] = {}
+
+        for col in candidates:
+            cols = []
+            if len(y_lags) > 0:
+                cols += y_lags
+            cols += [col]
+
+            # Align: drop rows with any NaN in y or the columns used
+            df = pd.concat([y, X[cols]], axis=1).dropna()
+            if df.empty:
+                t_dict[col] = np.nan
+                p_dict[col] = np.nan
+                continue
+
+            yv = df.iloc[:, 0].to_numpy(float)
+            # X design: const + y-lags (if any) + candidate
+            Xpart = df.iloc[:, 1:].to_numpy(float)
+            Xmat = sm.add_constant(Xpart, has_constant="add")
+
+            t_i, p_i = self._ols_one(yv, Xmat)
+            t_dict[col] = t_i
+            p_dict[col] = p_i
+
+        return t_dict, p_dict
+
+    def _fwl_candidates(self, y: pd.Series, X: pd.DataFrame, y_lags: List[str], candidates: List[str]):
+        """
+        All candidate t-stats at once via Frisch–Waugh–Lovell.
+
+        With M the annihilator of Z = [const, y-lags], ry = M y and RX = M X_cand:
+            b_j   = <rx_j, ry> / <rx_j, rx_j>
+            SSR_j = <ry, ry> - b_j * <rx_j, ry>
+            t_j   = b_j / sqrt(SSR_j / (n - rank(Z) - 1) / <rx_j, rx_j>)
+        Candidates with NaNs on the (y, y-lags) sample are returned in `fallback`.
+        """
+        base = pd.concat([y, X[y_lags]], axis=1).dropna()
+        n = len(base)
+        if n == 0:
+            return {}, {}, list(candidates)
+
+        Xc = X.loc[base.index, candidates]
+        complete = Xc.notna().all(axis=0).to_numpy()
+        fwl_cols = [c for c, ok in zip(candidates, complete) if ok]
+        fallback = [c for c, ok in zip(candidates, complete) if not ok]
+        if not fwl_cols:
+            return {}, {}, fallback
+
+        Z = np.column_stack([np.ones(n), base.iloc[:, 1:].to_numpy(float)])
+        # orthonormal basis of col(Z); rank-deficient controls are handled like pinv in statsmodels
+        U, s, _ = np.linalg.svd(Z, full_matrices=False)
+        rank = int((s > s[0] * max(Z.shape) * np.finfo(float).eps).sum())
+        Q = U[:, :rank]
+
+        yv = base.iloc[:, 0].to_numpy(float)
+        Xv = Xc[fwl_cols].to_numpy(float)
+        ry = yv - Q @ (Q.T @ yv)
+        RX = Xv - Q @ (Q.T @ Xv)
+
+        sxx = np.einsum("ij,ij->j", RX, RX)
+        sxy = RX.T @ ry
+        syy = float(ry @ ry)
+        df_resid = n - rank - 1
+
+        t_vals = np.full(len(fwl_cols), np.nan)
+        p_vals = np.full(len(fwl_cols), np.nan)
+        # candidate (numerically) in the span of the controls -> no identified slope
+        scale = np.einsum("ij,ij->j", Xv, Xv)
+        ok = (sxx > 1e-12 * np.maximum(scale, 1.0)) & (df_resid > 0)
+        if ok.any():
+            b = sxy[ok] / sxx[ok]
+            ssr = np.maximum(syy - b * sxy[ok], 0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                se = np.sqrt(ssr / df_resid / sxx[ok])
+                t = b / se
+            t_vals[ok] = t
+            p_vals[ok] = 2.0 * stats.t.sf(np.abs(t), df_resid)
+
+        return dict(zip(fwl_cols, t_vals)), dict(zip(fwl_cols, p_vals)), fallback
+
     # --------------- core API ---------------
 
     def fit(self, X: pd.DataFrame, y: pd.Series | pd.DataFrame):
@@ -85,7 +179,8 @@ class PYHARDT:
             raise ValueError("y must be a pandas Series or a 1-col DataFrame.")
 
         # Ensure numeric
-        X = X.apply(pd.to_numeric, errors="coerce")
+        if not all(pd.api.types.is_numeric_dtype(dt) for dt in X.dtypes):
+            X = X.apply(pd.to_numeric, errors="coerce")
         y = pd.to_numeric(y, errors="coerce")
 
         # Identify y-lag controls present in X
@@ -106,33 +201,21 @@ class PYHARDT:
             logger.warning("No candidate predictors (only y-lags present).")
             return self
 
-        t_dict: Dict[str, float] = {}
-        p_dict: Dict[str, float] = {}
-
-        for col in candidates:
-            cols = []
-            if len(y_lags) > 0:
-                cols += y_lags
-            cols += [col]
-
-            # Align: drop rows with any NaN in y or the columns used
-            df = pd.concat([y, X[cols]], axis=1).dropna()
-            if df.empty:
-                t_dict[col] = np.nan
-                p_dict[col] = np.nan
-                continue
-
-            yv = df.iloc[:, 0].to_numpy(float)
-            # X design: const + y-lags (if any) + candidate
-            Xpart = df.iloc[:, 1:].to_numpy(float)
-            Xmat = sm.add_constant(Xpart, has_constant="add")
-
-            t_i, p_i = self._ols_one(yv, Xmat)
-            t_dict[col] = t_i
-            p_dict[col] = p_i
+        if self.engine == "fwl":
+            t_dict, p_dict, fallback = self._fwl_candidates(y, X, y_lags, candidates)
+            if fallback:
+                logger.debug(f"PYHARDT fwl: {len(fallback)} candidates with missing values refit by OLS.")
+                t_fb, p_fb = self._ols_candidates(y, X, y_lags, fallback)
+                t_dict.update(t_fb)
+                p_dict.update(p_fb)
+        elif self.engine == "ols":
+            t_dict, p_dict = self._ols_candidates(y, X, y_lags, candidates)
+        else:
+            raise ValueError(f"Unknown engine: {self.engine}")
 
-        t_ser = pd.Series(t_dict, dtype=float)
-        p_ser = pd.Series(p_dict, dtype=float)
+        # keep X's column order regardless of engine
+        t_ser = pd.Series(t_dict, dtype=float).reindex(candidates)
+        p_ser = pd.Series(p_dict, dtype=float).reindex(candidates)
 
         # Rank by |t|
         order = np.argsort(-np.abs(t_ser.values))
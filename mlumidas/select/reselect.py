@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# A CV surface is the compact record PYENTSCV keeps of one fit:
+#     alphas      (n_alphas,)            ascending alpha grid that was cross-validated
+#     mse_path    (n_alphas, n_folds)    float32 test MSE per alpha and fold
+#     coef_path   (n_features, n_alphas) float32 CSC full-sample coefficients per alpha
+#     features    list[str]              column names of coef_path rows
+#     best_alpha  float                  alpha* picked by the fit
+#     coef        (n_features,)          float64 coefficients of the refit at alpha*
+# Everything a selection rule needs, without the sklearn objects.
+
+
+def make_surface(alphas, mse_path, coef_path, features, best_alpha, coef) -> dict:
+    return {
+        "alphas": np.asarray(alphas, dtype=float),
+        "mse_path": np.asarray(mse_path, dtype=np.float32),
+        "coef_path": sparse.csc_matrix(np.asarray(coef_path, dtype=np.float32)),
+        "features": list(features),
+        "best_alpha": float(best_alpha),
+        "coef": np.asarray(coef, dtype=float),
+    }
+
+
+def pick_alpha(surface: dict, rule: str = "cv_min", se_factor: Optional[float] = None) -> float:
+    """
+    alpha from the stored CV errors.
+      - "cv_min": lowest mean MSE (ties -> smallest alpha, as GridSearchCV).
+      - "cv_1se": largest alpha whose mean MSE is within 1 SE of the minimum.
+      - "cv_se":  same with `se_factor` standard errors.
+    SE = std of the fold MSEs at the minimum / sqrt(n_folds).
+    """
+    alphas = surface["alphas"]
+    mse = np.asarray(surface["mse_path"], dtype=float)
+    mean = np.where(np.isfinite(mse).all(axis=1), mse.mean(axis=1), np.inf)
+    i_min = int(np.flatnonzero(mean == mean.min())[0])
+    if rule == "cv_min":
+        return float(alphas[i_min])
+    if rule in ("cv_1se", "cv_se"):
+        factor = 1.0 if rule == "cv_1se" else float(1.0 if se_factor is None else se_factor)
+        se = mse[i_min].std(ddof=1) / np.sqrt(mse.shape[1]) if mse.shape[1] > 1 else 0.0
+        within = np.flatnonzero(mean <= mean[i_min] + factor * se)
+        return float(alphas[within.max()])
+    raise ValueError(f"Unknown alpha rule '{rule}'. Use 'cv_min', 'cv_1se' or 'cv_se'.")
+
+
+def coef_at(surface: dict, alpha: float) -> pd.Series:
+    """
+    Coefficients at a grid alpha: the refit at alpha*, else the stored full-sample path.
+    Path coefficients are not a refit: they come from the warm-started path solved over the
+    whole grid (to PYENTSCV's `tol`) and are stored as float32, so they agree with a refit
+    at that alpha only up to that tolerance and precision.
+    """
+    if np.isclose(alpha, surface["best_alpha"], rtol=1e-12, atol=0.0):
+        values = surface["coef"]
+    else:
+        j = int(np.argmin(np.abs(surface["alphas"] - alpha)))
+        values = surface["coef_path"][:, j].toarray().ravel().astype(float)
+    return pd.Series(values, index=surface["features"], dtype=float)
+
+
+def select_from_coefs(coefs: pd.Series, selection_rule: str, threshold_divisor: float = 1.0,
+                      coef_tol: float = 0.0, k_indicators: Optional[int] = None) -> list[str]:
+    """PYENTSCV's selection rules on a coefficient vector ('pt', 'k_ic', else non-zeros)."""
+    if selection_rule == "pt":
+        if threshold_divisor <= 0:
+            raise ValueError("threshold_divisor must be > 0 when using 'pt'.")
+        if coefs.size == 0:
+            return []
+        max_abs = float(np.nanmax(np.abs(coefs.values)))
+        if not np.isfinite(max_abs) or max_abs == 0.0:
+            return []
+        mask = np.abs(coefs.values) >= max_abs / threshold_divisor
+        return list(coefs.index[mask])
+    if selection_rule == "k_ic":
+        base = coefs[np.abs(coefs.values) > coef_tol]
+        k = 0 if k_indicators is None else int(k_indicators)
+        if base.empty or k <= 0:
+            return []
+        topk_idx = np.argsort(-np.abs(base.values))[:k]
+        return list(base.index[topk_idx])
+    mask = np.abs(coefs.values) > coef_tol
+    return list(coefs.index[mask])
+
+
+def reselect(surface: dict, selection_rule: str = "cv_min", threshold_divisor: float = 1.0, coef_tol: float = 0.0,
+             k_indicators: Optional[int] = None, alpha_rule: str = "cv_min", se_factor: Optional[float] = None) -> dict:
+    """
+    Re-apply a selection rule to a stored CV surface without refitting.
+
+    `alpha_rule` picks alpha ("cv_min", "cv_1se", "cv_se"); `selection_rule` then selects
+    features from the coefficients at that alpha. Selection rules "cv_1se" / "cv_se" are
+    shorthand for alpha_rule=<rule> with non-zero selection. At an alpha other than the
+    fit's alpha* the coefficients are read off the stored path (see `coef_at`).
+    Returns the selection keys of PYENTSCV.get_result(), including "cv_surface".
+    """
+    if selection_rule in ("cv_1se", "cv_se"):
+        alpha_rule, selection_rule = selection_rule, "cv_min"
+    alpha = pick_alpha(surface, alpha_rule, se_factor)
+    coefs = coef_at(surface, alpha)
+    selected = select_from_coefs(coefs, selection_rule, threshold_divisor, coef_tol, k_indicators)
+    return {
+        "selected_features": selected,
+        "coef_series": coefs,
+        "coef_series_selected": coefs.loc[selected],
+        "best_alpha": alpha,
+        "selection_rule": selection_rule,
+        "alpha_rule": alpha_rule,
+        "cv_surface": surface,
+    }
+
+
+def reselect_outputs(cv_surfaces: dict, **rule) -> dict:
+    """
+    {quarter: {period: surface}} (results_dict["varselect"]["cv_surfaces"]) ->
+    {(quarter, period): output}, usable as `get_results_dict(varselect_outputs=...)`.
+    """
+    outputs = {}
+    for quarter, per_period in cv_surfaces.items():
+        for period, surface in per_period.items():
+            if surface is not None:
+                outputs[(quarter, period)] = reselect(surface, **rule)
+    return outputs
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def narrow_alpha_grid(alpha_grid: np.ndarray, prior_state: Optional[dict], span: float) -> np.ndarray:
+    """
+    Grid points within `span` decades of the previous best alpha.
+    Falls back to the full grid without a usable prior or if fewer than 3 points remain.
+    """
+    if not prior_state or span is None or span <= 0:
+        return alpha_grid
+    prev = prior_state.get("best_alpha")
+    if prev is None or not np.isfinite(prev) or prev <= 0:
+        return alpha_grid
+    mask = np.abs(np.log10(alpha_grid) - np.log10(prev)) <= span
+    if mask.sum() < 3:
+        return alpha_grid
+    return alpha_grid[mask]
+
+
+def hit_window_edge(best_alpha: float, window: np.ndarray, full_grid: np.ndarray) -> bool:
+    """True if alpha* sits on an edge of a narrowed window that is not an edge of the full grid."""
+    if window.size == full_grid.size:
+        return False
+    at_edge = best_alpha in (window[0], window[-1])
+    return at_edge and best_alpha not in (full_grid[0], full_grid[-1])
+
+
+def align_prior_coef(prior_state: Optional[dict], columns) -> Optional[np.ndarray]:
+    """Previous coefficients re-aligned to the current columns (new columns start at 0)."""
+    if not prior_state or prior_state.get("coef") is None:
+        return None
+    coef = prior_state["coef"]
+    if not isinstance(coef, pd.Series):
+        return None
+    return np.array(coef.reindex(list(columns)).fillna(0.0).to_numpy(dtype=float))
+
+
+def make_state(coef_series: Optional[pd.Series], best_alpha: Optional[float], coef_tol: float = 0.0) -> dict:
+    """Prior state handed to the next (quarter, period) fit."""
+    if coef_series is None:
+        return {"coef": None, "active_set": [], "best_alpha": best_alpha}
+    active = list(coef_series.index[np.abs(coef_series.to_numpy(dtype=float)) > coef_tol])
+    return {"coef": coef_series.copy(), "active_set": active, "best_alpha": best_alpha}
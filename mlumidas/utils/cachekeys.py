@@ -0,0 +1,127 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from utils.utils import get_formatted_date
+
+
+def get_top_level_key(start_date, y_var, umidas_model_lags, rolling_window_quarters=None):
+    """
+    Top-level key of the model cache / MSE history.
+
+    Deliberately independent of end_date: a quarter's best-spec fit depends only on
+    its own training slice, which is validated per entry via `slice_fingerprint`.
+    Moving end_date forward therefore reuses every existing quarter.
+    """
+    key = f"from_{get_formatted_date(start_date)}_{y_var}_lags_{umidas_model_lags}"
+    if rolling_window_quarters:
+        key += f"_rw{int(rolling_window_quarters)}"
+    return key
+
+
+def frame_row_hashes(df):
+    """
+    Per-row content hashes of a model frame (index + values) plus a digest of its columns.
+    Computed once per frame; slices are fingerprinted from these.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    columns_digest = hashlib.md5(repr(tuple(map(str, df.columns))).encode("utf-8")).digest()
+    return row_hashes, columns_digest
+
+
+def slice_fingerprint(df, row_hashes, columns_digest, train_idx, test_idx, rolling_window=None):
+    """
+    Fingerprint of the rows an entry was estimated (train) and evaluated (test) on.
+    Returns None if any date is not in the frame.
+    """
+    train_pos = df.index.get_indexer(train_idx)
+    test_pos = df.index.get_indexer(test_idx)
+    if (train_pos < 0).any() or (test_pos < 0).any():
+        return None
+    if rolling_window:
+        train_pos = train_pos[-int(rolling_window):]
+
+    h = hashlib.md5(columns_digest)
+    h.update(np.ascontiguousarray(row_hashes[train_pos]).tobytes())
+    h.update(b"|")
+    h.update(np.ascontiguousarray(row_hashes[test_pos]).tobytes())
+    return h.hexdigest()[:16]
+
+
+# ---- Canonical cache keys -------------------------------------------------- #
+
+FREQ_ALIASES = {"D": "ME", "M": "ME", "MS": "ME", "ME": "ME", "Q": "QE", "QS": "QE", "QE": "QE"}
+
+
+def canonical_freq(freq):
+    """Cache frequency key: daily/monthly aliases -> 'ME', quarterly aliases -> 'QE'."""
+    return FREQ_ALIASES.get(freq, freq)
+
+
+def canonical_transformation(transformation):
+    """None / NaN / '' -> None, otherwise the stripped string."""
+    if transformation is None:
+        return None
+    if isinstance(transformation, float) and np.isnan(transformation):
+        return None
+    transformation = str(transformation).strip()
+    return transformation or None
+
+
+def canonical_quarter(quarter):
+    try:
+        return pd.Timestamp(quarter).normalize()
+    except (TypeError, ValueError):
+        return quarter
+
+
+def canonical_cache_key(key, _quarters=None):
+    """
+    (top_level_key, quarter, freq, series, period_type, crit[, transformation]) with the
+    quarter as a midnight Timestamp and canonical freq / transformation.
+    `_quarters` is an optional memo for the quarter conversion.
+    """
+    quarter = key[1]
+    if _quarters is None:
+        quarter = canonical_quarter(quarter)
+    else:
+        if quarter not in _quarters:
+            _quarters[quarter] = canonical_quarter(quarter)
+        quarter = _quarters[quarter]
+
+    base = (key[0], quarter, canonical_freq(key[2]), key[3], key[4], key[5])
+    if len(key) >= 7:
+        return base + (canonical_transformation(key[6]),)
+    return base
+
+
+class ModelCacheIndex(dict):
+    """
+    Model cache keyed by canonical keys, built once when the cache is loaded.
+
+    Every lookup is a single hash probe on `canonical_cache_key(key)`, so keys that differ
+    only in quarter representation, 'D' vs 'ME' or NaN vs None transformation still hit.
+    When two raw keys collapse to the same canonical key, an entry with a prediction wins.
+    """
+
+    def __init__(self, items=()):
+        super().__init__()
+        if isinstance(items, dict):
+            items = items.items()
+        quarters = {}
+        for key, payload in items:
+            if not isinstance(key, tuple) or len(key) < 6:
+                continue
+            ckey = canonical_cache_key(tuple(key[:7]), quarters)
+            existing = self.get(ckey)
+            if existing is None:
+                self[ckey] = payload
+            else:
+                has_pred_new = isinstance(payload, dict) and payload.get("y_pred") is not None
+                has_pred_old = isinstance(existing, dict) and existing.get("y_pred") is not None
+                if has_pred_new and not has_pred_old:
+                    self[ckey] = payload
+
+    def lookup(self, key):
+        return self.get(canonical_cache_key(tuple(key)))
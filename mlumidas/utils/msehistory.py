@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+
+HISTORY_KEY_LEVELS = ["top_level_key", "freq", "series", "period_type", "crit", "transformation"]
+
+
+class MSEHistoryTable:
+    """
+    Squared-error history of all cached (series, period, crit) models as ONE long table.
+
+    Rows are sorted by history key, then quarter:
+        (top_level_key, freq, series, period_type, crit, transformation, quarter) -> se
+
+    `precompute(window_quarters)` does a single vectorized pass that stores, for every
+    row, the trailing mean of the `window_quarters` errors of its key strictly BEFORE
+    that row's quarter. `msfe(hkey, quarter)` is then a binary search within the key's
+    rows and an array read.
+    """
+
+    def __init__(self, frame):
+        # frame: columns HISTORY_KEY_LEVELS + ["quarter", "se"]
+        frame = frame.copy()
+        frame["se"] = pd.to_numeric(frame["se"], errors="coerce").replace([np.inf, -np.inf], np.nan)
+        frame = frame.dropna(subset=["se"])
+        frame["quarter"] = pd.to_datetime(frame["quarter"])
+        for level in HISTORY_KEY_LEVELS:
+            # keep missing key parts as None (not NaN) so tuple keys compare equal
+            frame[level] = frame[level].astype(object).where(frame[level].notna(), None)
+        frame = frame.sort_values(HISTORY_KEY_LEVELS + ["quarter"], kind="mergesort").reset_index(drop=True)
+
+        self.frame = frame
+        self._keys = list(zip(*(frame[c] for c in HISTORY_KEY_LEVELS))) if len(frame) else []
+        self._quarters = frame["quarter"].to_numpy(dtype="datetime64[ns]")
+        self._se = frame["se"].to_numpy(dtype=float)
+
+        # contiguous [start, stop) row range per history key
+        self._groups = {}
+        for pos, key in enumerate(self._keys):
+            if key not in self._groups:
+                self._groups[key] = [pos, pos + 1]
+            else:
+                self._groups[key][1] = pos + 1
+
+        self.window_quarters = None
+        self._mean = None
+        self._lo = None
+
+    # ---------- Construction ----------
+
+    @classmethod
+    def from_dict(cls, mse_history):
+        """Legacy layout: {history_key: pd.Series(se, index=quarter)}."""
+        parts = []
+        for hkey, s in mse_history.items():
+            if s is None or len(s) == 0:
+                continue
+            part = pd.DataFrame({"quarter": pd.to_datetime(s.index), "se": np.asarray(s, dtype=float)})
+            for level, value in zip(HISTORY_KEY_LEVELS, hkey):
+                part[level] = value
+            parts.append(part)
+        if not parts:
+            return cls(pd.DataFrame(columns=HISTORY_KEY_LEVELS + ["quarter", "se"]))
+        return cls(pd.concat(parts, ignore_index=True))
+
+    @classmethod
+    def from_any(cls, mse_history):
+        if isinstance(mse_history, cls):
+            return mse_history
+        if isinstance(mse_history, pd.DataFrame):
+            return cls(mse_history)
+        if isinstance(mse_history, dict):
+            return cls.from_dict(mse_history)
+        raise TypeError(f"Unsupported mse_history type: {type(mse_history).__name__}")
+
+    def __len__(self):
+        return len(self._groups)
+
+    def keys(self):
+        return self._groups.keys()
+
+    def get(self, hkey, default=None):
+        """Legacy accessor: pd.Series of squared errors indexed by quarter."""
+        rng = self._groups.get(hkey)
+        if rng is None:
+            return default
+        start, stop = rng
+        return pd.Series(self._se[start:stop], index=pd.DatetimeIndex(self._quarters[start:stop]), dtype=float)
+
+    # ---------- Rolling MSFE ----------
+
+    def precompute(self, window_quarters):
+        """Trailing-window MSFE for every (history key, quarter) in one pass."""
+        window = int(window_quarters)
+        n = len(self._se)
+        self.window_quarters = window
+        if n == 0:
+            self._mean = np.empty(0)
+            self._lo = np.empty(0, dtype=np.int64)
+            return self
+
+        group_start = np.empty(n, dtype=np.int64)
+        for start, stop in self._groups.values():
+            group_start[start:stop] = start
+
+        cs = np.concatenate([[0.0], np.cumsum(self._se)])
+        pos = np.arange(n)
+        lo = np.maximum(group_start, pos - window)
+        count = pos - lo
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self._mean = np.where(count > 0, (cs[pos] - cs[lo]) / np.maximum(count, 1), np.nan)
+        self._lo = lo
+        return self
+
+    def _window_bounds(self, hkey, quarter):
+        rng = self._groups.get(hkey)
+        if rng is None:
+            return None
+        start, stop = rng
+        q = np.datetime64(quarter, "ns")
+        hi = start + int(np.searchsorted(self._quarters[start:stop], q, side="left"))
+        if hi < stop and self._quarters[hi] == q:
+            return (self._mean[hi], int(self._lo[hi]), hi)
+        # quarter not in this key's history (e.g. after its last observation)
+        lo = max(start, hi - int(self.window_quarters))
+        if hi == lo:
+            return (np.nan, lo, hi)
+        return (float(self._se[lo:hi].mean()), lo, hi)
+
+    def msfe(self, hkey, quarter):
+        """(trailing MSFE, list of the squared errors in the window) before `quarter`; None if no past errors."""
+        if self.window_quarters is None:
+            raise RuntimeError("Call precompute(window_quarters) before msfe().")
+        bounds = self._window_bounds(hkey, pd.Timestamp(quarter))
+        if bounds is None:
+            return None
+        mean, lo, hi = bounds
+        if hi <= lo:
+            return None
+        return float(mean), self._se[lo:hi].tolist()
@@ -0,0 +1,61 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+LAG_PATTERN = re.compile(r"_lag\d+$")
+
+
+class RaggedEdgePanel:
+    """
+    `full_sample_df` converted ONCE for ragged-edge slicing.
+
+      values     (n_rows, n_features) contiguous array of every non-y column
+      y          (n_rows,) target
+      col_masks  {period: bool (n_features,)}  lag columns + that period's released series
+      complete   {period: bool (n_rows,)}      y and all of the period's columns observed
+
+    `slice(train_idx, period)` is then a row lookup plus one gather; it returns exactly the
+    X / y of the DataFrame route (columns in full_sample_df order, rows in train_idx order,
+    complete cases only).
+    """
+
+    def __init__(self, full_sample_df, release_periods_dict, y_var, dtype=np.float64):
+        self.y_var = y_var
+        feature_cols = [c for c in full_sample_df.columns if c != y_var]
+        self.columns = pd.Index(feature_cols)
+        self.index = full_sample_df.index
+        self.values = np.ascontiguousarray(full_sample_df[feature_cols].to_numpy(dtype=dtype))
+        self.y = full_sample_df[y_var].to_numpy(dtype=dtype)
+
+        observed = ~np.isnan(self.values)
+        y_observed = ~np.isnan(self.y)
+        is_lag = np.array([bool(LAG_PATTERN.search(str(c))) for c in feature_cols], dtype=bool)
+
+        self.col_masks = {}
+        self.complete = {}
+        for period, released in release_periods_dict.items():
+            mask = is_lag | self.columns.isin(list(released))
+            self.col_masks[period] = mask
+            self.complete[period] = y_observed & observed[:, mask].all(axis=1)
+
+    def n_included(self, period):
+        return int(self.col_masks[period].sum())
+
+    def slice(self, train_idx, period):
+        """(X, y) for one (training window, period) as DataFrame / Series views on fresh arrays."""
+        col_mask = self.col_masks[period]
+        rows = self.index.get_indexer(train_idx)
+        if (rows < 0).any():
+            raise KeyError(f"{int((rows < 0).sum())} training dates are not in full_sample_df.")
+        rows = rows[self.complete[period][rows]]
+
+        X = pd.DataFrame(
+            self.values[np.ix_(rows, np.flatnonzero(col_mask))],
+            index=self.index[rows],
+            columns=self.columns[col_mask],
+            copy=False,
+        )
+        y = pd.Series(self.y[rows], index=self.index[rows], name=self.y_var)
+        return X, y
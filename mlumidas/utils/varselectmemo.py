@@ -0,0 +1,131 @@
+import dataclasses
+import functools
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from loguru import logger
+
+from utils.utils import file_digest
+
+# Bump to orphan all old entries (the selector source digest below already covers code changes).
+VARSELECT_MEMO_VERSION = 2
+
+SELECT_DIR = Path(__file__).resolve().parents[1] / "select"
+
+# selector fields that are not hyperparameters: the warm start is keyed separately, and the
+# process count / verbosity do not change the result (parallel and serial runs share entries)
+_NON_PARAM_FIELDS = ("prior_state", "n_jobs", "verbose")
+
+# sklearn objects in a selector's get_result(); dropped from memo entries
+HEAVY_KEYS = ("pipeline", "model", "pipeline_cv", "model_cv", "grid")
+
+
+def strip_heavy(output):
+    """get_result() payload without the fitted sklearn objects (recurses into 'by_l1_ratio')."""
+    if not isinstance(output, dict):
+        return output
+    stripped = {k: v for k, v in output.items() if k not in HEAVY_KEYS}
+    if isinstance(stripped.get("by_l1_ratio"), dict):
+        stripped["by_l1_ratio"] = {r: strip_heavy(o) for r, o in stripped["by_l1_ratio"].items()}
+    return stripped
+
+
+def _feed(h, obj):
+    """Stable, type-tagged hash of (nested) parameters, arrays and pandas objects."""
+    if isinstance(obj, pd.DataFrame):
+        h.update(b"D")
+        h.update(repr(tuple(map(str, obj.columns))).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        h.update(b"S")
+        h.update(repr(str(obj.name)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        h.update(b"A")
+        h.update(f"{obj.dtype.str}{obj.shape}".encode("utf-8"))
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"M")
+        for key in sorted(obj, key=repr):
+            _feed(h, key)
+            _feed(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"L")
+        for item in obj:
+            _feed(h, item)
+        h.update(b"]")
+    else:
+        h.update(repr(obj).encode("utf-8"))
+    h.update(b"|")
+
+
+@functools.lru_cache(maxsize=None)
+def selector_code_digest():
+    """Digest of the selector sources (mlumidas/select/*.py), so any code change orphans old entries."""
+    return {path.name: file_digest(path) for path in sorted(SELECT_DIR.glob("*.py"))}
+
+
+def selector_params(selector):
+    """
+    Every hyperparameter of a constructed selector dataclass, class defaults included:
+    all fields except the warm start and the fitted attributes (trailing underscore).
+    """
+    return {
+        field.name: getattr(selector, field.name)
+        for field in dataclasses.fields(selector)
+        if field.name not in _NON_PARAM_FIELDS and not field.name.endswith("_")
+    }
+
+
+def varselect_memo_key(X, y, selector, prior_state=None):
+    """
+    Content address of one selection: the exact X/y slice, the selector class with its full
+    parameter set, the selector source digest and the warm start.
+    """
+    h = hashlib.sha256(f"varselect-v{VARSELECT_MEMO_VERSION}".encode("utf-8"))
+    _feed(h, X)
+    _feed(h, y)
+    _feed(h, type(selector).__name__)
+    _feed(h, selector_params(selector))
+    _feed(h, selector_code_digest())
+    _feed(h, prior_state)
+    return h.hexdigest()
+
+
+class VarselectMemo:
+    """
+    On-disk memo of selector outputs: {memo_dir}/{key[:2]}/{key}.pkl -> {"output", "state"}.
+
+    Keys are content addresses (see `varselect_memo_key`): a change in the data slice, any
+    selector parameter (defaults included) or the selector code produces a different key.
+    Anything else a fit depends on (e.g. library versions) is not in the key; delete the
+    memo directory or bump VARSELECT_MEMO_VERSION when that changes.
+    Writes are atomic and per-process, so parallel varselect workers can share a memo.
+    """
+
+    def __init__(self, memo_dir):
+        self.memo_dir = Path(memo_dir)
+
+    def _path(self, key):
+        return self.memo_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return load(path)
+        except Exception as e:
+            logger.warning(f"Unreadable varselect memo entry {path.name} ({e}); recomputing.")
+            return None
+
+    def put(self, key, output, state=None):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        dump({"output": strip_heavy(output), "state": state}, tmp, compress=("lz4", 3))
+        os.replace(tmp, path)
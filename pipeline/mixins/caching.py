@@ -1,51 +1,106 @@
+import hashlib
+import json
 import os
 import pickle
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 from loguru import logger
 
 
+def stage_fingerprint(stage: str, inputs: Dict[str, Any]) -> str:
+    """
+    Content address of one stage run: sha256 over the stage name and its (sorted) inputs.
+    The inputs include the digests of the code that produces the stage, so a code change
+    orphans the old entries by itself.
+    """
+    h = hashlib.sha256(stage.encode("utf-8"))
+    for key in sorted(inputs):
+        h.update(f"{key}={inputs[key]!r}|".encode("utf-8"))
+    return h.hexdigest()
+
+
 class CachingMixin:
     """
-    Dead-simple per-stage pickle cache used for 'nowdata' and 'varselect'.
-    - Each stage saves/loads one pickle at: {file_path_pipelinecache}/{stage}.pkl
-    - No signatures or auto invalidation.
-      If you change inputs for a stage, include it in `pipelines_to_run` to force a re-run.
+    Per-stage pickle cache used for 'nowdata', keyed by the stage's inputs.
+    - Each entry lives at {file_path_pipelinecache}/{stage}/{fingerprint}.pkl, where the fingerprint
+      hashes every input of the stage (see `stage_fingerprint`). A sidecar {fingerprint}.json records
+      the inputs in readable form.
+    - Different configurations coexist; an entry whose inputs changed is never reused (the key changes).
+    - LRU eviction: a hit refreshes the entry's mtime; after each save the least recently used entries
+      of the stage are removed until the stage fits in `stage_cache_max_gb` (None = unbounded).
+    - Including a stage in `pipelines_to_run` still forces a re-run (and refreshes its entry).
     """
 
     # NOWPipeline.__init__ must set:
     #   self.file_path_pipelinecache = f"{file_path}/cache/pipelinecache"
+    # and may set:
+    #   self.stage_cache_max_gb = 10.0
 
     def _cache_root(self) -> Path:
         root = Path(self.file_path_pipelinecache)
         root.mkdir(parents=True, exist_ok=True)
         return root
 
-    def _stage_cache_path(self, stage: str) -> Path:
-        return self._cache_root() / f"{stage}.pkl"
+    def _stage_cache_path(self, stage: str, inputs: Dict[str, Any]) -> Path:
+        return self._cache_root() / stage / f"{stage_fingerprint(stage, inputs)}.pkl"
 
-    def _save_stage_cache(self, stage: str, payload: Any) -> None:
-        """Save any picklable object atomically."""
-        path = self._stage_cache_path(stage)
-        tmp = path.with_suffix(".pkl.tmp")
+    def _save_stage_cache(self, stage: str, payload: Any, inputs: Dict[str, Any]) -> None:
+        """Save any picklable object atomically under the fingerprint of `inputs`, then evict."""
+        path = self._stage_cache_path(stage, inputs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
         with open(tmp, "wb") as f:
             pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
         os.replace(tmp, path)
+        with open(path.with_suffix(".json"), "w") as f:
+            json.dump({k: repr(v) for k, v in sorted(inputs.items())}, f, indent=2)
+        logger.info(f"Saved '{stage}' stage cache {path.stem[:12]}.")
+        self._evict_stage_cache(stage, keep=path)
 
-    def _load_stage_cache(self, stage: str) -> Optional[Any]:
-        """Load pickled object if present; else None. Corrupt -> None."""
-        path = self._stage_cache_path(stage)
+    def _load_stage_cache(self, stage: str, inputs: Dict[str, Any]) -> Optional[Any]:
+        """Load the entry for exactly these inputs if present; else None. Corrupt -> None."""
+        path = self._stage_cache_path(stage, inputs)
         if not path.exists():
+            logger.info(f"No '{stage}' stage cache for these inputs ({path.stem[:12]}).")
             return None
         try:
             with open(path, "rb") as f:
-                return pickle.load(f)
+                payload = pickle.load(f)
         except Exception:
             return None
+        os.utime(path)  # LRU: a hit makes the entry most recently used
+        logger.info(f"Loaded '{stage}' stage cache {path.stem[:12]}.")
+        return payload
+
+    def _has_stage_cache(self, stage: str, inputs: Dict[str, Any]) -> bool:
+        return self._stage_cache_path(stage, inputs).exists()
+
+    def _evict_stage_cache(self, stage: str, keep: Optional[Path] = None) -> None:
+        """Remove least recently used entries of `stage` until it fits in `stage_cache_max_gb`."""
+        max_gb = getattr(self, "stage_cache_max_gb", None)
+        if max_gb is None:
+            return
+        entries = []
+        for path in (self._cache_root() / stage).glob("*.pkl"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        limit = float(max_gb) * 1024 ** 3
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            if keep is not None and path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Evicted '{stage}' stage cache {path.stem[:12]} (LRU, limit {max_gb} GB).")
 
-    def _has_stage_cache(self, stage: str) -> bool:
-        return self._stage_cache_path(stage).exists()
-        
     @staticmethod
     def _run_stage_obj(obj: Any) -> None:
         width = 70
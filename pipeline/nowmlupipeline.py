@@ -1,18 +1,20 @@
 from collections import OrderedDict
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Union
 import pandas as pd
 import os
 import matplotlib.pyplot as plt
 from loguru import logger
 
-from utils.utils import get_formatted_date_spec
+from utils.utils import get_formatted_date_spec, file_digest, sources_digest
 
 from pipeline.mixins.caching import CachingMixin
 from pipeline.mixins.saving import SavingMixin
 from pipeline.mixins.summary import SummaryMixin
 
-from data.nowdatapipeline import NOWDataPipeline
+from data.nowdatapipeline import NOWDataPipeline, NOWDATA_SOURCES
+from mappings.periods import period_mappings
 from mlumidas.mlumidaspipeline import MLUMidasPipeline
+from mlumidas.mixins.mlumidascache import UMIDAS_ENGINES
 
 from utils.getdata import _save_xlsx, _save_object
 
@@ -20,12 +22,21 @@ from utils.getdata import _save_xlsx, _save_object
 class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
     """
     Orchestrator with per-stage behavior:
-      - ONLY the NOWDATA STAGE is cached.
-        • If 'nowdata' is not explicitly requested, it will be loaded from cache if present;
-          otherwise it runs once and is cached.
+      - ONLY the NOWDATA STAGE is cached, keyed by a fingerprint of all its inputs
+        (parameters, period mapping, mapping module, mapping object and the data-processing code;
+        see _nowdata_stage_inputs).
+        • If 'nowdata' is not explicitly requested, the entry for these inputs is loaded if present;
+          otherwise it runs once and is cached. Other configurations keep their own entries.
+        • Entries are evicted least-recently-used once the stage exceeds stage_cache_max_gb.
+        • On a miss, NOWDataPipeline reuses its memoized steps (nowdata_step_memo) and recomputes
+          only the steps whose inputs or code changed, plus everything downstream. Its entries hold
+          only what each step changed and are bounded by nowdata_step_memo_max_gb. An explicit
+          'nowdata' run recomputes every step and refreshes the step memo as well.
         • The cache stores both key outputs AND the NOWDataPipeline instance itself, so
           self.pipeNOWData is available even when loaded from cache.
-      - VARSELECT and MODEL STAGES ALWAYS RUN (no caching).
+      - VARSELECT and MODEL STAGES ALWAYS RUN (no stage cache). The individual selector
+        fits are memoized by content (X/y slice + hyperparameters) unless varselect_memo=False,
+        so re-running an existing spec skips every fit whose inputs did not change.
       - Each stage runs at most once per process (in-memory guards).
     """
 
@@ -53,7 +64,7 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
 
         # MLU Midas VarSelect
         varselection_method: Optional[str],
-        alpha: float,
+        alpha: Union[float, List[float]],   # list of l1_ratios: one pyentscv pass, one spec per ratio
         tcv_splits: int,
         test_size: int,
         gap: int,
@@ -78,6 +89,20 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         lambda_fix=float,
 
         run_cache_only: bool = False,
+        umidas_engine: str = "numpy",
+        cache_n_jobs: int = 1,
+        rolling_window_quarters: Optional[int] = None,
+        cache_checkpoint_every: Optional[int] = None,
+        cache_checkpoint_seconds: Optional[float] = 300,
+        varselect_warm_start: bool = False,
+        varselect_n_jobs: int = 1,
+        varselect_memo: bool = True,
+        varselect_screening: bool = True,
+        varselect_cv_mode: str = "path",
+        stat_n_jobs: int = 1,
+        stage_cache_max_gb: Optional[float] = 10.0,
+        nowdata_step_memo: bool = True,
+        nowdata_step_memo_max_gb: Optional[float] = 5.0,
     ):
         # ------------------------------------------------------ #
         # Outputs/Input Paths ---------------------------------- #
@@ -156,6 +181,20 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         # ------------------------------------------------------ #
         # ---- NOWData -> NOWVarSelect ------------------------- #
         self.run_cache_only = run_cache_only # Whether to only load from cache or run the full pipeline 
+        self.umidas_engine = umidas_engine   # "numpy" (closed-form spec search), "recursive" (updated X'X across quarters) or "statsmodels"
+        self.cache_n_jobs = cache_n_jobs     # worker processes for the model cache build (-1 = all cores)
+        self.rolling_window_quarters = rolling_window_quarters  # None = expanding estimation windows
+        self.cache_checkpoint_every = cache_checkpoint_every      # checkpoint the cache build every N combinations (None = off)
+        self.cache_checkpoint_seconds = cache_checkpoint_seconds  # ... and/or every T seconds (None = off)
+        self.varselect_warm_start = varselect_warm_start          # seed each quarter's selection with the previous quarter's solution
+        self.varselect_n_jobs = varselect_n_jobs                  # processes for the per-(quarter, period) variable selection
+        self.varselect_memo = varselect_memo                      # reuse selector outputs for identical data slices + parameters
+        self.varselect_screening = varselect_screening            # strong-rule screening in pyentscv / pyen (same solutions)
+        self.varselect_cv_mode = varselect_cv_mode                # pyentscv CV: "path" (warm-started enet paths) or "grid" (GridSearchCV)
+        self.stat_n_jobs = stat_n_jobs                            # processes for the nowdata stationarity transformation search
+        self.stage_cache_max_gb = stage_cache_max_gb              # LRU bound of the nowdata stage cache (None = unbounded)
+        self.nowdata_step_memo = nowdata_step_memo                # memoize NOWDataPipeline steps 1.0-1.9 individually
+        self.nowdata_step_memo_max_gb = nowdata_step_memo_max_gb  # LRU bound of the NOWDataPipeline step memo (None = unbounded)
         self.release_periods_dict: Optional[Dict[str, Any]] = None
         self.full_sample_df: Optional[pd.DataFrame] = None
         self.series_model_dataframes: Optional[Dict[str, Any]] = None
@@ -174,80 +213,125 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         # ------------------------------------------------------ #
         # Outputs ---------------------------------------------- #
         # ------------------------------------------------------ #
+        # alpha may be a list of l1_ratios for "pyentscv": one selection pass, one spec per ratio
+        self.l1_ratios = list(self.alpha) if isinstance(self.alpha, (list, tuple)) else None
+        self.spec_name, self.spec_name_short = self._get_spec_names(self.alpha)
+        self.spec_names = None
+        self.spec_names_short = None
+        if self.l1_ratios is not None:
+            if self.varselection_method != "pyentscv":
+                raise ValueError("A list of l1_ratios (alpha) is only supported for varselection_method='pyentscv'.")
+            self.spec_names = {ratio: self._get_spec_names(ratio)[0] for ratio in self.l1_ratios}
+            self.spec_names_short = {ratio: self._get_spec_names(ratio)[1] for ratio in self.l1_ratios}
+
+        # fail before the nowdata stage runs, not when the cache or the benchmark first needs the engine
+        if self.umidas_engine not in UMIDAS_ENGINES:
+            raise ValueError(f"Unknown umidas_engine '{self.umidas_engine}'. Valid: {sorted(UMIDAS_ENGINES)}")
+
+        self.file_path_output = f"{file_path}/output/mlumidas/{self.spec_name}"
+        self.file_path_results = f"{file_path}/output/results/{self.spec_name}"
+        self.file_path_results_dfs = f"{file_path}/output/results/{self.spec_name}/dfs"
+
+        logger.add(f"{self.file_path_output}/log_{self.spec_name}.txt", rotation="10 MB")
+
+        self.results_dict = {}
+        self.oof_plots = {}
+        self.oof_all_periods_plots = {}
+        self.oof_single_quarter_plots = {}
+        self.selected_vars_quarters_df_dict = {}
+        self.selected_vars_quarters_periods_df_dict = {}
+
+    def _get_spec_names(self, alpha):
+        """(spec_name, spec_name_short) for one alpha; a list of l1_ratios is joined with '-'."""
+        alpha_str = "-".join(str(a) for a in alpha) if isinstance(alpha, (list, tuple)) else alpha
         formatted_start_date = get_formatted_date_spec(self.start_date)
         formatted_end_date   = get_formatted_date_spec(self.end_date)
+        spec_name, spec_name_short = None, None
 
         if self.varselection_method in ["pyentscv"]:
-            self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.varselection_method}_tcv{self.tcv_splits}on{self.test_size}_a{self.alpha}_qw{self.window_quarters}"
+            spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.varselection_method}_tcv{self.tcv_splits}on{self.test_size}_a{alpha_str}_qw{self.window_quarters}"
             if self.selection_rule == "cv_se":
-                self.spec_name += f"{self.se_factor}"
+                spec_name += f"{self.se_factor}"
             if self.coef_tol > 0:
-                self.spec_name += f"_ct{self.coef_tol}"
+                spec_name += f"_ct{self.coef_tol}"
             if self.selection_rule == "pt":
-                self.spec_name += f"_td{self.threshold_divisor}"
+                spec_name += f"_td{self.threshold_divisor}"
             if self.no_lags:
-                self.spec_name += f"_{self.no_lags}"
+                spec_name += f"_{self.no_lags}"
             if self.selection_rule == "k_ic":
-                self.spec_name += f"{self.k_indicators}"
+                spec_name += f"{self.k_indicators}"
 
-            self.spec_name_short = f"{self.varselection_method}_a{self.alpha}"
+            spec_name_short = f"{self.varselection_method}_a{alpha_str}"
 
         elif self.varselection_method == "no_selection":
-            self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_nsel_qw{self.window_quarters}"
+            spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_nsel_qw{self.window_quarters}"
             if self.no_lags:
-                self.spec_name += f"_{self.no_lags}"
-            
-            self.spec_name_short = f"{self.varselection_method}"
+                spec_name += f"_{self.no_lags}"
+
+            spec_name_short = f"{self.varselection_method}"
 
         elif self.varselection_method in ["pyen"]:
-            self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.varselection_method}_a{self.alpha}_lam{self.lambda_fix}_qw{self.window_quarters}"
+            spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.varselection_method}_a{alpha_str}_lam{self.lambda_fix}_qw{self.window_quarters}"
             if self.selection_rule == "cv_se":
-                self.spec_name += f"{self.se_factor}"
+                spec_name += f"{self.se_factor}"
             if self.coef_tol > 0:
-                self.spec_name += f"_ct{self.coef_tol}"
+                spec_name += f"_ct{self.coef_tol}"
             if self.selection_rule == "pt":
-                self.spec_name += f"_td{self.threshold_divisor}"
+                spec_name += f"_td{self.threshold_divisor}"
             if self.no_lags:
-                self.spec_name += f"_{self.no_lags}"
+                spec_name += f"_{self.no_lags}"
             if self.selection_rule == "k_ic":
-                self.spec_name += f"{self.k_indicators}"
+                spec_name += f"{self.k_indicators}"
+
+            spec_name_short = f"{self.varselection_method}_a{alpha_str}_l{self.lambda_fix}"
 
-            self.spec_name_short = f"{self.varselection_method}_a{self.alpha}_l{self.lambda_fix}"
 
-    
         # elif self.varselection_method in ["pyadal"]:
-        #     self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.umidas_model_lags}lags_{self.varselection_method}_qw{self.window_quarters}"
+        #     spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.umidas_model_lags}lags_{self.varselection_method}_qw{self.window_quarters}"
 
         # elif self.varselection_method in ["pyhardt"]:
-        #     self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_hardt_tr_qw{self.window_quarters}"
+        #     spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_hardt_tr_qw{self.window_quarters}"
         #     if self.k_indicators > 0:
-        #         self.spec_name += f"_k_ic{self.k_indicators}"
-        
+        #         spec_name += f"_k_ic{self.k_indicators}"
+
         # if self.varselection_method in ["pyencv"]:
-        #     self.spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.umidas_model_lags}lags_{self.varselection_method}_a{self.alpha}_qw{self.window_quarters}_{self.selection_rule}"
+        #     spec_name = f"{self.mapping_name}_{self.mapping_periods_name}_{formatted_start_date}_{formatted_end_date}_{self.y_var_short_name}_{self.umidas_model_lags}lags_{self.varselection_method}_a{alpha_str}_qw{self.window_quarters}_{self.selection_rule}"
         #     if self.selection_rule == "cv_se":
-        #         self.spec_name += f"{self.se_factor}"
+        #         spec_name += f"{self.se_factor}"
         #     if self.coef_tol > 0:
-        #         self.spec_name += f"_ct{self.coef_tol}"
+        #         spec_name += f"_ct{self.coef_tol}"
         #     if self.selection_rule == "pt":
-        #         self.spec_name += f"_td{self.threshold_divisor}"
+        #         spec_name += f"_td{self.threshold_divisor}"
         #     if self.no_lags:
-        #         self.spec_name += f"_{self.no_lags}"
+        #         spec_name += f"_{self.no_lags}"
         #     if self.selection_rule == "k_ic":
-        #         self.spec_name += f"{self.k_indicators}"
-
-        self.file_path_output = f"{file_path}/output/mlumidas/{self.spec_name}"
-        self.file_path_results = f"{file_path}/output/results/{self.spec_name}"
-        self.file_path_results_dfs = f"{file_path}/output/results/{self.spec_name}/dfs"
-
-        logger.add(f"{self.file_path_output}/log_{self.spec_name}.txt", rotation="10 MB")
-
-        self.results_dict = {}
-        self.oof_plots = {}
-        self.oof_all_periods_plots = {}
-        self.oof_single_quarter_plots = {}
-        self.selected_vars_quarters_df_dict = {}
-        self.selected_vars_quarters_periods_df_dict = {}
+        #         spec_name += f"{self.k_indicators}"
+
+        return spec_name, spec_name_short
+
+    def _nowdata_stage_inputs(self) -> Dict[str, Any]:
+        """Everything the nowdata stage output depends on; its fingerprint keys the stage cache."""
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return {
+            "mapping_name": self.mapping_name,
+            "mapping_module": file_digest(os.path.join(repo_root, "mappings", f"{self.mapping_name}.py")),
+            "mapping_object": file_digest(f"{self.file_path}/dataset/obj_nowdata/{self.mapping_name}.pkl"),
+            "code": sources_digest(repo_root, NOWDATA_SOURCES),
+            "mapping_periods_name": self.mapping_periods_name,
+            "mapping_periods": period_mappings.get(self.mapping_periods_name),
+            "impute": self.impute,
+            "impute_method": self.impute_method,
+            "transform_all": self.transform_all,
+            "confidence": self.confidence,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "dropvarlist": self.dropvarlist,
+            "umidas_model_lags": self.umidas_model_lags,
+            "y_var": self.y_var,
+            "y_var_lags": self.y_var_lags,
+            "nowcast_start": self.nowcast_start,
+            "no_lags": self.no_lags,
+        }
 
     def _stage_nowdata(self) -> None:
         if self._done["nowdata"]:
@@ -257,7 +341,7 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         explicit_run = stage in self.pipelines_to_run
 
         if not explicit_run:
-            cached = self._load_stage_cache(stage)
+            cached = self._load_stage_cache(stage, self._nowdata_stage_inputs())
             if cached is not None:
                 # Restore pipeline instance AND its outputs
                 self.pipeNOWData = cached.get("pipeNOWData")
@@ -291,7 +375,11 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
             umidas_model_lags=self.umidas_model_lags,
             y_var=self.y_var,
             y_var_lags=self.y_var_lags,
-            nowcast_start=self.nowcast_start
+            nowcast_start=self.nowcast_start,
+            stat_n_jobs=self.stat_n_jobs,
+            step_memo=self.nowdata_step_memo,
+            step_memo_max_gb=self.nowdata_step_memo_max_gb,
+            step_memo_refresh=explicit_run,
         )
         self._run_stage_obj(self.pipeNOWData)
 
@@ -304,7 +392,7 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         self.meta_df = getattr(self.pipeNOWData, "meta_df", None)
         self.fwr_idx_dict = getattr(self.pipeNOWData, "fwr_idx_dict", None)
 
-        # Cache the instance + outputs
+        # Cache the instance + outputs (inputs re-read: the run may have created the mapping object)
         self._save_stage_cache(stage, {
             "pipeNOWData": self.pipeNOWData,  # cache the instance itself
             "release_periods_dict": self.release_periods_dict,
@@ -313,7 +401,7 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
             "release_latest_block_dict": self.release_latest_block_dict,
             "meta": self.meta,
             "fwr_idx_dict": self.fwr_idx_dict,
-        })
+        }, self._nowdata_stage_inputs())
         self._done["nowdata"] = True
 
     def _stage_varselect(self) -> None:
@@ -329,7 +417,7 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
                 "VarSelect stage requires `varselection_method` to be provided."
             )
 
-        # ALWAYS RUN, NO CACHING
+        # ALWAYS RUN, NO STAGE CACHING (selector fits are memoized by content, see varselect_memo)
         self.pipeMLUMidas = MLUMidasPipeline(
             file_path=self.file_path,
             varselection_method=self.varselection_method,
@@ -372,7 +460,18 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
             group_type=self.group_type,
             quarter_plots=self.quarter_plots,
 
-            run_cache_only=self.run_cache_only
+            run_cache_only=self.run_cache_only,
+            umidas_engine=self.umidas_engine,
+            cache_n_jobs=self.cache_n_jobs,
+            rolling_window_quarters=self.rolling_window_quarters,
+            cache_checkpoint_every=self.cache_checkpoint_every,
+            cache_checkpoint_seconds=self.cache_checkpoint_seconds,
+            varselect_warm_start=self.varselect_warm_start,
+            varselect_n_jobs=self.varselect_n_jobs,
+            spec_names=self.spec_names,
+            varselect_memo=self.varselect_memo,
+            varselect_screening=self.varselect_screening,
+            varselect_cv_mode=self.varselect_cv_mode,
         )
         self._run_stage_obj(self.pipeMLUMidas)
 
@@ -390,65 +489,77 @@ class NOWMLUPipeline(CachingMixin, SavingMixin, SummaryMixin):
         """
         Single-pass orchestration:
         - 'nowdata' uses cache (and stores/restores the pipeline instance too).
-        - 'varselect' and 'model' ALWAYS RUN and are never cached.
+        - 'varselect' and 'model' ALWAYS RUN and are never cached as a stage (selector fits are memoized).
         - Each stage guarded to run at most once in this process.
         """
         self._stage_nowdata()
         self._stage_varselect()
         
         if not self.run_cache_only:
-            self.get_spec_summary(
-                results_dict=self.results_dict,
-                spec_name=self.spec_name,
-                mapping_periods_name=self.mapping_periods_name,
-                mapping_name=self.mapping_name,
-                impute=self.impute,
-                impute_method=self.impute_method,
-                transform_all=self.transform_all,
-                confidence=self.confidence,
-                start_date=self.start_date,
-                end_date=self.end_date,
-                dropvarlist=self.dropvarlist,
-                no_lags=self.no_lags,
-                umidas_model_lags=self.umidas_model_lags,
-                y_var=self.y_var,
-                y_var_lags=self.y_var_lags,
-                y_var_short_name=self.y_var_short_name,
-                nowcast_start=self.nowcast_start,
-                varselection_method=self.varselection_method,
-                alpha=self.alpha,
-                tcv_splits=self.tcv_splits,
-                test_size=self.test_size,
-                gap=self.gap,
-                max_train_size=self.max_train_size,
-                cv=self.cv,
-                alphas=self.alphas,
-                max_iter=self.max_iter,
-                random_state=self.random_state,
-                with_mean=self.with_mean,
-                with_std=self.with_std,
-                fit_intercept=self.fit_intercept,
-                coef_tol=self.coef_tol,
-                selection_rule=self.selection_rule,
-                se_factor=self.se_factor,
-                threshold_divisor=self.threshold_divisor,
-                output_path=self.file_path_output, 
-                window_quarters=self.window_quarters,
-            )
+            if self.l1_ratios is not None:
+                for ratio in self.l1_ratios:
+                    self._save_spec_outputs(self.results_dict[ratio], ratio, self.spec_names[ratio], self.spec_names_short[ratio])
+            else:
+                self._save_spec_outputs(self.results_dict, self.alpha, self.spec_name, self.spec_name_short)
+
+    def _save_spec_outputs(self, results_dict, alpha, spec_name, spec_name_short) -> None:
+        """Summary + saved results of ONE spec (one per l1_ratio when alpha is a list)."""
+        file_path_output = f"{self.file_path}/output/mlumidas/{spec_name}"
+        file_path_results = f"{self.file_path}/output/results/{spec_name}"
+        file_path_results_dfs = f"{self.file_path}/output/results/{spec_name}/dfs"
+
+        self.get_spec_summary(
+            results_dict=results_dict,
+            spec_name=spec_name,
+            mapping_periods_name=self.mapping_periods_name,
+            mapping_name=self.mapping_name,
+            impute=self.impute,
+            impute_method=self.impute_method,
+            transform_all=self.transform_all,
+            confidence=self.confidence,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            dropvarlist=self.dropvarlist,
+            no_lags=self.no_lags,
+            umidas_model_lags=self.umidas_model_lags,
+            y_var=self.y_var,
+            y_var_lags=self.y_var_lags,
+            y_var_short_name=self.y_var_short_name,
+            nowcast_start=self.nowcast_start,
+            varselection_method=self.varselection_method,
+            alpha=alpha,
+            tcv_splits=self.tcv_splits,
+            test_size=self.test_size,
+            gap=self.gap,
+            max_train_size=self.max_train_size,
+            cv=self.cv,
+            alphas=self.alphas,
+            max_iter=self.max_iter,
+            random_state=self.random_state,
+            with_mean=self.with_mean,
+            with_std=self.with_std,
+            fit_intercept=self.fit_intercept,
+            coef_tol=self.coef_tol,
+            selection_rule=self.selection_rule,
+            se_factor=self.se_factor,
+            threshold_divisor=self.threshold_divisor,
+            output_path=file_path_output, 
+            window_quarters=self.window_quarters,
+        )
+
+        _save_xlsx(self.meta_df, file_path_results, f"MetaData_{spec_name_short}")
+                
+        weights = ["periods_mseweight", "periods_avg"]
+        for weight in weights:
+            model_results = results_dict["model"][weight]["selected"]["bic"]
+            for period in model_results.keys():
+                period_model_results = model_results[period]
+                _save_xlsx(period_model_results, file_path_results_dfs, f"df_{period}_{weight}_{spec_name_short}")
+
+        _save_object(self.meta_df, file_path_results, f"meta_df_{spec_name}.pkl")
+        _save_object(self.full_sample_df, file_path_results, f"full_sample_df_{spec_name}.pkl")
+        _save_object(self.release_periods_dict, file_path_results, f"release_periods_dict_{spec_name}.pkl")
+        _save_object(results_dict, file_path_results, f"results_dict_{spec_name}.pkl")
 
-            _save_xlsx(self.meta_df, self.file_path_results, f"MetaData_{self.spec_name_short}")
-                    
-            weights = ["periods_mseweight", "periods_avg"]
-            for weight in weights:
-                model_results = self.results_dict["model"][weight]["selected"]["bic"]
-                for period in model_results.keys():
-                    period_model_results = model_results[period]
-                    _save_xlsx(period_model_results, self.file_path_results_dfs, f"df_{period}_{weight}_{self.spec_name_short}")
-
-            _save_object(self.meta_df, self.file_path_results, f"meta_df_{self.spec_name}.pkl")
-            _save_object(self.full_sample_df, self.file_path_results, f"full_sample_df_{self.spec_name}.pkl")
-            _save_object(self.release_periods_dict, self.file_path_results, f"release_periods_dict_{self.spec_name}.pkl")
-            _save_object(self.results_dict, self.file_path_results, f"results_dict_{self.spec_name}.pkl")
-    
     def run(self) -> None:
         self.process_mapping()
@@ -21,6 +21,9 @@ mapping_periods_name = "3p_v2" # 2p_v0, 6p_v0, 4p_v0 4p_v1 2p_v1
 y_var_short_name = "GDP"
 run_cache_only = True # <---------------- runs only the cache computation
 nowcast_start = pd.Timestamp("2018-03-31") # <----- 4 quarteres before the first nowcast date to get the window
+cache_n_jobs = -1 # <---------------- worker processes for the cache build (-1 = all cores, 1 = serial)
+stat_n_jobs = 1 # <------------------ worker processes for the nowdata stationarity search (-1 = all cores, 1 = serial)
+umidas_engine = "numpy" # <----------- UMIDAS spec search: "numpy", "recursive" (X'X carried across quarters) or "statsmodels"
 
 
 
@@ -137,6 +140,9 @@ pipeNOWMLUMidas = NOWMLUPipeline(
     lambda_fix=lambda_fix,
 
     run_cache_only=run_cache_only,
+    cache_n_jobs=cache_n_jobs,
+    stat_n_jobs=stat_n_jobs,
+    umidas_engine=umidas_engine,
 )
 
 pipeNOWMLUMidas.run()
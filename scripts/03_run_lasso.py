@@ -24,7 +24,7 @@ y_var_short_name = "GDP"
 nowcast_start = pd.Timestamp("2019-03-31")
 no_lags = "nl_nc" # "nl_nc", "nl_c", "l_c" 
 varselection_method = "pyentscv" # "pyen" pyentscv pyadal no_selection
-alpha = 1 
+alpha = 1 # or a list, e.g. [1, 0.2, 0.5, 0.8]: LASSO + elastic nets in one selection pass on shared folds
 lambda_calc_q2_2020 =  0.476 
 
 run_cache_only = False
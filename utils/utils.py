@@ -2,6 +2,8 @@
 
 import time
 import functools
+import hashlib
+from pathlib import Path
 import pandas as pd
 
 #%%
@@ -24,5 +26,23 @@ def get_formatted_date(date: pd.Timestamp):
 def get_formatted_date_spec(date: pd.Timestamp):
     return f"{date.year}Q{date.quarter}"
 
+def file_digest(path):
+    """sha256 of a file's content (streamed), or None if it does not exist."""
+    path = Path(path)
+    if not path.is_file():
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def sources_digest(root, patterns):
+    """{path relative to root: sha256} of the files matching the glob `patterns` under `root`, sorted."""
+    root = Path(root)
+    paths = sorted({path for pattern in patterns for path in root.glob(pattern) if path.is_file()})
+    return {path.relative_to(root).as_posix(): file_digest(path) for path in paths}
+
 
 